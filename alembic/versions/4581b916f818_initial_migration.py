@@ -5,14 +5,14 @@ Revises:
 Create Date: 2025-08-09 13:18:30.879945
 
 """
+
 from typing import Sequence, Union
 
-from alembic import op
 import sqlalchemy as sa
-
+from alembic import op
 
 # revision identifiers, used by Alembic.
-revision: str = '4581b916f818'
+revision: str = "4581b916f818"
 down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
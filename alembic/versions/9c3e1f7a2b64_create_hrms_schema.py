@@ -0,0 +1,282 @@
+"""Create HRMS schema
+
+Revision ID: 9c3e1f7a2b64
+Revises: 4581b916f818
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "9c3e1f7a2b64"
+down_revision: Union[str, None] = "4581b916f818"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _lookup_table(name: str, name_column: str, length: int) -> None:
+    op.create_table(
+        name,
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(name_column, sa.String(length=length), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f(f"pk_{name}")),
+        sa.UniqueConstraint(name_column, name=op.f(f"uq_{name}_{name_column}")),
+    )
+
+
+def upgrade() -> None:
+    # btree_gist lets the leaves exclusion constraint compare employee_id with =.
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    op.create_table(
+        "company_units",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("unit_name", sa.String(length=255), nullable=False),
+        sa.Column("address", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_company_units")),
+        sa.UniqueConstraint("unit_name", name=op.f("uq_company_units_unit_name")),
+    )
+    _lookup_table("departments", "name", 255)
+    _lookup_table("designations", "title", 255)
+    _lookup_table("job_types", "type_name", 100)
+    _lookup_table("leave_types", "name", 100)
+
+    op.create_table(
+        "leave_policies",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("policy_name", sa.String(length=150), nullable=False),
+        sa.Column("details", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_leave_policies")),
+        sa.UniqueConstraint("policy_name", name=op.f("uq_leave_policies_policy_name")),
+    )
+
+    op.create_table(
+        "employees",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("employee_id", sa.String(length=50), nullable=False),
+        sa.Column("first_name", sa.String(length=100), nullable=False),
+        sa.Column("last_name", sa.String(length=100), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("phone", sa.String(length=20), nullable=True),
+        sa.Column("profile_image_url", sa.String(length=512), nullable=True),
+        sa.Column("department_id", sa.Integer(), nullable=True),
+        sa.Column("designation_id", sa.Integer(), nullable=True),
+        sa.Column("manager_id", sa.Integer(), nullable=True),
+        sa.Column("joining_date", sa.Date(), nullable=False),
+        sa.Column("probation_period", sa.String(length=50), nullable=True),
+        sa.Column("work_location_id", sa.Integer(), nullable=True),
+        sa.Column("job_type_id", sa.Integer(), nullable=True),
+        sa.Column("shift_timing", sa.String(length=100), nullable=True),
+        sa.Column("weekly_hours", sa.Numeric(precision=5, scale=2), nullable=True),
+        sa.Column("annual_leave_total", sa.Integer(), nullable=True),
+        sa.Column("sick_leave_total", sa.Integer(), nullable=True),
+        sa.Column("casual_leave_total", sa.Integer(), nullable=True),
+        sa.Column("leave_policy_id", sa.Integer(), nullable=True),
+        sa.Column("date_of_birth", sa.Date(), nullable=True),
+        sa.Column("gender", sa.String(length=20), nullable=True),
+        sa.Column("marital_status", sa.String(length=20), nullable=True),
+        sa.Column("address", sa.Text(), nullable=True),
+        sa.Column("city", sa.String(length=100), nullable=True),
+        sa.Column("state", sa.String(length=100), nullable=True),
+        sa.Column("zip_code", sa.String(length=20), nullable=True),
+        sa.Column("emergency_contact_name", sa.String(length=200), nullable=True),
+        sa.Column("emergency_contact_phone", sa.String(length=20), nullable=True),
+        sa.Column("salary", sa.Numeric(precision=12, scale=2), nullable=True),
+        sa.Column("currency", sa.String(length=10), nullable=True),
+        sa.Column("pay_frequency", sa.String(length=50), nullable=True),
+        sa.Column("bank_account", sa.String(length=100), nullable=True),
+        sa.Column("bank_name", sa.String(length=100), nullable=True),
+        sa.Column("tax_id", sa.String(length=100), nullable=True),
+        sa.Column("benefits", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["department_id"],
+            ["departments.id"],
+            name=op.f("fk_employees_department_id_departments"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["designation_id"],
+            ["designations.id"],
+            name=op.f("fk_employees_designation_id_designations"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["manager_id"],
+            ["employees.id"],
+            name=op.f("fk_employees_manager_id_employees"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["work_location_id"],
+            ["company_units.id"],
+            name=op.f("fk_employees_work_location_id_company_units"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["job_type_id"],
+            ["job_types.id"],
+            name=op.f("fk_employees_job_type_id_job_types"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["leave_policy_id"],
+            ["leave_policies.id"],
+            name=op.f("fk_employees_leave_policy_id_leave_policies"),
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_employees")),
+        sa.UniqueConstraint("employee_id", name=op.f("uq_employees_employee_id")),
+        sa.UniqueConstraint("email", name=op.f("uq_employees_email")),
+    )
+    op.create_index("ix_employees_manager_id", "employees", ["manager_id"])
+    op.create_index(
+        "ix_employees_department_id_id", "employees", ["department_id", "id"]
+    )
+    op.create_index(
+        "ix_employees_designation_id_id", "employees", ["designation_id", "id"]
+    )
+    op.create_index(
+        "ix_employees_work_location_id_id", "employees", ["work_location_id", "id"]
+    )
+
+    op.create_table(
+        "leaves",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("employee_id", sa.Integer(), nullable=False),
+        sa.Column("leave_type", sa.String(length=50), nullable=True),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("end_date", sa.Date(), nullable=False),
+        sa.Column("reason", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(length=50), nullable=True),
+        sa.Column("approved_by_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["employee_id"],
+            ["employees.id"],
+            name=op.f("fk_leaves_employee_id_employees"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["approved_by_id"],
+            ["employees.id"],
+            name=op.f("fk_leaves_approved_by_id_employees"),
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_leaves")),
+    )
+    op.execute(
+        "ALTER TABLE leaves ADD CONSTRAINT ex_leaves_employee_period "
+        "EXCLUDE USING gist "
+        "(employee_id WITH =, daterange(start_date, end_date, '[]') WITH &&) "
+        "WHERE (status IN ('Pending', 'Approved'))"
+    )
+    op.create_index(
+        "ix_leaves_employee_id_start_date", "leaves", ["employee_id", "start_date"]
+    )
+    op.create_index("ix_leaves_status_id", "leaves", ["status", "id"])
+
+    op.create_table(
+        "attendance",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("employee_id", sa.Integer(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("check_in", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("check_out", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("status", sa.String(length=50), nullable=True),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["employee_id"],
+            ["employees.id"],
+            name=op.f("fk_attendance_employee_id_employees"),
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_attendance")),
+        sa.UniqueConstraint("employee_id", "date", name="uq_employee_date"),
+    )
+    op.create_index(
+        "ix_attendance_date_employee_id", "attendance", ["date", "employee_id"]
+    )
+
+    op.create_table(
+        "leave_balances",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("employee_id", sa.Integer(), nullable=False),
+        sa.Column("leave_type_id", sa.Integer(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("allocated", sa.Integer(), nullable=False),
+        sa.Column("used", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["employee_id"],
+            ["employees.id"],
+            name=op.f("fk_leave_balances_employee_id_employees"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["leave_type_id"],
+            ["leave_types.id"],
+            name=op.f("fk_leave_balances_leave_type_id_leave_types"),
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_leave_balances")),
+        sa.UniqueConstraint(
+            "employee_id",
+            "leave_type_id",
+            "year",
+            name="uq_leave_balance_employee_type_year",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("leave_balances")
+    op.drop_table("attendance")
+    op.drop_table("leaves")
+    op.drop_table("employees")
+    op.drop_table("leave_policies")
+    op.drop_table("leave_types")
+    op.drop_table("job_types")
+    op.drop_table("designations")
+    op.drop_table("departments")
+    op.drop_table("company_units")
@@ -0,0 +1,85 @@
+"""Create change log
+
+Revision ID: a8c3e5f1d2b9
+Revises: f2c6a8d4b1e7
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# Shared with create_all, so both install the same function and triggers.
+from app.models.change_log import (
+    RECORD_CHANGE_FUNCTION,
+    TRACKED_TABLES,
+    change_trigger_ddl,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "a8c3e5f1d2b9"
+down_revision: Union[str, None] = "f2c6a8d4b1e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows get the migration time; later writes keep it current.
+    op.add_column(
+        "leaves",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "attendance",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+    )
+
+    op.create_table(
+        "change_log",
+        sa.Column("seq", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column(
+            "txid",
+            sa.BigInteger(),
+            server_default=sa.text("pg_current_xact_id()::text::bigint"),
+            nullable=False,
+        ),
+        sa.Column("table_name", sa.String(length=63), nullable=False),
+        sa.Column("row_id", sa.Integer(), nullable=False),
+        sa.Column("operation", sa.String(length=1), nullable=False),
+        sa.Column("changes", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column(
+            "changed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("seq", name=op.f("pk_change_log")),
+    )
+    op.create_index("ix_change_log_txid_seq", "change_log", ["txid", "seq"])
+    op.create_index("ix_change_log_changed_at", "change_log", ["changed_at"])
+
+    op.execute(RECORD_CHANGE_FUNCTION)
+    for table in TRACKED_TABLES:
+        op.execute(change_trigger_ddl(table))
+
+
+def downgrade() -> None:
+    for table in TRACKED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_record_change ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS record_change()")
+    op.drop_table("change_log")
+    op.drop_column("attendance", "updated_at")
+    op.drop_column("leaves", "updated_at")
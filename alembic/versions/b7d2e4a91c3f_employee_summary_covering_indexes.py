@@ -0,0 +1,73 @@
+"""Employee summary covering indexes
+
+Revision ID: b7d2e4a91c3f
+Revises: 9c3e1f7a2b64
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d2e4a91c3f"
+down_revision: Union[str, None] = "9c3e1f7a2b64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SUMMARY_INCLUDE = [
+    "employee_id",
+    "first_name",
+    "last_name",
+    "email",
+    "department_id",
+    "designation_id",
+    "is_active",
+]
+
+
+def upgrade() -> None:
+    # Built concurrently so a populated employees table stays writable.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_employees_summary",
+            "employees",
+            ["id"],
+            postgresql_include=SUMMARY_INCLUDE,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_employees_department_id_id_summary",
+            "employees",
+            ["department_id", "id"],
+            postgresql_include=[
+                name for name in SUMMARY_INCLUDE if name != "department_id"
+            ],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_employees_department_id_id", "employees", postgresql_concurrently=True
+        )
+        op.execute(
+            "ALTER INDEX ix_employees_department_id_id_summary "
+            "RENAME TO ix_employees_department_id_id"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_employees_summary", "employees", postgresql_concurrently=True)
+        op.create_index(
+            "ix_employees_department_id_id_plain",
+            "employees",
+            ["department_id", "id"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_employees_department_id_id", "employees", postgresql_concurrently=True
+        )
+        op.execute(
+            "ALTER INDEX ix_employees_department_id_id_plain "
+            "RENAME TO ix_employees_department_id_id"
+        )
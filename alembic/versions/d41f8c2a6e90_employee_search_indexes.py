@@ -0,0 +1,45 @@
+"""Employee search indexes
+
+Revision ID: d41f8c2a6e90
+Revises: b7d2e4a91c3f
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d41f8c2a6e90"
+down_revision: Union[str, None] = "b7d2e4a91c3f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_employees_search_trgm "
+            "ON employees USING gin (lower("
+            "first_name || ' ' || last_name || ' ' || email || ' ' || employee_id"
+            ") gin_trgm_ops)"
+        )
+        op.create_index(
+            "ix_employees_updated_at",
+            "employees",
+            ["updated_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_employees_updated_at", "employees", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_employees_search_trgm", "employees", postgresql_concurrently=True
+        )
@@ -0,0 +1,124 @@
+"""Partition attendance by month
+
+Revision ID: f2c6a8d4b1e7
+Revises: e5a9c07b3d18
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Any, Dict, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c6a8d4b1e7"
+down_revision: Union[str, None] = "e5a9c07b3d18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# One partition per month from the oldest attendance row (or this month)
+# through three months ahead.
+CREATE_PARTITIONS = """
+DO $$
+DECLARE partition_month date;
+BEGIN
+    FOR partition_month IN SELECT generate_series(
+        date_trunc(
+            'month',
+            coalesce((SELECT min(date) FROM attendance_legacy), current_date)
+        ),
+        date_trunc(
+            'month',
+            greatest(
+                coalesce((SELECT max(date) FROM attendance_legacy), current_date),
+                current_date
+            )
+        ) + interval '3 months',
+        interval '1 month'
+    )::date LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF attendance '
+            || 'FOR VALUES FROM (%L) TO (%L)',
+            'attendance_p' || to_char(partition_month, 'YYYYMM'),
+            partition_month,
+            (partition_month + interval '1 month')::date
+        );
+    END LOOP;
+END $$
+"""
+
+
+def _rename_legacy(table: str, legacy: str) -> None:
+    op.rename_table(table, legacy)
+    op.execute(f"ALTER SEQUENCE {table}_id_seq RENAME TO {legacy}_id_seq")
+    op.execute(f"ALTER TABLE {legacy} RENAME CONSTRAINT pk_{table} TO pk_{legacy}")
+    op.execute(
+        f"ALTER TABLE {legacy} "
+        "RENAME CONSTRAINT uq_employee_date TO uq_employee_date_legacy"
+    )
+    op.execute(
+        "ALTER INDEX ix_attendance_date_employee_id "
+        f"RENAME TO ix_{legacy}_date_employee_id"
+    )
+
+
+def _create_attendance(partitioned: bool) -> None:
+    options: Dict[str, Any] = (
+        {"postgresql_partition_by": "RANGE (date)"} if partitioned else {}
+    )
+    op.create_table(
+        "attendance",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("employee_id", sa.Integer(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("check_in", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("check_out", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("status", sa.String(length=50), nullable=True),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["employee_id"],
+            ["employees.id"],
+            name=op.f("fk_attendance_employee_id_employees"),
+        ),
+        sa.PrimaryKeyConstraint(
+            *(("id", "date") if partitioned else ("id",)), name=op.f("pk_attendance")
+        ),
+        sa.UniqueConstraint("employee_id", "date", name="uq_employee_date"),
+        **options,
+    )
+    op.create_index(
+        "ix_attendance_date_employee_id", "attendance", ["date", "employee_id"]
+    )
+
+
+def _copy_from_legacy() -> None:
+    op.execute(
+        "INSERT INTO attendance "
+        "(id, employee_id, date, check_in, check_out, status, notes) "
+        "SELECT id, employee_id, date, check_in, check_out, status, notes "
+        "FROM attendance_legacy"
+    )
+    op.execute(
+        "SELECT setval('attendance_id_seq', "
+        "coalesce((SELECT max(id) FROM attendance), 0) + 1, false)"
+    )
+    op.drop_table("attendance_legacy")
+
+
+def upgrade() -> None:
+    # Writers must not add rows between the copy and the drop.
+    op.execute("LOCK TABLE attendance IN EXCLUSIVE MODE")
+    _rename_legacy("attendance", "attendance_legacy")
+    _create_attendance(partitioned=True)
+    op.execute(CREATE_PARTITIONS)
+    _copy_from_legacy()
+
+
+def downgrade() -> None:
+    # Only attached partitions are copied back; archived ones stay in the
+    # archive schema.
+    op.execute("LOCK TABLE attendance IN EXCLUSIVE MODE")
+    _rename_legacy("attendance", "attendance_legacy")
+    _create_attendance(partitioned=False)
+    _copy_from_legacy()
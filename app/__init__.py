@@ -1 +1 @@
-# FastAPI Application 
\ No newline at end of file
+# FastAPI Application
@@ -1,3 +1,113 @@
-from fastapi import APIRouter
+from datetime import date
+from typing import Optional
 
-router = APIRouter()
\ No newline at end of file
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_read_db_session
+from app.core.process_pool import PoolBusyError, report_pool
+from app.core.response import error, success
+from app.schemas.attendance import AttendanceEventBatch
+from app.services.attendance_export import EXPORT_FORMATS, export_attendance
+from app.services.attendance_ingest import (
+    attendance_batcher,
+    event_date_window,
+    events_outside_window,
+)
+from app.services.attendance_report import (
+    compute_monthly_metrics,
+    fetch_monthly_inputs,
+    stream_monthly_csv,
+)
+
+router = APIRouter()
+
+
+@router.get("/export")
+async def export_attendance_records(
+    start_date: date,
+    end_date: date,
+    format: str = Query("csv", description="csv or ndjson"),
+    employee_id: Optional[int] = None,
+) -> Response:
+    """Stream attendance records for a date range as CSV or NDJSON."""
+    if format not in EXPORT_FORMATS:
+        return error(
+            f"Unsupported export format, expected one of: {', '.join(EXPORT_FORMATS)}",
+            status_code=422,
+        )
+    if end_date < start_date:
+        return error("end_date must not be before start_date", status_code=422)
+
+    filename = f"attendance_{start_date.isoformat()}_{end_date.isoformat()}.{format}"
+    return StreamingResponse(
+        export_attendance(start_date, end_date, format, employee_id),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post("/batch")
+async def ingest_attendance_batch(batch: AttendanceEventBatch) -> Response:
+    """Record a batch of check-in/check-out events from badge readers."""
+    earliest, latest = event_date_window()
+    out_of_window = events_outside_window(batch.events, earliest, latest)
+    if out_of_window:
+        return error(
+            f"Events must be dated between {earliest.isoformat()} "
+            f"and {latest.isoformat()}",
+            status_code=422,
+            data={"indexes": out_of_window},
+        )
+    result = await attendance_batcher.submit(batch.events)
+    rejected = [
+        index
+        for index, event in enumerate(batch.events)
+        if event.employee_id in result.unknown_employee_ids
+    ]
+    return success(
+        data={
+            "accepted": len(batch.events) - len(rejected),
+            "rejected": [
+                {"index": index, "error": "Unknown employee"} for index in rejected
+            ],
+        },
+        message="Attendance events recorded",
+    )
+
+
+@router.get("/reports/monthly")
+async def get_monthly_attendance_report(
+    year: int = Query(..., ge=2000, le=2100),
+    month: int = Query(..., ge=1, le=12),
+    department_id: Optional[int] = None,
+    format: str = Query("json", description="json or csv (streamed)"),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    """Per-employee attendance, lateness, overtime and absence for a month.
+
+    Metrics are computed in the report process pool so large departments do
+    not block other requests on this worker.
+    """
+    if format not in ("json", "csv"):
+        return error(
+            "Unsupported report format, expected one of: json, csv", status_code=422
+        )
+    try:
+        report_pool.admit()
+    except PoolBusyError as e:
+        response = error(str(e), status_code=503)
+        response.headers["Retry-After"] = "5"
+        return response
+
+    inputs = await fetch_monthly_inputs(session, year, month, department_id)
+    if format == "csv":
+        filename = f"attendance_report_{year}_{month:02d}.csv"
+        return StreamingResponse(
+            stream_monthly_csv(inputs),
+            media_type="text/csv",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+    report = await report_pool.run(compute_monthly_metrics, inputs)
+    return success(data=report)
@@ -0,0 +1,92 @@
+from typing import AsyncIterator, List, Optional
+
+from fastapi import APIRouter, Header, Query, Response
+from fastapi.responses import StreamingResponse
+
+from app.core.metrics import query_budget
+from app.core.response import dumps, error, success
+from app.core.settings import settings
+from app.services.change_feed import (
+    change_notifier,
+    parse_cursor,
+    read_changes,
+    validate_tables,
+    wait_for_changes,
+)
+
+router = APIRouter()
+
+
+@router.get("")
+@query_budget(0)  # long polls re-query on every wake-up
+async def list_changes(
+    since: Optional[str] = Query(
+        None,
+        description=(
+            "Cursor from a previous response; omit to start from the oldest change"
+        ),
+    ),
+    limit: int = Query(500, ge=1, le=5000),
+    tables: Optional[str] = Query(
+        None, description="Comma-separated subset of employees, leaves, attendance"
+    ),
+    wait: float = Query(
+        0,
+        ge=0,
+        description="Seconds to wait for changes when there are none (long poll)",
+    ),
+) -> Response:
+    """Inserts, updates and deletes since a cursor, oldest first."""
+    try:
+        parse_cursor(since)
+        table_names = validate_tables(tables)
+    except ValueError as e:
+        return error(str(e), status_code=422)
+    page = await wait_for_changes(
+        since, limit, table_names, min(wait, settings.change_feed_max_wait_seconds)
+    )
+    return success(data=page)
+
+
+async def _event_stream(
+    cursor: Optional[str], tables: Optional[List[str]]
+) -> AsyncIterator[bytes]:
+    while True:
+        page = await read_changes(
+            cursor, settings.change_feed_stream_batch_size, tables
+        )
+        for change in page["items"]:
+            yield b"event: change\ndata: " + dumps(change) + b"\n\n"
+        if page["items"]:
+            # The cursor is sent once per batch; clients resume with Last-Event-ID.
+            cursor = page["next_cursor"]
+            yield f"id: {cursor}\n\n".encode()
+        if page["has_more"]:
+            continue
+        if not await change_notifier.wait(settings.change_feed_keepalive_seconds):
+            yield b": keepalive\n\n"
+
+
+@router.get("/stream")
+@query_budget(0)  # one query per batch for as long as the client stays connected
+async def stream_changes(
+    since: Optional[str] = Query(
+        None, description="Cursor to start after; Last-Event-ID takes precedence"
+    ),
+    tables: Optional[str] = Query(
+        None, description="Comma-separated subset of employees, leaves, attendance"
+    ),
+    last_event_id: Optional[str] = Header(None),
+) -> Response:
+    """Server-Sent Events stream of changes, resumable with Last-Event-ID."""
+    cursor = last_event_id or since
+    try:
+        parse_cursor(cursor)
+        table_names = validate_tables(tables)
+    except ValueError as e:
+        return error(str(e), status_code=422)
+    return StreamingResponse(
+        _event_stream(cursor, table_names),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,11 @@
+from app import schemas
+from app.api.lookup_crud import employees_assigned, lookup_router
+from app.models import Employee
+
+router = lookup_router(
+    "company_units",
+    "Company unit",
+    schemas.CompanyUnitCreate,
+    schemas.CompanyUnit,
+    in_use=employees_assigned(Employee.work_location_id),
+)
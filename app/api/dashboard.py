@@ -0,0 +1,47 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_read_db_session
+from app.core.response import error, success
+from app.services.dashboard import get_manager_dashboard
+
+router = APIRouter()
+
+# Roles in X-Role that may open a manager dashboard; HR and admins may also
+# open another manager's.
+#
+# Placeholder until the API has authentication: X-Employee-Id and X-Role are
+# taken from the request as sent, so any client can claim any identity or
+# role. Deployments must set them from an authenticating gateway that strips
+# client-supplied copies.
+MANAGER_ROLES = {"manager", "hr", "admin"}
+ORG_WIDE_ROLES = {"hr", "admin"}
+
+
+@router.get("/manager")
+async def get_manager_dashboard_summary(
+    manager_id: Optional[int] = Query(
+        None, description="Another manager's dashboard (HR/admin only)"
+    ),
+    x_employee_id: Optional[int] = Header(None),
+    x_role: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    """Team headcount, today's present/absent/late counts and pending approvals."""
+    if x_employee_id is None or not x_role:
+        return error("X-Employee-Id and X-Role headers are required", status_code=401)
+    role = x_role.lower()
+    if role not in MANAGER_ROLES:
+        return error(
+            "Only managers, HR and admins can view the dashboard", status_code=403
+        )
+    if (
+        manager_id is not None
+        and manager_id != x_employee_id
+        and role not in ORG_WIDE_ROLES
+    ):
+        return error("Managers can only view their own team", status_code=403)
+    dashboard = await get_manager_dashboard(session, manager_id or x_employee_id)
+    return success(data=dashboard)
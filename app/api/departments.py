@@ -1,3 +1,11 @@
-from fastapi import APIRouter
+from app import schemas
+from app.api.lookup_crud import employees_assigned, lookup_router
+from app.models import Employee
 
-router = APIRouter()
\ No newline at end of file
+router = lookup_router(
+    "departments",
+    "Department",
+    schemas.DepartmentCreate,
+    schemas.Department,
+    in_use=employees_assigned(Employee.department_id),
+)
@@ -1,3 +1,258 @@
-from fastapi import APIRouter
+import io
+from typing import List, Optional
 
-router = APIRouter()
\ No newline at end of file
+from fastapi import APIRouter, Depends, File, Query, Response, UploadFile
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db_session, get_read_db_session
+from app.core.response import error, success
+from app.models import Employee
+from app.models.employee import SUMMARY_FIELDS
+from app.services.employee_import import (
+    DEFAULT_CHUNK_SIZE,
+    SUPPORTED_FORMATS,
+    detect_format,
+    import_employees,
+)
+from app.services.employee_repository import LOAD_PROFILES, get_employee
+from app.services.employee_repository import list_employees as list_employee_profiles
+from app.services.employee_repository import serialize
+from app.services.employee_search import employee_search, search_employees
+from app.services.lookups import get_employee_summaries, resolve_employee_names
+from app.services.org_chart import get_headcount, get_management_chain, get_subtree
+
+router = APIRouter()
+
+EMPLOYEE_COLUMNS = Employee.__table__.c
+
+# Columns returned when the caller does not ask for a projection. Wide or
+# sensitive columns (benefits, salary, bank details) must be requested explicitly.
+DEFAULT_LIST_FIELDS = list(SUMMARY_FIELDS)
+
+# Upper bound on ids accepted by the bulk summary lookup.
+MAX_SUMMARY_IDS = 1000
+
+
+def parse_fields(fields: Optional[str]) -> List[str]:
+    """Turn a comma-separated `fields` parameter into a list of column names."""
+    if not fields:
+        return list(DEFAULT_LIST_FIELDS)
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in EMPLOYEE_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown employee fields: {', '.join(unknown)}")
+    # `id` is always selected because it is the pagination key.
+    if "id" not in requested:
+        requested.insert(0, "id")
+    return list(dict.fromkeys(requested))
+
+
+@router.get("")
+async def list_employees(
+    cursor: Optional[int] = Query(
+        None, description="Return employees with an id greater than this value"
+    ),
+    limit: int = Query(50, ge=1, le=500),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated list of columns to return"
+    ),
+    profile: Optional[str] = Query(
+        None, description=f"Load profile instead of fields: {', '.join(LOAD_PROFILES)}"
+    ),
+    department_id: Optional[int] = None,
+    designation_id: Optional[int] = None,
+    work_location_id: Optional[int] = None,
+    is_active: Optional[bool] = None,
+    resolve_names: bool = Query(
+        False,
+        description=(
+            "Add lookup names next to department/designation/location/job type ids"
+        ),
+    ),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    """List employees using keyset pagination on `id`.
+
+    Either projects plain columns (`fields`) or loads a declared load profile
+    such as `directory`, which adds department and designation names.
+    """
+    if profile is not None:
+        if fields is not None:
+            return error("Use either fields or profile, not both", status_code=422)
+        if profile not in LOAD_PROFILES:
+            return error(
+                f"Unknown load profile, expected one of: {', '.join(LOAD_PROFILES)}",
+                status_code=422,
+            )
+        # Fetch one extra row to know whether another page exists.
+        employees = await list_employee_profiles(
+            session,
+            profile,
+            department_id=department_id,
+            cursor=cursor,
+            limit=limit + 1,
+            designation_id=designation_id,
+            work_location_id=work_location_id,
+            is_active=is_active,
+        )
+        has_more = len(employees) > limit
+        employees = employees[:limit]
+        return success(
+            data={
+                "items": serialize(employees, profile),
+                "next_cursor": employees[-1].id if has_more else None,
+                "has_more": has_more,
+            }
+        )
+
+    try:
+        columns = parse_fields(fields)
+    except ValueError as e:
+        return error(str(e), status_code=422)
+
+    stmt = select(*(EMPLOYEE_COLUMNS[name] for name in columns))
+    if cursor is not None:
+        stmt = stmt.where(Employee.id > cursor)
+    if department_id is not None:
+        stmt = stmt.where(Employee.department_id == department_id)
+    if designation_id is not None:
+        stmt = stmt.where(Employee.designation_id == designation_id)
+    if work_location_id is not None:
+        stmt = stmt.where(Employee.work_location_id == work_location_id)
+    if is_active is not None:
+        stmt = stmt.where(Employee.is_active == is_active)
+    # Fetch one extra row to know whether another page exists.
+    stmt = stmt.order_by(Employee.id).limit(limit + 1)
+
+    rows = (await session.execute(stmt)).mappings().all()
+    has_more = len(rows) > limit
+    items = [dict(row) for row in rows[:limit]]
+    if resolve_names:
+        await resolve_employee_names(session, items)
+
+    return success(
+        data={
+            "items": items,
+            "next_cursor": items[-1]["id"] if has_more else None,
+            "has_more": has_more,
+        }
+    )
+
+
+@router.get("/search")
+async def search_employee_typeahead(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Name, email or employee id fragment",
+    ),
+    limit: int = Query(10, ge=1, le=50),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    """Typeahead over active employees, tolerant of prefixes and typos."""
+    results = await search_employees(session, q, limit)
+    return success(data=results)
+
+
+@router.get("/summaries")
+async def get_employee_summary_lookup(
+    ids: str = Query(..., description="Comma-separated employee ids"),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    """Bulk id -> summary lookup for screens that only hold employee ids."""
+    try:
+        employee_ids = {int(value) for value in ids.split(",") if value.strip()}
+    except ValueError:
+        return error("ids must be a comma-separated list of integers", status_code=422)
+    if len(employee_ids) > MAX_SUMMARY_IDS:
+        return error(
+            f"At most {MAX_SUMMARY_IDS} ids can be looked up at once", status_code=422
+        )
+    summaries = await get_employee_summaries(session, employee_ids)
+    return success(data=list(summaries.values()))
+
+
+@router.post("/import")
+async def import_employees_file(
+    file: UploadFile = File(..., description="CSV or JSONL file of employees"),
+    format: Optional[str] = Query(
+        None, description="csv or jsonl; inferred from the file name if omitted"
+    ),
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=5000),
+    session: AsyncSession = Depends(get_db_session),
+) -> Response:
+    """Bulk create or update employees from an uploaded file."""
+    fmt = format or detect_format(file.filename)
+    if fmt not in SUPPORTED_FORMATS:
+        return error(
+            "Unsupported import format, expected one of: "
+            f"{', '.join(SUPPORTED_FORMATS)}",
+            status_code=422,
+        )
+
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        report = await import_employees(session, stream, fmt, chunk_size)
+    finally:
+        stream.detach()
+
+    if employee_search.ready:
+        await employee_search.refresh()
+    return success(data=report.to_dict(), message="Employee import finished")
+
+
+@router.get("/{employee_id}")
+async def get_employee_detail(
+    employee_id: int,
+    profile: str = Query(
+        "profile", description=f"Load profile: {', '.join(LOAD_PROFILES)}"
+    ),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    """One employee, loaded and serialized with the requested profile."""
+    try:
+        employee = await get_employee(session, employee_id, profile)
+    except ValueError as e:
+        return error(str(e), status_code=422)
+    if employee is None:
+        return error("Employee not found", status_code=404)
+    return success(data=serialize([employee], profile)[0])
+
+
+@router.get("/{employee_id}/subtree")
+async def get_employee_subtree(
+    employee_id: int,
+    max_depth: Optional[int] = Query(
+        None, ge=1, description="Levels below the employee to include"
+    ),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    """Everyone reporting to an employee, directly or indirectly."""
+    nodes = await get_subtree(session, employee_id, max_depth)
+    if not nodes:
+        return error("Employee not found", status_code=404)
+    return success(data=nodes)
+
+
+@router.get("/{employee_id}/chain")
+async def get_employee_management_chain(
+    employee_id: int, session: AsyncSession = Depends(get_read_db_session)
+) -> Response:
+    """The employee's management chain up to the top of the organisation."""
+    chain = await get_management_chain(session, employee_id)
+    if not chain:
+        return error("Employee not found", status_code=404)
+    return success(data=chain)
+
+
+@router.get("/{employee_id}/headcount")
+async def get_employee_headcount(
+    employee_id: int, session: AsyncSession = Depends(get_read_db_session)
+) -> Response:
+    """Active headcount under an employee, in total and per direct report."""
+    headcount = await get_headcount(session, employee_id)
+    if headcount is None:
+        return error("Employee not found", status_code=404)
+    return success(data=headcount)
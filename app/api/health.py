@@ -1,9 +1,24 @@
 # app/api/health.py
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+
+from app.core.database import get_pool_status, replica_router
 from app.core.response import success
 
 router = APIRouter()
 
+
 @router.get("/health")
-async def health_check():
-    return success(data={"status": "healthy"}, message="Application is running smoothly")
+async def health_check() -> Response:
+    return success(
+        data={"status": "healthy"}, message="Application is running smoothly"
+    )
+
+
+@router.get("/health/db-pool")
+async def db_pool_status() -> Response:
+    return success(data=get_pool_status(), message="Database connection pool status")
+
+
+@router.get("/health/replicas")
+async def replica_status() -> Response:
+    return success(data=await replica_router.status(), message="Read replica lag")
@@ -0,0 +1,11 @@
+from app import schemas
+from app.api.lookup_crud import employees_assigned, lookup_router
+from app.models import Employee
+
+router = lookup_router(
+    "job_types",
+    "Job type",
+    schemas.JobTypeCreate,
+    schemas.JobType,
+    in_use=employees_assigned(Employee.job_type_id),
+)
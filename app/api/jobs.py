@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.core.database import get_db_session
+from app.core.response import error, success
+from app.services import job_handlers  # registers the job kinds
+from app.services.jobs import JOB_HANDLERS, enqueue_job, get_job
+
+router = APIRouter()
+
+
+@router.post("", status_code=202)
+async def create_job(
+    payload: schemas.BackgroundJobCreate,
+    session: AsyncSession = Depends(get_db_session),
+) -> Response:
+    """Queue batch work; poll `GET /jobs/{id}` for progress and the result."""
+    try:
+        if payload.kind == "import-employees":
+            job_handlers.resolve_import_path(payload.payload.get("path"))
+        elif payload.kind == "prune-change-log":
+            job_handlers.resolve_retention_days(payload.payload)
+    except ValueError as e:
+        return error(str(e), status_code=422)
+    try:
+        job = await enqueue_job(
+            session, payload.kind, payload.payload, payload.max_attempts
+        )
+    except ValueError as e:
+        return error(str(e), status_code=422, data={"kinds": sorted(JOB_HANDLERS)})
+    return success(
+        data=schemas.BackgroundJob.model_validate(job),
+        message="Job queued",
+        status_code=202,
+    )
+
+
+@router.get("/{job_id}")
+async def read_job(
+    job_id: int, session: AsyncSession = Depends(get_db_session)
+) -> Response:
+    job = await get_job(session, job_id)
+    if job is None:
+        return error("Job not found", status_code=404)
+    return success(data=schemas.BackgroundJob.model_validate(job))
@@ -1,3 +1,120 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-router = APIRouter()
\ No newline at end of file
+from app import schemas
+from app.core.database import get_db_session
+from app.core.response import error, success
+from app.models import Employee, LeavePolicy
+from app.services.dashboard import local_today
+from app.services.leave_policy_engine import (
+    PolicyConfigurationError,
+    invalidate_policy,
+    simulate_policy_change,
+)
+
+router = APIRouter()
+
+
+def policy_payload(policy: LeavePolicy) -> schemas.LeavePolicy:
+    return schemas.LeavePolicy.model_validate(policy)
+
+
+@router.get("")
+async def list_leave_policies(
+    session: AsyncSession = Depends(get_db_session),
+) -> Response:
+    """List all leave policies."""
+    policies = await session.scalars(select(LeavePolicy).order_by(LeavePolicy.id))
+    return success(data=[policy_payload(policy) for policy in policies])
+
+
+@router.get("/{policy_id}")
+async def get_leave_policy(
+    policy_id: int, session: AsyncSession = Depends(get_db_session)
+) -> Response:
+    """Get a single leave policy."""
+    policy = await session.get(LeavePolicy, policy_id)
+    if policy is None:
+        return error("Leave policy not found", status_code=404)
+    return success(data=policy_payload(policy))
+
+
+@router.post("", status_code=201)
+async def create_leave_policy(
+    payload: schemas.LeavePolicyCreate, session: AsyncSession = Depends(get_db_session)
+) -> Response:
+    """Create a new leave policy."""
+    policy = LeavePolicy(**payload.model_dump(mode="json"))
+    session.add(policy)
+    try:
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        return error("Leave policy already exists", status_code=409)
+    return success(
+        data=policy_payload(policy), message="Leave policy created", status_code=201
+    )
+
+
+@router.put("/{policy_id}")
+async def update_leave_policy(
+    policy_id: int,
+    payload: schemas.LeavePolicyCreate,
+    session: AsyncSession = Depends(get_db_session),
+) -> Response:
+    """Update a leave policy; employees on it are evaluated against the new version."""
+    policy = await session.get(LeavePolicy, policy_id)
+    if policy is None:
+        return error("Leave policy not found", status_code=404)
+    for field, value in payload.model_dump(mode="json").items():
+        setattr(policy, field, value)
+    try:
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        return error("Leave policy already exists", status_code=409)
+    await session.refresh(policy)
+    invalidate_policy(policy_id)
+    return success(data=policy_payload(policy), message="Leave policy updated")
+
+
+@router.delete("/{policy_id}")
+async def delete_leave_policy(
+    policy_id: int, session: AsyncSession = Depends(get_db_session)
+) -> Response:
+    """Delete a leave policy and unassign it from employees."""
+    # Employees are unassigned first: the foreign key is checked immediately.
+    await session.execute(
+        update(Employee)
+        .where(Employee.leave_policy_id == policy_id)
+        .values(leave_policy_id=None)
+    )
+    result = await session.execute(
+        delete(LeavePolicy).where(LeavePolicy.id == policy_id).returning(LeavePolicy.id)
+    )
+    if result.first() is None:
+        await session.rollback()
+        return error("Leave policy not found", status_code=404)
+    await session.commit()
+    invalidate_policy(policy_id)
+    return success(data={"id": policy_id}, message="Leave policy deleted")
+
+
+@router.post("/{policy_id}/simulate")
+async def simulate_leave_policy(
+    policy_id: int,
+    payload: schemas.LeavePolicySimulation,
+    session: AsyncSession = Depends(get_db_session),
+) -> Response:
+    """Preview how a policy change would alter each assigned employee's entitlement."""
+    try:
+        result = await simulate_policy_change(
+            session, policy_id, payload.details, payload.year or local_today().year
+        )
+    except PolicyConfigurationError as e:
+        return error(e.message, status_code=422)
+    if result is None:
+        return error("Leave policy not found", status_code=404)
+    return success(data=result)
@@ -1,3 +1,50 @@
-from fastapi import APIRouter
+from typing import Optional
 
-router = APIRouter()
\ No newline at end of file
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.api.lookup_crud import lookup_router
+from app.models import Leave, LeaveBalance, LeavePolicy, LeaveType
+
+
+async def leave_type_in_use(
+    session: AsyncSession, leave_type: LeaveType
+) -> Optional[str]:
+    """Refuse deletes while balances, policies or leaves use the leave type."""
+    in_balances = await session.scalar(
+        select(LeaveBalance.id)
+        .where(LeaveBalance.leave_type_id == leave_type.id)
+        .limit(1)
+    )
+    if in_balances is not None:
+        return "has leave balances"
+    # Policies list allocations by id, in either the current or the legacy layout.
+    allocation = [{"leave_type_id": leave_type.id}]
+    in_policies = await session.scalar(
+        select(LeavePolicy.id)
+        .where(
+            or_(
+                LeavePolicy.details.contains({"allocations": allocation}),
+                LeavePolicy.details.contains(allocation),
+            )
+        )
+        .limit(1)
+    )
+    if in_policies is not None:
+        return "is used by leave policies"
+    in_leaves = await session.scalar(
+        select(Leave.id).where(Leave.leave_type == leave_type.name).limit(1)
+    )
+    if in_leaves is not None:
+        return "has leaves recorded"
+    return None
+
+
+router = lookup_router(
+    "leave_types",
+    "Leave type",
+    schemas.LeaveTypeCreate,
+    schemas.LeaveType,
+    in_use=leave_type_in_use,
+)
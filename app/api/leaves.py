@@ -1,3 +1,198 @@
-from fastapi import APIRouter
+from datetime import date
+from typing import Optional
 
-router = APIRouter()
\ No newline at end of file
+from fastapi import APIRouter, Depends, Header, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.core.database import get_db_session, get_read_db_session
+from app.core.response import error, success
+from app.models import Leave
+from app.models.leave import LeaveStatus
+from app.services.dashboard import local_today
+from app.services.leave_balances import get_balances
+from app.services.leave_calendar import get_leave_calendar
+from app.services.leaves import (
+    LeaveError,
+    apply_for_leave,
+    change_leave_status,
+    get_team_leaves,
+)
+from app.services.lookups import get_employee_summaries
+
+router = APIRouter()
+
+
+def leave_payload(leave: Leave) -> schemas.Leave:
+    return schemas.Leave.model_validate(leave)
+
+
+@router.post("/apply", status_code=201)
+async def apply_leave(
+    payload: schemas.LeaveCreate, session: AsyncSession = Depends(get_db_session)
+) -> Response:
+    """An employee applies for leave."""
+    try:
+        leave = await apply_for_leave(session, payload)
+    except LeaveError as e:
+        return error(e.message, status_code=e.status_code)
+    return success(
+        data=leave_payload(leave), message="Leave request submitted", status_code=201
+    )
+
+
+@router.get("/employee/{employee_id}")
+async def list_employee_leaves(
+    employee_id: int, session: AsyncSession = Depends(get_read_db_session)
+) -> Response:
+    """All leave requests for an employee, newest first."""
+    result = await session.scalars(
+        select(Leave)
+        .where(Leave.employee_id == employee_id)
+        .order_by(Leave.start_date.desc())
+    )
+    return success(data=[leave_payload(leave) for leave in result])
+
+
+@router.get("/pending")
+async def list_pending_leaves(
+    cursor: Optional[int] = Query(
+        None, description="Return leaves with an id greater than this value"
+    ),
+    limit: int = Query(50, ge=1, le=500),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    """Pending leave requests awaiting a decision."""
+    stmt = (
+        select(Leave)
+        .where(Leave.status == LeaveStatus.PENDING)
+        .order_by(Leave.id)
+        .limit(limit)
+    )
+    if cursor is not None:
+        stmt = stmt.where(Leave.id > cursor)
+    leaves = [leave_payload(leave) for leave in await session.scalars(stmt)]
+    employees = await get_employee_summaries(
+        session, (leave.employee_id for leave in leaves)
+    )
+    return success(
+        data={
+            "items": leaves,
+            "employees": employees,
+            "next_cursor": leaves[-1].id if len(leaves) == limit else None,
+        }
+    )
+
+
+@router.get("/balance")
+async def get_leave_balance(
+    employee_id: Optional[int] = None,
+    department_id: Optional[int] = None,
+    year: Optional[int] = None,
+    cursor: Optional[int] = Query(
+        None, description="Return employees with an id greater than this value"
+    ),
+    limit: int = Query(100, ge=1, le=1000, description="Employees per page"),
+    session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    """Leave balances for an employee or, page by page, a department."""
+    if employee_id is None and department_id is None:
+        return error("employee_id or department_id is required", status_code=422)
+    balances = await get_balances(
+        session,
+        year or local_today().year,
+        employee_id=employee_id,
+        department_id=department_id,
+        cursor=cursor,
+        limit=limit,
+    )
+    return success(data=balances)
+
+
+@router.get("/team-availability")
+async def get_team_availability(
+    start_date: date,
+    end_date: date,
+    manager_id: Optional[int] = None,
+    department_id: Optional[int] = None,
+    include_pending: bool = False,
+    session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    """Who in a team or department is on leave between two dates."""
+    if manager_id is None and department_id is None:
+        return error("manager_id or department_id is required", status_code=422)
+    if end_date < start_date:
+        return error("end_date must not be before start_date", status_code=422)
+    leaves = await get_team_leaves(
+        session,
+        start_date,
+        end_date,
+        manager_id=manager_id,
+        department_id=department_id,
+        include_pending=include_pending,
+    )
+    return success(data=leaves)
+
+
+@router.get("/calendar")
+async def get_leave_calendar_month(
+    year: int = Query(..., ge=2000, le=2100),
+    month: int = Query(..., ge=1, le=12),
+    department_id: Optional[int] = None,
+    manager_id: Optional[int] = None,
+    session: AsyncSession = Depends(get_read_db_session),
+) -> Response:
+    """Month view of who is on leave or absent each day, for a team or department."""
+    calendar = await get_leave_calendar(session, year, month, department_id, manager_id)
+    return success(data=calendar)
+
+
+async def _transition(
+    session: AsyncSession,
+    leave_id: int,
+    status: str,
+    actor_id: Optional[int],
+    message: str,
+) -> Response:
+    try:
+        leave = await change_leave_status(session, leave_id, status, actor_id)
+    except LeaveError as e:
+        return error(e.message, status_code=e.status_code)
+    return success(data=leave_payload(leave), message=message)
+
+
+@router.post("/{leave_id}/approve")
+async def approve_leave(
+    leave_id: int,
+    x_employee_id: Optional[int] = Header(None),
+    session: AsyncSession = Depends(get_db_session),
+) -> Response:
+    """Approve a leave request."""
+    return await _transition(
+        session, leave_id, LeaveStatus.APPROVED, x_employee_id, "Leave approved"
+    )
+
+
+@router.post("/{leave_id}/reject")
+async def reject_leave(
+    leave_id: int,
+    x_employee_id: Optional[int] = Header(None),
+    session: AsyncSession = Depends(get_db_session),
+) -> Response:
+    """Reject a leave request."""
+    return await _transition(
+        session, leave_id, LeaveStatus.REJECTED, x_employee_id, "Leave rejected"
+    )
+
+
+@router.post("/{leave_id}/cancel")
+async def cancel_leave(
+    leave_id: int,
+    x_employee_id: Optional[int] = Header(None),
+    session: AsyncSession = Depends(get_db_session),
+) -> Response:
+    """Cancel a pending or approved leave request."""
+    return await _transition(
+        session, leave_id, LeaveStatus.CANCELLED, x_employee_id, "Leave cancelled"
+    )
@@ -0,0 +1,135 @@
+"""
+CRUD routers for the cached lookup tables in `LOOKUP_TABLES`.
+
+Reads are served from the lookup cache (with ETag support on the list);
+writes go to the primary and drop the cached snapshot. A table can refuse a
+delete while other rows still reference it through `in_use`.
+"""
+
+from typing import Any, Awaitable, Callable, Optional, Type, cast
+
+from fastapi import APIRouter, Depends, Request, Response
+from pydantic import BaseModel
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db_session
+from app.core.response import cached_success, error, success
+from app.models import Employee
+from app.services.lookups import (
+    LOOKUP_TABLES,
+    get_lookup,
+    get_lookup_row,
+    invalidate_lookup,
+)
+
+# Returns why a row cannot be deleted ("has employees assigned"), or None.
+InUseCheck = Callable[[AsyncSession, Any], Awaitable[Optional[str]]]
+
+
+def employees_assigned(column: Any) -> InUseCheck:
+    """Refuse deletes while an employee's `column` points at the row."""
+
+    async def check(session: AsyncSession, row: Any) -> Optional[str]:
+        assigned = await session.scalar(
+            select(Employee.id).where(column == row.id).limit(1)
+        )
+        return None if assigned is None else "has employees assigned"
+
+    return check
+
+
+def lookup_router(
+    table: str,
+    label: str,
+    create_schema: Type[BaseModel],
+    read_schema: Type[BaseModel],
+    in_use: InUseCheck,
+) -> APIRouter:
+    """List/get/create/update/delete endpoints for the lookup `table`.
+
+    `label` is the singular display name used in messages ("Leave type").
+    """
+    model = LOOKUP_TABLES[table].model
+    name = label.lower().replace(" ", "_")
+    router = APIRouter()
+
+    @router.get("", name=f"list_{table}")
+    async def list_rows(
+        request: Request, session: AsyncSession = Depends(get_db_session)
+    ) -> Response:
+        """List all rows, served from the lookup cache."""
+        snapshot = await get_lookup(session, table)
+        return cached_success(request, snapshot["rows"], snapshot["etag"])
+
+    @router.get("/{row_id}", name=f"get_{name}")
+    async def get_row(
+        row_id: int, session: AsyncSession = Depends(get_db_session)
+    ) -> Response:
+        """Get a single row."""
+        row = await get_lookup_row(session, table, row_id)
+        if row is None:
+            return error(f"{label} not found", status_code=404)
+        return success(data=row)
+
+    @router.post("", status_code=201, name=f"create_{name}")
+    async def create_row(
+        payload: create_schema,  # type: ignore[valid-type]
+        session: AsyncSession = Depends(get_db_session),
+    ) -> Response:
+        """Create a new row."""
+        row = model(**cast(BaseModel, payload).model_dump())
+        session.add(row)
+        try:
+            await session.commit()
+        except IntegrityError:
+            await session.rollback()
+            return error(f"{label} already exists", status_code=409)
+        await invalidate_lookup(table)
+        return success(
+            data=read_schema.model_validate(row).model_dump(),
+            message=f"{label} created",
+            status_code=201,
+        )
+
+    @router.put("/{row_id}", name=f"update_{name}")
+    async def update_row(
+        row_id: int,
+        payload: create_schema,  # type: ignore[valid-type]
+        session: AsyncSession = Depends(get_db_session),
+    ) -> Response:
+        """Update a row."""
+        row = await session.get(model, row_id)
+        if row is None:
+            return error(f"{label} not found", status_code=404)
+        for field, value in cast(BaseModel, payload).model_dump().items():
+            setattr(row, field, value)
+        try:
+            await session.commit()
+        except IntegrityError:
+            await session.rollback()
+            return error(f"{label} already exists", status_code=409)
+        await invalidate_lookup(table)
+        return success(
+            data=read_schema.model_validate(row).model_dump(),
+            message=f"{label} updated",
+        )
+
+    @router.delete("/{row_id}", name=f"delete_{name}")
+    async def delete_row(
+        row_id: int, session: AsyncSession = Depends(get_db_session)
+    ) -> Response:
+        """Delete a row that nothing references any more."""
+        row = await session.get(model, row_id)
+        if row is None:
+            return error(f"{label} not found", status_code=404)
+        reason = await in_use(session, row)
+        if reason is not None:
+            return error(f"{label} {reason}", status_code=409)
+        await session.execute(delete(model).where(model.id == row_id))
+        await session.commit()
+        await invalidate_lookup(table)
+        return success(data={"id": row_id}, message=f"{label} deleted")
+
+    return router
@@ -0,0 +1,161 @@
+"""
+HRMS command line interface.
+
+Usage:
+    python -m app.cli --help
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Awaitable, Dict, List, Optional, TypeVar
+
+import typer
+
+from app.core.database import AsyncSessionLocal, async_engine
+
+cli = typer.Typer(help="HRMS management commands")
+
+T = TypeVar("T")
+
+
+@cli.callback()
+def main() -> None:
+    """HRMS management commands."""
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """Run a coroutine and release pooled connections afterwards."""
+
+    async def runner() -> T:
+        try:
+            return await coro
+        finally:
+            await async_engine.dispose()
+
+    return asyncio.run(runner())
+
+
+@cli.command("import-employees")
+def import_employees_command(
+    path: Path = typer.Argument(
+        ..., exists=True, dir_okay=False, help="CSV or JSONL file"
+    ),
+    format: Optional[str] = typer.Option(
+        None, help="csv or jsonl; inferred from the file name if omitted"
+    ),
+    chunk_size: Optional[int] = typer.Option(
+        None, help="Rows validated and written per batch"
+    ),
+) -> None:
+    """Bulk create or update employees from a file."""
+    from app.services.employee_import import (
+        DEFAULT_CHUNK_SIZE,
+        SUPPORTED_FORMATS,
+        ImportReport,
+        detect_format,
+        import_employees,
+    )
+
+    fmt = format or detect_format(path.name)
+    if fmt not in SUPPORTED_FORMATS:
+        raise typer.BadParameter(
+            f"expected one of: {', '.join(SUPPORTED_FORMATS)}", param_hint="--format"
+        )
+
+    async def run() -> "ImportReport":
+        async with AsyncSessionLocal() as session:
+            with path.open(encoding="utf-8-sig", newline="") as stream:
+                return await import_employees(
+                    session, stream, fmt, chunk_size or DEFAULT_CHUNK_SIZE
+                )
+
+    report = run_async(run())
+    typer.echo(json.dumps(report.to_dict(), indent=2))
+    if report.failed:
+        raise typer.Exit(code=1)
+
+
+@cli.command("reconcile-leave-balances")
+def reconcile_leave_balances_command(
+    year: Optional[int] = typer.Option(
+        None, help="Year to rebuild; defaults to the current year"
+    ),
+) -> None:
+    """Rebuild leave balances for a year from approved leaves (run nightly)."""
+    from app.services.dashboard import local_today
+    from app.services.leave_balances import rebuild_balances
+
+    async def run() -> int:
+        async with AsyncSessionLocal() as session:
+            return await rebuild_balances(session, year or local_today().year)
+
+    rows = run_async(run())
+    typer.echo(f"Rebuilt {rows} leave balance rows")
+
+
+@cli.command("monthly-attendance-report")
+def monthly_attendance_report_command(
+    year: int = typer.Option(..., help="Report year"),
+    month: int = typer.Option(..., min=1, max=12, help="Report month"),
+    department_id: Optional[int] = typer.Option(
+        None, help="Limit the report to one department"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, help="Write CSV to this file instead of JSON to stdout"
+    ),
+) -> None:
+    """Compute monthly attendance and payroll-hours metrics."""
+    import csv
+
+    from app.services.attendance_report import monthly_attendance_report
+
+    async def run() -> List[Dict[str, Any]]:
+        async with AsyncSessionLocal() as session:
+            return await monthly_attendance_report(session, year, month, department_id)
+
+    report = run_async(run())
+    if output is None:
+        typer.echo(json.dumps(report, indent=2))
+        return
+    with output.open("w", newline="") as f:
+        if report:
+            writer = csv.DictWriter(f, fieldnames=list(report[0]))
+            writer.writeheader()
+            writer.writerows(report)
+    typer.echo(f"Wrote {len(report)} rows to {output}")
+
+
+@cli.command("manage-attendance-partitions")
+def manage_attendance_partitions_command() -> None:
+    """Create upcoming attendance partitions and archive expired ones (run nightly)."""
+    from app.services.attendance_partitions import maintain_partitions
+
+    result = run_async(maintain_partitions(async_engine))
+    typer.echo(f"Created: {', '.join(result['created']) or 'none'}")
+    typer.echo(f"Archived: {', '.join(result['archived']) or 'none'}")
+
+
+@cli.command("job-worker")
+def job_worker_command(
+    workers: int = typer.Option(4, min=1, help="Concurrent jobs run by this process"),
+) -> None:
+    """Run background job workers until interrupted (one per node is enough)."""
+    from app.services import job_handlers  # noqa: F401  registers the job kinds
+    from app.services.jobs import job_workers
+
+    async def run() -> None:
+        job_workers.start(workers)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await job_workers.stop()
+
+    try:
+        run_async(run())
+    except KeyboardInterrupt:
+        typer.echo("Job workers stopped")
+
+
+if __name__ == "__main__":
+    cli()
@@ -1 +1 @@
-# Core package 
\ No newline at end of file
+# Core package
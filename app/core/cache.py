@@ -0,0 +1,109 @@
+"""
+Process-local TTL cache with an optional shared backend.
+
+`cache` is the application-wide instance. It keeps values in memory by
+default; setting `CACHE_BACKEND_URL` to a `redis://` URL shares entries (and
+invalidations) between workers and hosts instead.
+"""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from app.core.settings import settings
+
+try:
+    from redis import asyncio as redis_asyncio
+except ImportError:  # redis is an optional dependency
+    redis_asyncio = None
+
+
+class CacheBackend:
+    """Interface implemented by cache backends."""
+
+    async def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    async def delete_prefix(self, prefix: str) -> None:
+        raise NotImplementedError
+
+
+class InMemoryBackend(CacheBackend):
+    """Bounded in-process store; the oldest entries are evicted first."""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
+
+
+class RedisBackend(CacheBackend):
+    """Shared backend; values must be JSON serialisable."""
+
+    def __init__(self, url: str, key_prefix: str = "hrms:"):
+        if redis_asyncio is None:
+            raise RuntimeError(
+                "CACHE_BACKEND_URL requires the 'redis' package to be installed"
+            )
+        self.client = redis_asyncio.from_url(url)
+        self.key_prefix = key_prefix
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self.client.get(self.key_prefix + key)
+        return None if raw is None else json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        await self.client.set(
+            self.key_prefix + key, json.dumps(value), px=int(ttl * 1000)
+        )
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.key_prefix + key)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        keys = [
+            key
+            async for key in self.client.scan_iter(match=f"{self.key_prefix}{prefix}*")
+        ]
+        if keys:
+            await self.client.delete(*keys)
+
+
+def create_cache_backend(url: str) -> CacheBackend:
+    if not url:
+        return InMemoryBackend()
+    if url.startswith(("redis://", "rediss://")):
+        return RedisBackend(url)
+    raise ValueError(f"Unsupported cache backend URL: {url}")
+
+
+cache = create_cache_backend(settings.cache_backend_url)
@@ -1,19 +1,24 @@
-from typing import AsyncGenerator
-import asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.ext.declarative import declarative_base
+import time
+from typing import Any, AsyncGenerator, Dict, List, Optional, cast
+from uuid import uuid4
+
+from fastapi import Request
+from loguru import logger
+from sqlalchemy import MetaData, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import MetaData
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 
+from app.core.metrics import record_pool_wait
 from app.core.settings import settings
 
-
 convention = {
     "ix": "ix_%(column_0_label)s",
     "uq": "uq_%(table_name)s_%(column_0_name)s",
     "ck": "ck_%(table_name)s_%(constraint_name)s",
     "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
-    "pk": "pk_%(table_name)s"
+    "pk": "pk_%(table_name)s",
 }
 
 metadata = MetaData(naming_convention=convention)
@@ -23,20 +28,198 @@ class Base(DeclarativeBase):
     metadata = metadata
 
 
+class PoolStats:
+    """Counters for time spent waiting to check a connection out of the pool."""
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        if timed_out:
+            self.timeouts += 1
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waits for a connection."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        wait = time.perf_counter() - started
+        pool_stats.record(wait)
+        record_pool_wait(wait)
+        return connection
+
+
+def engine_options() -> Dict[str, Any]:
+    """Keyword arguments for `create_async_engine` built from settings."""
+    if settings.db_pgbouncer_mode:
+        # Transaction pooling hands each transaction a different server
+        # connection, so named prepared statements must not be reused.
+        return {
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            },
+        }
+    return {
+        "connect_args": {
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+        },
+    }
+
+
 async_engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
-    future=True
+    future=True,
+    poolclass=InstrumentedQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    **engine_options(),
 )
 
 AsyncSessionLocal = async_sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False
+    bind=async_engine, class_=AsyncSession, expire_on_commit=False
+)
+
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
 )
 
+READ_ONLY_METHODS = ("GET", "HEAD", "OPTIONS")
+LAST_WRITE_SESSION_KEY = "last_write_at"
+
+
+class ReplicaRouter:
+    """Round-robin over read replicas, skipping any that lag too far behind."""
+
+    def __init__(self, urls: List[str]) -> None:
+        self.engines = [
+            create_async_engine(
+                url,
+                echo=settings.debug,
+                pool_size=settings.db_pool_size,
+                max_overflow=settings.db_max_overflow,
+                pool_timeout=settings.db_pool_timeout,
+                pool_recycle=settings.db_pool_recycle,
+                pool_pre_ping=settings.db_pool_pre_ping,
+                **engine_options(),
+            )
+            for url in urls
+        ]
+        self.sessionmakers = [
+            async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+            for engine in self.engines
+        ]
+        # index -> (checked at, lag in seconds or None when unreachable)
+        self._lag: Dict[int, tuple] = {}
+        self._next = 0
+
+    async def measure_lag(self, index: int) -> Optional[float]:
+        try:
+            async with self.engines[index].connect() as conn:
+                lag: Optional[float] = float(await conn.scalar(REPLICA_LAG_QUERY) or 0)
+        except Exception as e:
+            logger.warning(f"Replica {index} lag check failed: {str(e)}")
+            lag = None
+        self._lag[index] = (time.monotonic(), lag)
+        return lag
 
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+    async def _is_healthy(self, index: int) -> bool:
+        checked_at, lag = self._lag.get(index, (None, None))
+        if (
+            checked_at is None
+            or time.monotonic() - checked_at
+            > settings.replica_lag_check_interval_seconds
+        ):
+            lag = await self.measure_lag(index)
+        return lag is not None and lag <= settings.replica_max_lag_seconds
+
+    async def pick(self) -> Optional[async_sessionmaker]:
+        """A sessionmaker for a healthy replica, or None to use the primary."""
+        for _ in range(len(self.sessionmakers)):
+            index = self._next
+            self._next = (self._next + 1) % len(self.sessionmakers)
+            if await self._is_healthy(index):
+                return self.sessionmakers[index]
+        return None
+
+    async def status(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "replica": index,
+                "lag_seconds": await self.measure_lag(index),
+                "max_lag_seconds": settings.replica_max_lag_seconds,
+            }
+            for index in range(len(self.engines))
+        ]
+
+    async def dispose(self) -> None:
+        for engine in self.engines:
+            await engine.dispose()
+
+
+replica_router = ReplicaRouter(settings.database_replica_urls)
+
+
+async def read_sessionmaker() -> async_sessionmaker:
+    """Sessionmaker for read-only work: a healthy replica when available."""
+    return await replica_router.pick() or AsyncSessionLocal
+
+
+def cache_ttl(session: AsyncSession, ttl: float) -> float:
+    """TTL for a value built from `session`, bounded by replica staleness.
+
+    A replica may be up to `replica_max_lag_seconds` behind, so a value read
+    from one right after a write's cache invalidation can be stale; it is
+    cached no longer than that lag, after which the next miss rebuilds it.
+    """
+    if session.bind is async_engine:
+        return ttl
+    return min(ttl, settings.replica_max_lag_seconds)
+
+
+def get_pool_status() -> Dict[str, Any]:
+    """Live pool occupancy plus cumulative checkout wait statistics."""
+    pool = cast(InstrumentedQueuePool, async_engine.pool)
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.db_max_overflow,
+        "checkouts": pool_stats.checkouts,
+        "timeouts": pool_stats.timeouts,
+        "avg_wait_ms": (
+            round(pool_stats.total_wait / pool_stats.checkouts * 1000, 3)
+            if pool_stats.checkouts
+            else 0.0
+        ),
+        "max_wait_ms": round(pool_stats.max_wait * 1000, 3),
+    }
+
+
+async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Primary session; write requests remember when the client last wrote."""
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -45,13 +228,37 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+    if request.method not in READ_ONLY_METHODS and "session" in request.scope:
+        request.session[LAST_WRITE_SESSION_KEY] = time.time()
+
+
+async def get_read_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only endpoints.
+
+    Served from a replica unless none is healthy or the client wrote within
+    `read_after_write_window_seconds`, in which case it may not see its own
+    write on a replica yet and is kept on the primary.
+    """
+    sessionmaker = AsyncSessionLocal
+    last_write = (
+        request.session.get(LAST_WRITE_SESSION_KEY, 0)
+        if "session" in request.scope
+        else 0
+    )
+    if time.time() - last_write > settings.read_after_write_window_seconds:
+        sessionmaker = await read_sessionmaker()
+    async with sessionmaker() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
 
 
-async def create_tables():
+async def create_tables() -> None:
     async with async_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
 
-async def drop_tables():
+async def drop_tables() -> None:
     async with async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all) 
\ No newline at end of file
+        await conn.run_sync(Base.metadata.drop_all)
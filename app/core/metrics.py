@@ -0,0 +1,370 @@
+"""
+Request-level performance instrumentation.
+
+`MetricsMiddleware` times every HTTP request and, through SQLAlchemy engine
+events, counts the queries it issues and the time they take. Results are
+added to the response as a `Server-Timing` header and aggregated per route
+for the Prometheus `/metrics` endpoint. Queries slower than
+`SLOW_QUERY_THRESHOLD_MS` are logged with their SQL, and requests issuing
+more than their query budget are logged (or, with `QUERY_BUDGET_STRICT`,
+failed, e.g. during load tests); `tests/test_query_budgets.py` asserts the
+per-endpoint counts in CI.
+
+Metrics are kept per process; scrape every worker (or run one worker per
+container) for a complete picture.
+"""
+
+import time
+import weakref
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.settings import settings
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+Endpoint = TypeVar("Endpoint", bound=Callable[..., Any])
+
+
+@dataclass
+class RequestMetrics:
+    db_queries: int = 0
+    db_time: float = 0.0
+    pool_wait: float = 0.0
+    scope: Optional[Scope] = None
+    over_budget: bool = False
+
+
+_current: ContextVar[Optional[RequestMetrics]] = ContextVar(
+    "request_metrics", default=None
+)
+
+
+def current_request_metrics() -> Optional[RequestMetrics]:
+    return _current.get()
+
+
+@contextmanager
+def measure_queries() -> Iterator[RequestMetrics]:
+    """Attribute queries issued inside the block to a fresh `RequestMetrics`.
+
+    For code outside HTTP requests (scripts, benchmarks); the engine must be
+    instrumented with `instrument_engine`.
+    """
+    metrics = RequestMetrics()
+    token = _current.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current.reset(token)
+
+
+def record_pool_wait(wait: float) -> None:
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.pool_wait += wait
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised under QUERY_BUDGET_STRICT when a request issues too many queries."""
+
+
+def query_budget(limit: int) -> Callable[[Endpoint], Endpoint]:
+    """Override QUERY_BUDGET_PER_REQUEST for one endpoint."""
+
+    def decorate(endpoint: Endpoint) -> Endpoint:
+        setattr(endpoint, "query_budget", limit)
+        return endpoint
+
+    return decorate
+
+
+def _query_budget(metrics: RequestMetrics) -> int:
+    route = metrics.scope.get("route") if metrics.scope is not None else None
+    return getattr(
+        getattr(route, "endpoint", None),
+        "query_budget",
+        settings.query_budget_per_request,
+    )
+
+
+def check_query_budget(metrics: RequestMetrics) -> None:
+    """Flag (and under strict mode fail) a request about to exceed its budget.
+
+    Catches N+1 patterns: a relationship loaded per row shows up as a query
+    count that grows with the page size.
+    """
+    if metrics.over_budget:
+        return
+    budget = _query_budget(metrics)
+    if not budget or metrics.db_queries < budget:
+        return
+    metrics.over_budget = True
+    registry.budget_exceeded += 1
+    route = metrics.scope.get("route") if metrics.scope is not None else None
+    message = (
+        f"Query budget of {budget} exceeded by {getattr(route, 'path', 'unmatched')}"
+    )
+    if settings.query_budget_strict:
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.total += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.request_duration: Dict[Tuple[str, str, int], Histogram] = defaultdict(
+            lambda: Histogram(LATENCY_BUCKETS)
+        )
+        self.db_queries: Dict[Tuple[str, str], Histogram] = defaultdict(
+            lambda: Histogram(QUERY_COUNT_BUCKETS)
+        )
+        self.db_time: Dict[Tuple[str, str], Histogram] = defaultdict(
+            lambda: Histogram(LATENCY_BUCKETS)
+        )
+        self.pool_wait: Dict[Tuple[str, str], Histogram] = defaultdict(
+            lambda: Histogram(LATENCY_BUCKETS)
+        )
+        self.response_bytes: Dict[Tuple[str, str], List[float]] = defaultdict(
+            lambda: [0, 0]
+        )
+        self.slow_queries = 0
+        self.budget_exceeded = 0
+
+    def observe_request(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        duration: float,
+        size: int,
+        metrics: RequestMetrics,
+    ) -> None:
+        self.request_duration[(method, route, status)].observe(duration)
+        self.db_queries[(method, route)].observe(metrics.db_queries)
+        self.db_time[(method, route)].observe(metrics.db_time)
+        self.pool_wait[(method, route)].observe(metrics.pool_wait)
+        totals = self.response_bytes[(method, route)]
+        totals[0] += size
+        totals[1] += 1
+
+    def render(self) -> str:
+        """Prometheus text exposition format."""
+        from app.core.database import get_pool_status
+
+        lines: List[str] = []
+        _render_histograms(
+            lines,
+            "hrms_http_request_duration_seconds",
+            "HTTP request latency",
+            self.request_duration,
+            ("method", "route", "status"),
+        )
+        _render_histograms(
+            lines,
+            "hrms_db_queries_per_request",
+            "Database queries issued per request",
+            self.db_queries,
+            ("method", "route"),
+        )
+        _render_histograms(
+            lines,
+            "hrms_db_time_seconds",
+            "Database time per request",
+            self.db_time,
+            ("method", "route"),
+        )
+        _render_histograms(
+            lines,
+            "hrms_db_pool_wait_seconds",
+            "Time spent waiting for a pooled connection per request",
+            self.pool_wait,
+            ("method", "route"),
+        )
+        lines.append("# HELP hrms_http_response_size_bytes Response body size")
+        lines.append("# TYPE hrms_http_response_size_bytes summary")
+        for (method, route), (total, count) in self.response_bytes.items():
+            labels = _labels(("method", "route"), (method, route))
+            lines.append(f"hrms_http_response_size_bytes_sum{{{labels}}} {total}")
+            lines.append(f"hrms_http_response_size_bytes_count{{{labels}}} {count}")
+        lines.append(
+            "# HELP hrms_db_slow_queries_total "
+            "Queries slower than the slow query threshold"
+        )
+        lines.append("# TYPE hrms_db_slow_queries_total counter")
+        lines.append(f"hrms_db_slow_queries_total {self.slow_queries}")
+        lines.append(
+            "# HELP hrms_query_budget_exceeded_total "
+            "Requests that issued more queries than their budget"
+        )
+        lines.append("# TYPE hrms_query_budget_exceeded_total counter")
+        lines.append(f"hrms_query_budget_exceeded_total {self.budget_exceeded}")
+
+        pool = get_pool_status()
+        for name, key in (
+            ("hrms_db_pool_checked_out", "checked_out"),
+            ("hrms_db_pool_overflow", "overflow"),
+            ("hrms_db_pool_size", "size"),
+        ):
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {pool[key]}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[Any]) -> str:
+    return ",".join(
+        f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)
+    )
+
+
+def _render_histograms(
+    lines: List[str],
+    name: str,
+    help_text: str,
+    histograms: Dict[Any, Histogram],
+    label_names: Sequence[str],
+) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for key, histogram in histograms.items():
+        labels = _labels(label_names, key)
+        for bound, count in zip(histogram.buckets, histogram.counts):
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+        lines.append(f"{name}_sum{{{labels}}} {histogram.total}")
+        lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+
+registry = MetricsRegistry()
+
+_instrumented_engines: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Attribute query count and time to the current request, enforce query
+    budgets and log slow queries. Repeated calls for one engine are no-ops."""
+    sync_engine = engine.sync_engine
+    if sync_engine in _instrumented_engines:
+        return
+    _instrumented_engines.add(sync_engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        metrics = _current.get()
+        if metrics is not None:
+            check_query_budget(metrics)
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        metrics = _current.get()
+        if metrics is not None:
+            metrics.db_queries += 1
+            metrics.db_time += elapsed
+        if elapsed * 1000 >= settings.slow_query_threshold_ms:
+            registry.slow_queries += 1
+            bind_count = len(parameters) if executemany else len(parameters or ())
+            logger.warning(
+                f"Slow query ({elapsed * 1000:.1f} ms, {bind_count} "
+                f"{'parameter sets' if executemany else 'bind parameters'}): "
+                f"{statement}"
+            )
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording per-route latency, DB usage and response size."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics(scope=scope)
+        token = _current.set(metrics)
+        started = time.perf_counter()
+        state = {"status": 500, "size": 0}
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                MutableHeaders(scope=message).append(
+                    "Server-Timing",
+                    f"app;dur={elapsed_ms:.1f}, "
+                    f"db;dur={metrics.db_time * 1000:.1f};"
+                    f'desc="{metrics.db_queries} queries", '
+                    f"pool;dur={metrics.pool_wait * 1000:.1f}",
+                )
+            elif message["type"] == "http.response.body":
+                state["size"] += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            route = scope.get("route")
+            registry.observe_request(
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                state["status"],
+                time.perf_counter() - started,
+                state["size"],
+                metrics,
+            )
+            _current.reset(token)
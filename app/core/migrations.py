@@ -0,0 +1,93 @@
+"""
+Startup-time schema handling.
+
+Workers do not create or reflect tables on boot. In the default `verify`
+mode they compare the revision stored in `alembic_version` with the head of
+`alembic/versions` (one single-row query) and refuse to start on a mismatch;
+the schema itself is managed with `alembic upgrade head`.
+
+Databases created by the old startup `create_all` have the tables but no
+`alembic_version`; they are adopted once with `alembic stamp
+BASELINE_REVISION` followed by `alembic upgrade head` (see the README).
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import FrozenSet
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+STARTUP_MODES = ("verify", "create_all", "skip")
+# The migration that creates the schema `create_all` used to build on startup.
+BASELINE_REVISION = "9c3e1f7a2b64"
+
+
+class SchemaRevisionError(RuntimeError):
+    """The database schema is not at the revision this code expects."""
+
+
+@lru_cache(maxsize=1)
+def head_revisions() -> FrozenSet[str]:
+    """Head revision(s) of the migration scripts shipped with the code."""
+    config = Config(str(PROJECT_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(PROJECT_ROOT / "alembic"))
+    return frozenset(ScriptDirectory.from_config(config).get_heads())
+
+
+async def current_revisions(engine: AsyncEngine) -> FrozenSet[str]:
+    """Revision(s) recorded in the database; empty if it was never migrated."""
+    async with engine.connect() as conn:
+        try:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+        except ProgrammingError:
+            return frozenset()
+        return frozenset(result.scalars())
+
+
+async def has_unversioned_tables(engine: AsyncEngine) -> bool:
+    """True when the HRMS tables exist but Alembic never recorded a revision."""
+    async with engine.connect() as conn:
+        return bool(
+            await conn.scalar(text("SELECT to_regclass('employees') IS NOT NULL"))
+        )
+
+
+async def verify_schema_revision(engine: AsyncEngine) -> None:
+    expected, current = head_revisions(), await current_revisions(engine)
+    if not current and await has_unversioned_tables(engine):
+        raise SchemaRevisionError(
+            "Database was created without Alembic (startup create_all); run "
+            f"`alembic stamp {BASELINE_REVISION}` once, then `alembic upgrade head`"
+        )
+    if current != expected:
+        raise SchemaRevisionError(
+            f"Database is at revision {sorted(current) or 'none'}, "
+            f"expected {sorted(expected)}; "
+            "run `alembic upgrade head`"
+        )
+
+
+async def prepare_database(engine: AsyncEngine, mode: str) -> None:
+    """Run the configured startup schema step."""
+    if mode == "verify":
+        await verify_schema_revision(engine)
+        logger.info("Database schema revision verified")
+    elif mode == "create_all":
+        import app.models  # noqa: F401  (register every table on Base.metadata)
+        from app.core.database import Base
+
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        logger.info("Database tables created successfully")
+    elif mode == "skip":
+        logger.info("Database schema check skipped")
+    else:
+        raise ValueError(
+            f"Unknown DB_STARTUP_MODE {mode!r}, expected one of {STARTUP_MODES}"
+        )
@@ -0,0 +1,97 @@
+"""
+Process pool for CPU-bound report work.
+
+Rendering large reports on the event loop stalls every other request in the
+worker. `report_pool` is started in the application lifespan and runs such
+work in separate processes (spawned, so no event loop or open connections
+are inherited). At most `REPORT_MAX_PENDING_TASKS` tasks may be queued or
+running; `admit()` lets endpoints reject new reports with 503 instead of
+queueing without bound.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterable, Optional
+
+from loguru import logger
+
+
+class PoolBusyError(Exception):
+    """Raised when the report pool has no room for more work."""
+
+
+class ReportProcessPool:
+    def __init__(self) -> None:
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.workers = 0
+        self.max_pending = 0
+        # Tasks submitted and not finished, including those waiting for a slot.
+        self.pending = 0
+
+    @property
+    def started(self) -> bool:
+        return self._executor is not None
+
+    def start(self, workers: int, max_pending: int) -> None:
+        self._slots = asyncio.Semaphore(max_pending)
+        self.max_pending = max_pending
+        self.workers = workers
+        if workers > 0:
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"Started report process pool with {workers} workers")
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def admit(self) -> None:
+        """Fail fast when the queue is already full."""
+        if self._executor is not None and self.pending >= self.max_pending:
+            raise PoolBusyError("Report workers are busy, retry shortly")
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run `fn(*args)` in the pool, waiting for a slot first."""
+        if self._executor is None or self._slots is None:
+            # Not started (CLI, scripts): run in-process.
+            return fn(*args)
+        self.pending += 1
+        try:
+            async with self._slots:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._executor, fn, *args
+                )
+        finally:
+            self.pending -= 1
+
+    async def map_ordered(
+        self, fn: Callable[..., Any], items: Iterable[Any]
+    ) -> AsyncIterator[Any]:
+        """Yield `fn(item)` results in order while later items are still running.
+
+        Only `max_pending` items are in flight at once, so a slow client also
+        stops the pool from getting further ahead of it.
+        """
+        if self._executor is None:
+            for item in items:
+                yield fn(item)
+            return
+        window = max(1, min(self.max_pending, self.workers * 2))
+        in_flight = []
+        try:
+            for item in items:
+                in_flight.append(asyncio.ensure_future(self.run(fn, item)))
+                if len(in_flight) >= window:
+                    yield await in_flight.pop(0)
+            while in_flight:
+                yield await in_flight.pop(0)
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+
+report_pool = ReportProcessPool()
@@ -1,9 +1,97 @@
-from fastapi.responses import JSONResponse
-from typing import Any, Dict, Optional
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+from uuid import UUID
 
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.engine import Row
 
-def success(data: Any, message: str = "Success", status_code: int = 200) -> JSONResponse:
-    return JSONResponse(
+# Items serialized per chunk when streaming the `data` array.
+STREAM_CHUNK_SIZE = 500
+
+
+def _decimal(value: Decimal) -> Union[int, float]:
+    # Same rule as FastAPI's jsonable_encoder: integral values stay ints.
+    exponent = value.as_tuple().exponent
+    # NaN and infinities have a letter for an exponent and stay floats.
+    return int(value) if isinstance(exponent, int) and exponent >= 0 else float(value)
+
+
+def _default(obj: Any) -> Any:
+    """Convert values the JSON backend does not know natively."""
+    if isinstance(obj, Decimal):
+        return _decimal(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="python")
+    if isinstance(obj, Row):
+        return obj._asdict()
+    if hasattr(obj, "keys") and hasattr(obj, "__getitem__"):
+        return {key: obj[key] for key in obj.keys()}
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    state = sa_inspect(obj, raiseerr=False)
+    if state is not None and hasattr(state, "mapper"):
+        return {attr.key: getattr(obj, attr.key) for attr in state.mapper.column_attrs}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _prepare(obj: Any) -> Any:
+    # pydantic-core writes Decimal as a string; convert first so both
+    # backends produce the same JSON as the old jsonable_encoder path.
+    if isinstance(obj, dict):
+        return {key: _prepare(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_prepare(value) for value in obj]
+    if isinstance(
+        obj, (str, int, float, bool, type(None), date, datetime, time, UUID, Enum)
+    ):
+        return obj
+    return _prepare(_default(obj))
+
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency
+    import pydantic_core
+
+    def dumps(obj: Any) -> bytes:
+        return pydantic_core.to_json(_prepare(obj))
+
+else:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+
+
+class EnvelopeResponse(JSONResponse):
+    """JSONResponse rendered with orjson (or pydantic-core) instead of stdlib json.
+
+    Pydantic models, row mappings, ORM instances, Decimals and dates can be
+    passed as-is; callers no longer need `jsonable_encoder`.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def success(
+    data: Any, message: str = "Success", status_code: int = 200
+) -> JSONResponse:
+    return EnvelopeResponse(
         status_code=status_code,
         content={
             "status": "success",
@@ -13,8 +101,10 @@ def success(data: Any, message: str = "Success", status_code: int = 200) -> JSON
     )
 
 
-def error(message: str, status_code: int = 400, data: Optional[Dict] = None) -> JSONResponse:
-    return JSONResponse(
+def error(
+    message: str, status_code: int = 400, data: Optional[Dict] = None
+) -> JSONResponse:
+    return EnvelopeResponse(
         status_code=status_code,
         content={
             "status": "error",
@@ -22,3 +112,63 @@ def error(message: str, status_code: int = 400, data: Optional[Dict] = None) ->
             "data": data,
         },
     )
+
+
+def cached_success(
+    request: Request, data: Any, etag: str, message: str = "Success"
+) -> Response:
+    """Return `success()` with an ETag, or 304 when the client copy is current."""
+    if etag in request.headers.get("if-none-match", "").replace("W/", "").split(", "):
+        return Response(status_code=304, headers={"ETag": etag})
+    response = success(data=data, message=message)
+    response.headers["ETag"] = etag
+    return response
+
+
+async def _stream_envelope(
+    items: Union[Iterable[Any], AsyncIterable[Any]], message: str
+) -> AsyncIterator[bytes]:
+    yield b'{"status":"success","message":' + dumps(message) + b',"data":['
+    chunk: List[Any] = []
+    first = True
+
+    def flush() -> bytes:
+        nonlocal first
+        body = b",".join(dumps(item) for item in chunk)
+        if not first:
+            body = b"," + body
+        first = False
+        chunk.clear()
+        return body
+
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            chunk.append(item)
+            if len(chunk) >= STREAM_CHUNK_SIZE:
+                yield flush()
+    else:
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= STREAM_CHUNK_SIZE:
+                yield flush()
+    if chunk:
+        yield flush()
+    yield b"]}"
+
+
+def stream_success(
+    items: Union[Iterable[Any], AsyncIterable[Any]],
+    message: str = "Success",
+    status_code: int = 200,
+) -> StreamingResponse:
+    """Stream the same envelope as `success()` with `data` written incrementally.
+
+    Use for large lists so the full payload is never held in memory. Errors
+    raised after the first chunk cannot change the status code, so validate
+    before returning this response.
+    """
+    return StreamingResponse(
+        _stream_envelope(items, message),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -1,40 +1,76 @@
 """
 HRMS Backend - FastAPI Application Entry Point
 """
+
 from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from loguru import logger
 from starlette.middleware.sessions import SessionMiddleware
-from contextlib import asynccontextmanager
 
-from app.core.settings import settings
-from app.core.database import async_engine, Base
+from app.api import (
+    attendance,
+    changes,
+    company_units,
+    dashboard,
+    departments,
+    designations,
+    employees,
+    job_types,
+    jobs,
+    leave_policies,
+    leave_types,
+    leaves,
+)
 from app.api.health import router as health_router
-from app.api import employees, departments, designations, leaves, attendance, leave_types, leave_policies
+from app.api.metrics import router as metrics_router
+from app.core.database import async_engine, replica_router
+from app.core.metrics import MetricsMiddleware, instrument_engine
+from app.core.migrations import prepare_database
+from app.core.process_pool import report_pool
+from app.core.settings import settings
+from app.services.attendance_ingest import attendance_batcher
+from app.services.change_feed import change_notifier
+from app.services.employee_search import employee_search
+from app.services.jobs import job_workers
+
 # Import other routers here
 
+
 @asynccontextmanager
-async def lifespan(app: FastAPI):
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Async context manager for FastAPI application lifecycle."""
     logger.info("Application starting up...")
     try:
-        async with async_engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        logger.info("Database tables created successfully")
+        await prepare_database(async_engine, settings.db_startup_mode)
+        employee_search.start()
+        change_notifier.start()
+        job_workers.start(settings.job_workers)
+        report_pool.start(
+            settings.report_process_workers, settings.report_max_pending_tasks
+        )
     except Exception as e:
         logger.error(f"Error during startup: {str(e)}")
         raise
     yield
     logger.info("Application shutting down...")
     try:
+        await job_workers.stop()
+        report_pool.shutdown()
+        await employee_search.stop()
+        await change_notifier.stop()
+        await attendance_batcher.close()
         await async_engine.dispose()
+        await replica_router.dispose()
         logger.info("Database connections closed")
     except Exception as e:
         logger.error(f"Error during shutdown: {str(e)}")
         raise
 
+
 def create_application() -> FastAPI:
     """Create and configure the FastAPI application."""
     app = FastAPI(
@@ -63,30 +99,53 @@ def create_application() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
-    
-    app.add_middleware(
-        TrustedHostMiddleware, 
-        allowed_hosts=["localhost", "127.0.0.1", settings.base_url]
-    )
-    
+
     app.add_middleware(
-        SessionMiddleware, 
-        secret_key=settings.secret_key
+        TrustedHostMiddleware,
+        allowed_hosts=["localhost", "127.0.0.1", settings.base_url],
     )
 
+    app.add_middleware(SessionMiddleware, secret_key=settings.secret_key)
+
+    if settings.metrics_enabled:
+        # Added last so it wraps every other middleware in the timing
+        app.add_middleware(MetricsMiddleware)
+        instrument_engine(async_engine)
+        for engine in replica_router.engines:
+            instrument_engine(engine)
+        app.include_router(metrics_router, tags=["metrics"])
+
     app.include_router(health_router, prefix="/api/v1", tags=["health"])
     app.include_router(employees.router, prefix="/api/v1/employees", tags=["employees"])
-    app.include_router(departments.router, prefix="/api/v1/departments", tags=["departments"])
-    app.include_router(designations.router, prefix="/api/v1/designations", tags=["designations"])
+    app.include_router(
+        departments.router, prefix="/api/v1/departments", tags=["departments"]
+    )
+    app.include_router(
+        designations.router, prefix="/api/v1/designations", tags=["designations"]
+    )
     app.include_router(leaves.router, prefix="/api/v1/leaves", tags=["leaves"])
-    app.include_router(attendance.router, prefix="/api/v1/attendance", tags=["attendance"])
-    app.include_router(leave_types.router, prefix="/api/v1/leave-types", tags=["leave-types"])
-    app.include_router(leave_policies.router, prefix="/api/v1/leave-policies", tags=["leave-policies"])
+    app.include_router(
+        attendance.router, prefix="/api/v1/attendance", tags=["attendance"]
+    )
+    app.include_router(
+        leave_types.router, prefix="/api/v1/leave-types", tags=["leave-types"]
+    )
+    app.include_router(
+        leave_policies.router, prefix="/api/v1/leave-policies", tags=["leave-policies"]
+    )
+    app.include_router(job_types.router, prefix="/api/v1/job-types", tags=["job-types"])
+    app.include_router(
+        company_units.router, prefix="/api/v1/company-units", tags=["company-units"]
+    )
+    app.include_router(jobs.router, prefix="/api/v1/jobs", tags=["jobs"])
+    app.include_router(changes.router, prefix="/api/v1/changes", tags=["changes"])
+    app.include_router(dashboard.router, prefix="/api/v1/dashboard", tags=["dashboard"])
     # Include other routers here with their tags
 
     return app
 
+
 # Create the FastAPI application instance
 app = create_application()
 
-# Optional: Add startup/shutdown event handlers if needed
\ No newline at end of file
+# Optional: Add startup/shutdown event handlers if needed
@@ -1,12 +1,15 @@
-from .employee import Employee
+from .attendance import Attendance
+from .background_job import BackgroundJob
+from .change_log import ChangeLog
 from .company_unit import CompanyUnit
 from .department import Department
 from .designation import Designation
+from .employee import Employee
 from .job_type import JobType
 from .leave import Leave
-from .attendance import Attendance
-from .leave_type import LeaveType
+from .leave_balance import LeaveBalance
 from .leave_policy import LeavePolicy
+from .leave_type import LeaveType
 
 __all__ = [
     "Employee",
@@ -18,4 +21,7 @@ __all__ = [
     "Attendance",
     "LeaveType",
     "LeavePolicy",
-]
\ No newline at end of file
+    "LeaveBalance",
+    "BackgroundJob",
+    "ChangeLog",
+]
@@ -1,29 +1,83 @@
+from datetime import date, datetime
+from typing import Optional
+
 from sqlalchemy import (
-    Column,
-    Integer,
+    DDL,
     Date,
-    ForeignKey,
     DateTime,
+    ForeignKey,
+    Index,
+    Integer,
     String,
     Text,
     UniqueConstraint,
+    event,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
 
 from app.core.database import Base
 
 
+class AttendanceStatus:
+    PRESENT = "Present"
+    ABSENT = "Absent"
+
+
 class Attendance(Base):
     __tablename__ = "attendance"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False)
-    date = Column(Date, nullable=False)
-    check_in = Column(DateTime(timezone=True))
-    check_out = Column(DateTime(timezone=True))
-    status = Column(String(50))
-    notes = Column(Text)
+    # Range-partitioned by month on `date`, so the key must include it; see
+    # app/services/attendance_partitions.py.
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    employee_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("employees.id"), nullable=False
+    )
+    date: Mapped[date] = mapped_column(Date, primary_key=True, nullable=False)
+    check_in: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    check_out: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    status: Mapped[Optional[str]] = mapped_column(String(50))
+    notes: Mapped[Optional[str]] = mapped_column(Text)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    employee = relationship(
+        "Employee", back_populates="attendance_records", lazy="raise_on_sql"
+    )
 
-    employee = relationship("Employee", back_populates="attendance_records")
+    __table_args__ = (
+        UniqueConstraint("employee_id", "date", name="uq_employee_date"),
+        # Date-range scans (exports, reports) across all employees.
+        Index("ix_attendance_date_employee_id", "date", "employee_id"),
+        {"postgresql_partition_by": "RANGE (date)"},
+    )
 
-    __table_args__ = (UniqueConstraint("employee_id", "date", name="uq_employee_date"),)
\ No newline at end of file
+
+# Tables created outside Alembic (DB_STARTUP_MODE=create_all) get partitions
+# for the current month and the next three; maintenance adds the rest.
+event.listen(
+    Attendance.__table__,
+    "after_create",
+    DDL(
+        """
+        DO $$
+        DECLARE partition_month date;
+        BEGIN
+            FOR partition_month IN SELECT generate_series(
+                date_trunc('month', current_date),
+                date_trunc('month', current_date) + interval '3 months',
+                interval '1 month'
+            )::date LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %%I PARTITION OF attendance '
+                    || 'FOR VALUES FROM (%%L) TO (%%L)',
+                    'attendance_p' || to_char(partition_month, 'YYYYMM'),
+                    partition_month,
+                    (partition_month + interval '1 month')::date
+                );
+            END LOOP;
+        END $$
+        """
+    ),
+)
@@ -0,0 +1,152 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    event,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+# Tables whose row changes are published on the change feed, and the columns
+# published for each. The feed is served without authentication, so payroll,
+# bank, tax and personal details (and free-text notes and leave reasons) are
+# left out; add a column here only if any consumer may see it.
+PUBLISHED_COLUMNS = {
+    "employees": (
+        "id",
+        "employee_id",
+        "first_name",
+        "last_name",
+        "email",
+        "department_id",
+        "designation_id",
+        "manager_id",
+        "joining_date",
+        "work_location_id",
+        "job_type_id",
+        "shift_timing",
+        "weekly_hours",
+        "leave_policy_id",
+        "is_active",
+        "created_at",
+        "updated_at",
+    ),
+    "leaves": (
+        "id",
+        "employee_id",
+        "leave_type",
+        "start_date",
+        "end_date",
+        "status",
+        "approved_by_id",
+        "created_at",
+        "updated_at",
+    ),
+    "attendance": (
+        "id",
+        "employee_id",
+        "date",
+        "check_in",
+        "check_out",
+        "status",
+        "updated_at",
+    ),
+}
+TRACKED_TABLES = tuple(PUBLISHED_COLUMNS)
+
+
+class ChangeOperation:
+    INSERT = "I"
+    UPDATE = "U"
+    DELETE = "D"
+
+
+class ChangeLog(Base):
+    """One row per insert, update or delete on a tracked table, written by triggers."""
+
+    __tablename__ = "change_log"
+
+    seq: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    # Writing transaction; the feed only serves transactions older than the
+    # oldest one still running, so a late commit can never be skipped.
+    txid: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        server_default=text("pg_current_xact_id()::text::bigint"),
+    )
+    table_name: Mapped[str] = mapped_column(String(63), nullable=False)
+    row_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    operation: Mapped[str] = mapped_column(String(1), nullable=False)
+    # Published columns of the row for inserts, the changed published columns
+    # for updates, NULL for deletes.
+    changes: Mapped[Optional[Any]] = mapped_column(JSONB)
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (
+        Index("ix_change_log_txid_seq", "txid", "seq"),
+        Index("ix_change_log_changed_at", "changed_at"),
+    )
+
+
+# Trigger arguments: the logical table name, then the columns to publish.
+# An update that touches no published column is not recorded.
+RECORD_CHANGE_FUNCTION = """
+CREATE OR REPLACE FUNCTION record_change() RETURNS trigger AS $$
+DECLARE
+    published text[];
+    old_row jsonb;
+    delta jsonb;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO change_log (table_name, row_id, operation)
+        VALUES (TG_ARGV[0], OLD.id, 'D');
+        RETURN OLD;
+    END IF;
+    published := TG_ARGV[1:TG_NARGS - 1];
+    IF TG_OP = 'UPDATE' THEN
+        old_row := to_jsonb(OLD);
+    END IF;
+    SELECT jsonb_object_agg(n.key, n.value) INTO delta
+    FROM jsonb_each(to_jsonb(NEW)) AS n
+    WHERE n.key = ANY (published)
+        AND (old_row IS NULL OR old_row -> n.key IS DISTINCT FROM n.value);
+    IF TG_OP = 'UPDATE' AND delta IS NULL THEN
+        RETURN NEW;
+    END IF;
+    INSERT INTO change_log (table_name, row_id, operation, changes)
+    VALUES (TG_ARGV[0], NEW.id, left(TG_OP, 1), delta);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def change_trigger_ddl(table: str) -> str:
+    # TG_TABLE_NAME would name the partition for attendance, so the logical
+    # table name is passed as an argument instead. OR REPLACE keeps repeated
+    # create_all runs idempotent (Postgres 14+) and updates the column list.
+    arguments = ", ".join(f"'{name}'" for name in (table, *PUBLISHED_COLUMNS[table]))
+    return (
+        f"CREATE OR REPLACE TRIGGER {table}_record_change "
+        f"AFTER INSERT OR UPDATE OR DELETE ON {table} "
+        f"FOR EACH ROW EXECUTE FUNCTION record_change({arguments})"
+    )
+
+
+# The triggers reference the tracked tables, so they are installed once the
+# whole schema exists (DB_STARTUP_MODE=create_all; Alembic does the same).
+event.listen(Base.metadata, "after_create", DDL(RECORD_CHANGE_FUNCTION))
+for _table in TRACKED_TABLES:
+    event.listen(Base.metadata, "after_create", DDL(change_trigger_ddl(_table)))
@@ -1,11 +1,13 @@
+from datetime import datetime
+from typing import Optional
+
 from sqlalchemy import (
-    Column,
+    DateTime,
     Integer,
     String,
-    DateTime,
     Text,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.core.database import Base
@@ -14,9 +16,13 @@ from app.core.database import Base
 class CompanyUnit(Base):
     __tablename__ = "company_units"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    unit_name = Column(String(255), unique=True, nullable=False)
-    address = Column(Text)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    unit_name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    address: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
 
-    employees = relationship("Employee", back_populates="work_location")
\ No newline at end of file
+    employees = relationship(
+        "Employee", back_populates="work_location", lazy="raise_on_sql"
+    )
@@ -1,10 +1,12 @@
+from datetime import datetime
+from typing import Optional
+
 from sqlalchemy import (
-    Column,
+    DateTime,
     Integer,
     String,
-    DateTime,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from app.core.database import Base
@@ -13,8 +15,12 @@ from app.core.database import Base
 class Department(Base):
     __tablename__ = "departments"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String(255), unique=True, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
 
-    employees = relationship("Employee", back_populates="department")
\ No newline at end of file
+    employees = relationship(
+        "Employee", back_populates="department", lazy="raise_on_sql"
+    )
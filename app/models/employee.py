@@ -1,69 +1,171 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Optional
+
 from sqlalchemy import (
-    Column,
-    Integer,
-    String,
-    Date,
-    Numeric,
+    DDL,
     Boolean,
-    ForeignKey,
+    Date,
     DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
     Text,
+    event,
+    literal_column,
 )
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import ColumnElement, func
 
 from app.core.database import Base
 
+# Columns most screens need. Covered by `ix_employees_summary` so list and
+# lookup queries selecting only these can be answered by index-only scans.
+SUMMARY_FIELDS = (
+    "id",
+    "employee_id",
+    "first_name",
+    "last_name",
+    "email",
+    "department_id",
+    "designation_id",
+    "is_active",
+)
+
 
 class Employee(Base):
     __tablename__ = "employees"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    employee_id = Column(String(50), unique=True, nullable=False)
-    first_name = Column(String(100), nullable=False)
-    last_name = Column(String(100), nullable=False)
-    email = Column(String(255), unique=True, nullable=False)
-    phone = Column(String(20))
-    profile_image_url = Column(String(512))
-    department_id = Column(Integer, ForeignKey("departments.id"))
-    designation_id = Column(Integer, ForeignKey("designations.id"))
-    manager_id = Column(Integer, ForeignKey("employees.id"))
-    joining_date = Column(Date, nullable=False)
-    probation_period = Column(String(50))
-    work_location_id = Column(Integer, ForeignKey("company_units.id"))
-    job_type_id = Column(Integer, ForeignKey("job_types.id"))
-    shift_timing = Column(String(100))
-    weekly_hours = Column(Numeric(5, 2))
-    annual_leave_total = Column(Integer)
-    sick_leave_total = Column(Integer)
-    casual_leave_total = Column(Integer)
-    date_of_birth = Column(Date)
-    gender = Column(String(20))
-    marital_status = Column(String(20))
-    address = Column(Text)
-    city = Column(String(100))
-    state = Column(String(100))
-    zip_code = Column(String(20))
-    emergency_contact_name = Column(String(200))
-    emergency_contact_phone = Column(String(20))
-    salary = Column(Numeric(12, 2))
-    currency = Column(String(10))
-    pay_frequency = Column(String(50))
-    bank_account = Column(String(100))  # Should be encrypted
-    bank_name = Column(String(100))
-    tax_id = Column(String(100))  # Should be encrypted
-    benefits = Column(JSONB)
-    is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    employee_id: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    first_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    last_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    phone: Mapped[Optional[str]] = mapped_column(String(20))
+    profile_image_url: Mapped[Optional[str]] = mapped_column(String(512))
+    department_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("departments.id")
+    )
+    designation_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("designations.id")
+    )
+    manager_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("employees.id")
+    )
+    joining_date: Mapped[date] = mapped_column(Date, nullable=False)
+    probation_period: Mapped[Optional[str]] = mapped_column(String(50))
+    work_location_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("company_units.id")
+    )
+    job_type_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("job_types.id")
+    )
+    shift_timing: Mapped[Optional[str]] = mapped_column(String(100))
+    weekly_hours: Mapped[Optional[Decimal]] = mapped_column(Numeric(5, 2))
+    annual_leave_total: Mapped[Optional[int]] = mapped_column(Integer)
+    sick_leave_total: Mapped[Optional[int]] = mapped_column(Integer)
+    casual_leave_total: Mapped[Optional[int]] = mapped_column(Integer)
+    leave_policy_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("leave_policies.id")
+    )
+    date_of_birth: Mapped[Optional[date]] = mapped_column(Date)
+    gender: Mapped[Optional[str]] = mapped_column(String(20))
+    marital_status: Mapped[Optional[str]] = mapped_column(String(20))
+    address: Mapped[Optional[str]] = mapped_column(Text)
+    city: Mapped[Optional[str]] = mapped_column(String(100))
+    state: Mapped[Optional[str]] = mapped_column(String(100))
+    zip_code: Mapped[Optional[str]] = mapped_column(String(20))
+    emergency_contact_name: Mapped[Optional[str]] = mapped_column(String(200))
+    emergency_contact_phone: Mapped[Optional[str]] = mapped_column(String(20))
+    salary: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 2))
+    currency: Mapped[Optional[str]] = mapped_column(String(10))
+    pay_frequency: Mapped[Optional[str]] = mapped_column(String(50))
+    bank_account: Mapped[Optional[str]] = mapped_column(
+        String(100)
+    )  # Should be encrypted
+    bank_name: Mapped[Optional[str]] = mapped_column(String(100))
+    tax_id: Mapped[Optional[str]] = mapped_column(String(100))  # Should be encrypted
+    benefits: Mapped[Optional[Any]] = mapped_column(JSONB)
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
-    department = relationship("Department", back_populates="employees")
-    designation = relationship("Designation", back_populates="employees")
-    manager = relationship("Employee", remote_side=[id])
-    work_location = relationship("CompanyUnit", back_populates="employees")
-    job_type = relationship("JobType", back_populates="employees")
-    leaves = relationship("Leave", back_populates="employee")
-    attendance_records = relationship("Attendance", back_populates="employee")
\ No newline at end of file
+    # Relationships never lazy-load (AsyncSession cannot do it implicitly);
+    # load them through a profile in app/services/employee_repository.py.
+    department = relationship(
+        "Department", back_populates="employees", lazy="raise_on_sql"
+    )
+    designation = relationship(
+        "Designation", back_populates="employees", lazy="raise_on_sql"
+    )
+    manager = relationship("Employee", remote_side=[id], lazy="raise_on_sql")
+    work_location = relationship(
+        "CompanyUnit", back_populates="employees", lazy="raise_on_sql"
+    )
+    job_type = relationship("JobType", back_populates="employees", lazy="raise_on_sql")
+    leave_policy = relationship("LeavePolicy", lazy="raise_on_sql")
+    leaves = relationship(
+        "Leave",
+        back_populates="employee",
+        foreign_keys="Leave.employee_id",
+        lazy="raise_on_sql",
+    )
+    attendance_records = relationship(
+        "Attendance", back_populates="employee", lazy="raise_on_sql"
+    )
+
+    __table_args__ = (
+        # Reporting-hierarchy walks (org chart, manager dashboards).
+        Index("ix_employees_manager_id", "manager_id"),
+        Index(
+            "ix_employees_summary", "id", postgresql_include=list(SUMMARY_FIELDS[1:])
+        ),
+        # Keyset pagination on `id` combined with the directory filters.
+        Index(
+            "ix_employees_department_id_id",
+            "department_id",
+            "id",
+            postgresql_include=[
+                name for name in SUMMARY_FIELDS[1:] if name != "department_id"
+            ],
+        ),
+        Index("ix_employees_designation_id_id", "designation_id", "id"),
+        Index("ix_employees_work_location_id_id", "work_location_id", "id"),
+        # Incremental refresh of the in-memory search index.
+        Index("ix_employees_updated_at", "updated_at"),
+    )
+
+
+def search_document() -> ColumnElement[str]:
+    """Lower-cased text searched by the `pg_trgm` typeahead fallback."""
+    space: ColumnElement[str] = literal_column("' '")
+    return func.lower(
+        Employee.first_name
+        + space
+        + Employee.last_name
+        + space
+        + Employee.email
+        + space
+        + Employee.employee_id
+    )
+
+
+Index(
+    "ix_employees_search_trgm",
+    search_document().label("search_document"),
+    postgresql_using="gin",
+    postgresql_ops={"search_document": "gin_trgm_ops"},
+)
+
+event.listen(
+    Employee.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
@@ -1,30 +1,109 @@
+from datetime import date, datetime
+from typing import Any, Optional
+
 from sqlalchemy import (
-    Column,
-    Integer,
-    String,
+    DDL,
     Date,
-    ForeignKey,
     DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
     Text,
+    event,
+    literal_column,
+    text,
 )
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import ColumnElement, func
+from sqlalchemy.sql.elements import TextClause
 
 from app.core.database import Base
 
 
+class LeaveStatus:
+    PENDING = "Pending"
+    APPROVED = "Approved"
+    REJECTED = "Rejected"
+    CANCELLED = "Cancelled"
+
+    # Statuses that reserve the employee's days.
+    ACTIVE = (PENDING, APPROVED)
+
+
+def leave_period(start_date: Any, end_date: Any) -> ColumnElement[Any]:
+    """Inclusive `daterange` over two date expressions."""
+    return func.daterange(start_date, end_date, literal_column("'[]'"))
+
+
+def active_leave_clause() -> TextClause:
+    """Status filter matching `ex_leaves_employee_period` so its index applies.
+
+    Rendered inline rather than as bind parameters: the planner can only use a
+    partial index when it can prove the query's predicate implies the index's.
+    """
+    return text("leaves.status IN ('Pending', 'Approved')")
+
+
+def approved_leave_clause() -> TextClause:
+    return text("leaves.status = 'Approved'")
+
+
 class Leave(Base):
     __tablename__ = "leaves"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False)
-    leave_type = Column(String(50))
-    start_date = Column(Date, nullable=False)
-    end_date = Column(Date, nullable=False)
-    reason = Column(Text)
-    status = Column(String(50), default="Pending")
-    approved_by_id = Column(Integer, ForeignKey("employees.id"))
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-
-    employee = relationship("Employee", back_populates="leaves", foreign_keys=[employee_id])
-    approver = relationship("Employee", foreign_keys=[approved_by_id])
\ No newline at end of file
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    employee_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("employees.id"), nullable=False
+    )
+    leave_type: Mapped[Optional[str]] = mapped_column(String(50))
+    start_date: Mapped[date] = mapped_column(Date, nullable=False)
+    end_date: Mapped[date] = mapped_column(Date, nullable=False)
+    reason: Mapped[Optional[str]] = mapped_column(Text)
+    status: Mapped[Optional[str]] = mapped_column(
+        String(50), default=LeaveStatus.PENDING
+    )
+    approved_by_id: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("employees.id")
+    )
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    employee = relationship(
+        "Employee",
+        back_populates="leaves",
+        foreign_keys=[employee_id],
+        lazy="raise_on_sql",
+    )
+    approver = relationship(
+        "Employee", foreign_keys=[approved_by_id], lazy="raise_on_sql"
+    )
+
+    __table_args__ = (
+        # No two pending/approved leaves of one employee may overlap. The
+        # GiST index behind the constraint also serves range-overlap queries.
+        ExcludeConstraint(
+            (employee_id, "="),
+            (leave_period(start_date, end_date), "&&"),
+            name="ex_leaves_employee_period",
+            using="gist",
+            where=text("status IN ('Pending', 'Approved')"),
+        ),
+        # Employee leave history, newest first.
+        Index("ix_leaves_employee_id_start_date", "employee_id", "start_date"),
+        # Pending-approval queue paged on id.
+        Index("ix_leaves_status_id", "status", "id"),
+    )
+
+
+# `employee_id WITH =` inside a GiST constraint needs btree_gist.
+event.listen(
+    Leave.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist"),
+)
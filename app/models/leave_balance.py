@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Integer,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class LeaveBalance(Base):
+    __tablename__ = "leave_balances"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    employee_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("employees.id"), nullable=False
+    )
+    leave_type_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("leave_types.id"), nullable=False
+    )
+    year: Mapped[int] = mapped_column(Integer, nullable=False)
+    allocated: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    used: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    employee = relationship("Employee", lazy="raise_on_sql")
+    leave_type = relationship("LeaveType", lazy="raise_on_sql")
+
+    __table_args__ = (
+        UniqueConstraint(
+            "employee_id",
+            "leave_type_id",
+            "year",
+            name="uq_leave_balance_employee_type_year",
+        ),
+    )
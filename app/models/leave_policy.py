@@ -1,10 +1,13 @@
+from datetime import datetime
+from typing import Any, Optional
+
 from sqlalchemy import (
-    Column,
+    DateTime,
     Integer,
     String,
-    DateTime,
 )
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from app.core.database import Base
@@ -13,7 +16,12 @@ from app.core.database import Base
 class LeavePolicy(Base):
     __tablename__ = "leave_policies"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    policy_name = Column(String(150), unique=True, nullable=False)
-    details = Column(JSONB)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    policy_name: Mapped[str] = mapped_column(String(150), unique=True, nullable=False)
+    details: Mapped[Optional[Any]] = mapped_column(JSONB)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
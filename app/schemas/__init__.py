@@ -1,17 +1,38 @@
-from .employee import Employee, EmployeeCreate, EmployeeUpdate
+from .attendance import Attendance, AttendanceCreate
+from .background_job import BackgroundJob, BackgroundJobCreate
 from .company_unit import CompanyUnit, CompanyUnitCreate
 from .department import Department, DepartmentCreate
 from .designation import Designation, DesignationCreate
+from .employee import (
+    Employee,
+    EmployeeCreate,
+    EmployeeDirectoryEntry,
+    EmployeeLeaveProfile,
+    EmployeePayroll,
+    EmployeeProfile,
+    EmployeeSummary,
+    EmployeeUpdate,
+)
 from .job_type import JobType, JobTypeCreate
 from .leave import Leave, LeaveCreate
-from .attendance import Attendance, AttendanceCreate
+from .leave_balance import LeaveBalance
+from .leave_policy import (
+    LeavePolicy,
+    LeavePolicyCreate,
+    LeavePolicyDetails,
+    LeavePolicySimulation,
+)
 from .leave_type import LeaveType, LeaveTypeCreate
-from .leave_policy import LeavePolicy, LeavePolicyCreate
 
 __all__ = [
     "Employee",
     "EmployeeCreate",
     "EmployeeUpdate",
+    "EmployeeSummary",
+    "EmployeeDirectoryEntry",
+    "EmployeeProfile",
+    "EmployeePayroll",
+    "EmployeeLeaveProfile",
     "CompanyUnit",
     "CompanyUnitCreate",
     "Department",
@@ -28,4 +49,9 @@ __all__ = [
     "LeaveTypeCreate",
     "LeavePolicy",
     "LeavePolicyCreate",
-]
\ No newline at end of file
+    "LeavePolicyDetails",
+    "LeavePolicySimulation",
+    "LeaveBalance",
+    "BackgroundJob",
+    "BackgroundJobCreate",
+]
@@ -1,13 +1,17 @@
-from pydantic import BaseModel, Field
-from typing import Optional
-from datetime import date
+from datetime import date, datetime
+from typing import List, Literal, Optional
+from zoneinfo import ZoneInfo
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from app.core.settings import settings
 
 
 class AttendanceBase(BaseModel):
     employee_id: int
     date: date
-    check_in: Optional[date] = None
-    check_out: Optional[date] = None
+    check_in: Optional[datetime] = None
+    check_out: Optional[datetime] = None
     status: str = Field(..., max_length=50)
     notes: Optional[str] = None
 
@@ -19,5 +23,23 @@ class AttendanceCreate(AttendanceBase):
 class Attendance(AttendanceBase):
     id: int
 
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AttendanceEvent(BaseModel):
+    employee_id: int
+    event_type: Literal["check_in", "check_out"]
+    timestamp: datetime
+
+    @field_validator("timestamp")
+    @classmethod
+    def localise_timestamp(cls, value: datetime) -> datetime:
+        # Naive timestamps are read in the organisation's timezone so every
+        # event in a shared batch compares as an aware datetime.
+        if value.tzinfo is None:
+            return value.replace(tzinfo=ZoneInfo(settings.timezone))
+        return value
+
+
+class AttendanceEventBatch(BaseModel):
+    events: List[AttendanceEvent] = Field(..., min_length=1, max_length=10000)
@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BackgroundJobCreate(BaseModel):
+    kind: str = Field(..., max_length=100)
+    payload: Dict[str, Any] = Field(default_factory=dict)
+    max_attempts: int = Field(3, ge=1, le=10)
+
+
+class BackgroundJob(BaseModel):
+    id: int
+    kind: str
+    status: str
+    payload: Dict[str, Any]
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    progress: float
+    progress_message: Optional[str] = None
+    attempts: int
+    max_attempts: int
+    run_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
 from typing import Optional
 
+from pydantic import BaseModel, ConfigDict, Field
+
 
 class CompanyUnitBase(BaseModel):
     unit_name: str = Field(..., max_length=255)
@@ -14,5 +15,4 @@ class CompanyUnitCreate(CompanyUnitBase):
 class CompanyUnit(CompanyUnitBase):
     id: int
 
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DepartmentBase(BaseModel):
@@ -12,5 +12,4 @@ class DepartmentCreate(DepartmentBase):
 class Department(DepartmentBase):
     id: int
 
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
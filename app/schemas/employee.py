@@ -1,6 +1,14 @@
-from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
 from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+from .company_unit import CompanyUnit
+from .department import Department
+from .designation import Designation
+from .job_type import JobType
+from .leave import Leave
+from .leave_policy import LeavePolicy
 
 
 class EmployeeBase(BaseModel):
@@ -22,6 +30,7 @@ class EmployeeBase(BaseModel):
     annual_leave_total: Optional[int] = None
     sick_leave_total: Optional[int] = None
     casual_leave_total: Optional[int] = None
+    leave_policy_id: Optional[int] = None
     date_of_birth: Optional[date] = None
     gender: Optional[str] = Field(None, max_length=20)
     marital_status: Optional[str] = Field(None, max_length=20)
@@ -52,5 +61,59 @@ class EmployeeUpdate(EmployeeBase):
 class Employee(EmployeeBase):
     id: int
 
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class EmployeeSummary(BaseModel):
+    """Slim read model for lists, typeahead and lookups; see `SUMMARY_FIELDS`."""
+
+    id: int
+    employee_id: str
+    first_name: str
+    last_name: str
+    email: str
+    department_id: Optional[int] = None
+    designation_id: Optional[int] = None
+    is_active: Optional[bool] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Read models of the load profiles in app/services/employee_repository.py.
+# Each only declares relationships its profile loads.
+
+
+class EmployeeDirectoryEntry(EmployeeSummary):
+    department: Optional[Department] = None
+    designation: Optional[Designation] = None
+
+
+class EmployeeProfile(Employee):
+    department: Optional[Department] = None
+    designation: Optional[Designation] = None
+    work_location: Optional[CompanyUnit] = None
+    job_type: Optional[JobType] = None
+    leave_policy: Optional[LeavePolicy] = None
+    manager: Optional[EmployeeSummary] = None
+
+
+class EmployeePayroll(BaseModel):
+    id: int
+    employee_id: str
+    first_name: str
+    last_name: str
+    department: Optional[Department] = None
+    weekly_hours: Optional[float] = None
+    salary: Optional[float] = None
+    currency: Optional[str] = None
+    pay_frequency: Optional[str] = None
+    bank_account: Optional[str] = None
+    bank_name: Optional[str] = None
+    tax_id: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class EmployeeLeaveProfile(EmployeeSummary):
+    leave_policy: Optional[LeavePolicy] = None
+    leaves: List[Leave] = []
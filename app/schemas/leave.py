@@ -1,6 +1,7 @@
-from pydantic import BaseModel, Field
-from typing import Optional
 from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class LeaveBase(BaseModel):
@@ -20,5 +21,4 @@ class LeaveCreate(LeaveBase):
 class Leave(LeaveBase):
     id: int
 
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
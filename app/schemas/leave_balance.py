@@ -0,0 +1,13 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class LeaveBalance(BaseModel):
+    employee_id: int
+    leave_type_id: int
+    leave_type: str
+    year: int
+    allocated: int
+    used: int
+    remaining: int
+
+    model_config = ConfigDict(from_attributes=True)
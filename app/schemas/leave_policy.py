@@ -1,9 +1,42 @@
-from pydantic import BaseModel, Field
+from datetime import date
+from typing import Any, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class LeaveAllocation(BaseModel):
+    leave_type_id: int
+    days_allocated: int = Field(..., ge=0)
+    # Days earned per month of service; the yearly total is capped at days_allocated.
+    accrual_rate: Optional[float] = Field(None, ge=0)
+    carry_forward_cap: int = Field(0, ge=0)
+    max_consecutive_days: Optional[int] = Field(None, ge=1)
+    allowed_during_probation: bool = True
+
+
+class BlackoutPeriod(BaseModel):
+    start_date: date
+    end_date: date
+    reason: Optional[str] = None
+
+
+class LeavePolicyDetails(BaseModel):
+    allocations: List[LeaveAllocation] = []
+    max_consecutive_days: Optional[int] = Field(None, ge=1)
+    blackout_dates: List[BlackoutPeriod] = []
+
+    @model_validator(mode="before")
+    @classmethod
+    def accept_allocation_list(cls, value: Any) -> Any:
+        # Early policies stored only the list of allocations.
+        if isinstance(value, list):
+            return {"allocations": value}
+        return value
 
 
 class LeavePolicyBase(BaseModel):
     policy_name: str = Field(..., max_length=150)
-    details: dict
+    details: LeavePolicyDetails
 
 
 class LeavePolicyCreate(LeavePolicyBase):
@@ -13,5 +46,9 @@ class LeavePolicyCreate(LeavePolicyBase):
 class LeavePolicy(LeavePolicyBase):
     id: int
 
-    class Config:
-        orm_mode = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LeavePolicySimulation(BaseModel):
+    details: LeavePolicyDetails
+    year: Optional[int] = None
@@ -1,3 +1,4 @@
+# flake8: noqa  (legacy module kept commented out)
 # from openai import OpenAI
 # from app.core.settings import settings
 # import json
@@ -86,20 +87,20 @@
 
 #     # -----------------------------GET WARMUP EMAIL ----------------------------- #
 #     async def get_warmup_email(self, name: str, email: str, role: str, company: str):
-            
+
 #         content_prompt = f"""
 #             Act as a market research expert who is 20+ years experienced in solving tough market research problems in the industry of the company we are mentioning.
 
 #             Craft a concise and compelling cold email without citations to "name": {name},
 #                         "email": {email},
 #                         "role": {role},
-#                         "company": {company}, pitching Consainsights (https://www.consainsights.com/) Market Research services (https://www.consainsights.com/custom-research) respectively to the contact, role, and company mentioned.  
+#                         "company": {company}, pitching Consainsights (https://www.consainsights.com/) Market Research services (https://www.consainsights.com/custom-research) respectively to the contact, role, and company mentioned.
 
 #             Ask necessary list of throught-provoking market research pain point addressing questions relevant to the role (measurable objectives - read this book "the science of sales success"), industry(pressing unsolved market research problems), (combined)  along with focusing on most-convincing social proof which is like a promise (not mentioning any company, but just numbers and impact we created for a similar company - no big claims as we are a very small company(keep it realistic))
 
 #             Give the most convenient CTA for contact to get in touch with us back - should be most convenient yet create compulsion to respond back positively
 
-#             The subject line should be brief and attention-grabbing, prominently starting and featuring "Company name." 
+#             The subject line should be brief and attention-grabbing, prominently starting and featuring "Company name."
 
 #             This is for your reference to draft an exceptional offer, but never mention in the email: For creating an exciting offer personalized to this contact and company: refer to $100Mn leads and $100Mn offers by Alex Hormozi
 
@@ -112,7 +113,7 @@
 #             2. High readability score
 #             3. Strict No "—" in email subject line and body
 #             4. Thought leadership content (thought-provoking industry-specific)
-#             5. simple yet understandable language (class 3 standard) 
+#             5. simple yet understandable language (class 3 standard)
 #             6. Very humanized content
 #             7. Do not introduce - straight away get to the point
 #         """
@@ -145,7 +146,7 @@
 
 #             Apply these styling rules:
 #             - Use 14px Georgia font
-#             - Black text (#000000) 
+#             - Black text (#000000)
 #             - Basic paragraph tags and line breaks
 #             - Simple <strong> tags for emphasis
 #             - Black underlined links
@@ -0,0 +1,96 @@
+"""
+Streaming export of attendance records.
+
+Rows are read through a server-side cursor in fixed-size batches and encoded
+batch by batch, so memory stays flat regardless of the exported date range.
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Optional, Sequence
+
+from sqlalchemy import select
+
+from app.core.database import read_sessionmaker
+from app.models import Attendance
+
+EXPORT_BATCH_SIZE = 5000
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+EXPORT_COLUMNS = (
+    "id",
+    "employee_id",
+    "date",
+    "check_in",
+    "check_out",
+    "status",
+    "notes",
+)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+async def iter_attendance_batches(
+    start_date: date,
+    end_date: date,
+    employee_id: Optional[int] = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[Sequence[Any]]:
+    """Yield batches of attendance rows for a date range from a server-side cursor."""
+    stmt = (
+        select(*(Attendance.__table__.c[name] for name in EXPORT_COLUMNS))
+        .where(Attendance.date >= start_date, Attendance.date <= end_date)
+        .order_by(Attendance.date, Attendance.employee_id)
+        .execution_options(yield_per=batch_size)
+    )
+    if employee_id is not None:
+        stmt = stmt.where(Attendance.employee_id == employee_id)
+
+    # The session is owned by the generator rather than a request dependency
+    # because the response body is produced after the endpoint has returned.
+    sessionmaker = await read_sessionmaker()
+    async with sessionmaker() as session:
+        result = await session.stream(stmt)
+        async for batch in result.partitions():
+            yield batch
+
+
+async def encode_csv(batches: AsyncIterator[Sequence[Any]]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue().encode()
+    async for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(batch)
+        yield buffer.getvalue().encode()
+
+
+async def encode_ndjson(batches: AsyncIterator[Sequence[Any]]) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_COLUMNS, map(_encode_value, row)))) + "\n"
+            for row in batch
+        ).encode()
+
+
+def export_attendance(
+    start_date: date,
+    end_date: date,
+    fmt: str,
+    employee_id: Optional[int] = None,
+) -> AsyncIterator[bytes]:
+    """Return an async byte stream of attendance rows in the requested format."""
+    batches = iter_attendance_batches(start_date, end_date, employee_id)
+    if fmt == "csv":
+        return encode_csv(batches)
+    return encode_ndjson(batches)
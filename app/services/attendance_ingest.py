@@ -0,0 +1,256 @@
+"""
+Batched check-in/check-out ingestion.
+
+Punch events are coalesced per `(employee_id, date)` and written with one
+`INSERT ... ON CONFLICT ON CONSTRAINT uq_employee_date DO UPDATE` per batch.
+`AttendanceBatcher` groups events from concurrent requests and flushes them
+every `max_events` events or `max_delay_ms` milliseconds, whichever is first.
+Events must fall inside `event_date_window()`, which also bounds the
+partitions a batch can create on demand.
+"""
+
+import asyncio
+import contextvars
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+from loguru import logger
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.database import AsyncSessionLocal
+from app.core.settings import settings
+from app.models import Attendance, Employee
+from app.models.attendance import AttendanceStatus
+from app.schemas.attendance import AttendanceEvent
+from app.services.attendance_partitions import (
+    MISSING_PARTITION_ERROR,
+    ensure_partitions,
+)
+from app.services.dashboard import invalidate_team_dashboards, local_today
+
+# asyncpg accepts at most 32767 bind parameters per statement.
+MAX_BIND_PARAMS = 32767
+
+
+@dataclass
+class BatchResult:
+    rows_written: int = 0
+    unknown_employee_ids: Set[int] = field(default_factory=set)
+
+    def for_events(self, events: Iterable[AttendanceEvent]) -> "BatchResult":
+        """The part of a coalesced batch's result that `events` contributed."""
+        tz = ZoneInfo(settings.timezone)
+        keys = {
+            (event.employee_id, event_date(event.timestamp, tz)) for event in events
+        }
+        unknown = {employee_id for employee_id, _ in keys} & self.unknown_employee_ids
+        return BatchResult(
+            rows_written=sum(
+                1 for employee_id, _ in keys if employee_id not in unknown
+            ),
+            unknown_employee_ids=unknown,
+        )
+
+
+def event_date(timestamp: datetime, tz: ZoneInfo) -> date:
+    """Working day an event belongs to, in the organisation's timezone."""
+    return timestamp.astimezone(tz).date()
+
+
+def event_date_window() -> Tuple[date, date]:
+    """First and last day events may be filed under.
+
+    Back-dated punches are accepted for `ATTENDANCE_BACKDATE_DAYS`; one day
+    ahead allows for reader clocks running fast.
+    """
+    today = local_today()
+    return today - timedelta(days=settings.attendance_backdate_days), today + timedelta(
+        days=1
+    )
+
+
+def events_outside_window(
+    events: Iterable[AttendanceEvent], earliest: date, latest: date
+) -> List[int]:
+    """Indexes of events whose working day falls outside `[earliest, latest]`."""
+    tz = ZoneInfo(settings.timezone)
+    return [
+        index
+        for index, event in enumerate(events)
+        if not earliest <= event_date(event.timestamp, tz) <= latest
+    ]
+
+
+def coalesce_events(events: Iterable[AttendanceEvent]) -> List[Dict]:
+    """Reduce events to one row per `(employee_id, date)`.
+
+    The earliest check-in and the latest check-out of the day win. Rows are
+    returned sorted by key so concurrent batches lock rows in the same order.
+    """
+    tz = ZoneInfo(settings.timezone)
+    rows: Dict[Tuple[int, object], Dict] = {}
+    for event in events:
+        key = (event.employee_id, event_date(event.timestamp, tz))
+        row = rows.setdefault(
+            key,
+            {
+                "employee_id": key[0],
+                "date": key[1],
+                "check_in": None,
+                "check_out": None,
+                "status": AttendanceStatus.PRESENT,
+            },
+        )
+        if event.event_type == "check_in":
+            if row["check_in"] is None or event.timestamp < row["check_in"]:
+                row["check_in"] = event.timestamp
+        elif row["check_out"] is None or event.timestamp > row["check_out"]:
+            row["check_out"] = event.timestamp
+    return [rows[key] for key in sorted(rows)]
+
+
+async def upsert_attendance(session: AsyncSession, rows: List[Dict]) -> None:
+    """Merge coalesced rows into `attendance`.
+
+    LEAST/GREATEST ignore NULLs in Postgres, so an existing check-in is only
+    replaced by an earlier one and an existing check-out by a later one.
+    """
+    if not rows:
+        return
+    batch_size = MAX_BIND_PARAMS // len(rows[0])
+    for start in range(0, len(rows), batch_size):
+        stmt = insert(Attendance).values(rows[start : start + batch_size])
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_employee_date",
+            set_={
+                "check_in": func.least(Attendance.check_in, stmt.excluded.check_in),
+                "check_out": func.greatest(
+                    Attendance.check_out, stmt.excluded.check_out
+                ),
+                "status": func.coalesce(Attendance.status, stmt.excluded.status),
+                # ON CONFLICT updates bypass the ORM's onupdate.
+                "updated_at": func.now(),
+            },
+        )
+        await session.execute(stmt)
+
+
+async def write_events(
+    session: AsyncSession, events: List[AttendanceEvent]
+) -> BatchResult:
+    """Coalesce and upsert a batch of events in a single transaction."""
+    rows = coalesce_events(events)
+    try:
+        await upsert_attendance(session, rows)
+        await session.commit()
+        return BatchResult(rows_written=len(rows))
+    except IntegrityError as e:
+        await session.rollback()
+        if MISSING_PARTITION_ERROR in str(e.orig):
+            # A month nobody has written to yet (back-dated or far-future
+            # punches): create its partition and retry.
+            await ensure_partitions(session, {row["date"] for row in rows})
+            return await write_events(session, events)
+
+    # An unknown employee would otherwise fail the whole batch: drop those
+    # rows and retry once.
+    employee_ids = {row["employee_id"] for row in rows}
+    known = set(
+        (
+            await session.execute(
+                select(Employee.id).where(Employee.id.in_(employee_ids))
+            )
+        ).scalars()
+    )
+    rows = [row for row in rows if row["employee_id"] in known]
+    await upsert_attendance(session, rows)
+    await session.commit()
+    return BatchResult(
+        rows_written=len(rows), unknown_employee_ids=employee_ids - known
+    )
+
+
+class AttendanceBatcher:
+    """Collects events from concurrent callers and writes them in batches."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        max_events: Optional[int] = None,
+        max_delay_ms: Optional[int] = None,
+    ):
+        self.session_factory = session_factory
+        self.max_events = max_events or settings.attendance_batch_max_events
+        self.max_delay = (max_delay_ms or settings.attendance_batch_max_delay_ms) / 1000
+        self._events: List[AttendanceEvent] = []
+        self._future: Optional["asyncio.Future[BatchResult]"] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, events: List[AttendanceEvent]) -> BatchResult:
+        """Queue events and wait until the batch containing them is committed.
+
+        The result only covers the caller's own events, not the other
+        requests coalesced into the same batch.
+        """
+        if not events:
+            return BatchResult()
+        loop = asyncio.get_running_loop()
+        if self._future is None:
+            self._future = loop.create_future()
+            self._timer = loop.call_later(self.max_delay, self._flush_pending)
+        future = self._future
+        self._events.extend(events)
+        if len(self._events) >= self.max_events:
+            self._flush_pending()
+        batch_result = await asyncio.shield(future)
+        return batch_result.for_events(events)
+
+    def _flush_pending(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        events, future = self._events, self._future
+        self._events, self._future = [], None
+        if future is None:
+            return
+        # Run the flush in an empty context: it would otherwise inherit the
+        # request metrics of whichever caller started the batch and charge
+        # the whole batch's queries to that request.
+        task = asyncio.create_task(
+            self._flush(events, future), context=contextvars.Context()
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(
+        self, events: List[AttendanceEvent], future: asyncio.Future
+    ) -> None:
+        try:
+            async with self.session_factory() as session:
+                result = await write_events(session, events)
+                tz = ZoneInfo(settings.timezone)
+                await invalidate_team_dashboards(
+                    session,
+                    {event.employee_id for event in events},
+                    {event_date(event.timestamp, tz) for event in events},
+                )
+        except Exception as e:
+            logger.error(f"Attendance batch of {len(events)} events failed: {str(e)}")
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    async def close(self) -> None:
+        """Flush queued events and wait for in-flight batches."""
+        self._flush_pending()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+attendance_batcher = AttendanceBatcher()
@@ -0,0 +1,150 @@
+"""
+Monthly range partitions of the `attendance` table.
+
+`attendance` is partitioned by `date`, one partition per calendar month
+named `attendance_pYYYYMM`. `maintain_partitions` creates partitions for
+the coming months and detaches partitions older than the retention window,
+moving them to the archive schema where they can be dumped and dropped
+without touching the live table. Run it nightly (`manage-attendance-partitions`
+CLI command or the `maintain-attendance-partitions` job); ingestion also
+creates a missing month on demand.
+
+Queries only benefit from pruning when they filter on `attendance.date`
+with plain comparisons (`date >= :start AND date < :end`), not through an
+expression such as `date_trunc('month', date)`.
+
+Partitions are created under a transaction-level advisory lock, so concurrent
+`CREATE TABLE IF NOT EXISTS ... PARTITION OF` calls for the same month
+serialise instead of failing with a duplicate table error.
+"""
+
+import re
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.settings import settings
+from app.services.dashboard import local_today
+
+PARENT_TABLE = "attendance"
+# Advisory lock key serialising partition DDL across sessions.
+PARTITION_LOCK_KEY = "attendance_partitions"
+# Raised by Postgres when a row's date has no partition.
+MISSING_PARTITION_ERROR = "no partition of relation"
+
+# Upper bound in pg_get_expr output: FOR VALUES FROM ('2025-01-01') TO ('2025-02-01')
+_UPPER_BOUND = re.compile(r"\bTO \('(\d{4}-\d{2}-\d{2})'\)")
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(day: date, months: int) -> date:
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_p{month.year}{month.month:02d}"
+
+
+def upper_bound(bounds: str) -> Optional[date]:
+    """Exclusive upper date of a partition, or None for DEFAULT/MAXVALUE bounds."""
+    match = _UPPER_BOUND.search(bounds or "")
+    return date.fromisoformat(match.group(1)) if match else None
+
+
+async def create_partition(session: AsyncSession, month: date) -> None:
+    month = month_start(month)
+    # Held until the caller commits; re-acquiring it in the same transaction is a no-op.
+    await session.execute(
+        text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+        {"key": PARTITION_LOCK_KEY},
+    )
+    await session.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {partition_name(month)} "
+            f"PARTITION OF {PARENT_TABLE} "
+            f"FOR VALUES FROM ('{month.isoformat()}') "
+            f"TO ('{add_months(month, 1).isoformat()}')"
+        )
+    )
+
+
+async def ensure_partitions(session: AsyncSession, days: Iterable[date]) -> None:
+    """Create the partitions covering `days` and commit."""
+    for month in sorted({month_start(day) for day in days}):
+        await create_partition(session, month)
+    await session.commit()
+
+
+async def list_partitions(session: AsyncSession) -> List[Dict[str, str]]:
+    result = await session.execute(
+        text(
+            "SELECT child.relname AS name, "
+            "pg_get_expr(child.relpartbound, child.oid) AS bounds "
+            "FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = CAST(:parent AS regclass) "
+            "ORDER BY child.relname"
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    return [dict(row) for row in result.mappings()]
+
+
+async def maintain_partitions(
+    engine: AsyncEngine, today: Optional[date] = None
+) -> Dict[str, List[str]]:
+    """Create upcoming partitions and archive those past the retention window."""
+    today = today or local_today()
+    current = month_start(today)
+    created: List[str] = []
+    detached: List[str] = []
+
+    async with AsyncSession(engine) as session:
+        partitions = await list_partitions(session)
+        existing = {partition["name"] for partition in partitions}
+        for offset in range(0, settings.attendance_partitions_ahead + 1):
+            month = add_months(current, offset)
+            if partition_name(month) not in existing:
+                await create_partition(session, month)
+                created.append(partition_name(month))
+        await session.commit()
+
+    if settings.attendance_retention_months > 0:
+        cutoff = add_months(current, -settings.attendance_retention_months)
+        schema = settings.attendance_archive_schema
+        # Judged by the bounds, not the name: a partition created by hand
+        # under another name is still archived once it falls out of range.
+        old = []
+        for partition in partitions:
+            upper = upper_bound(partition["bounds"])
+            if upper is not None and upper <= cutoff:
+                old.append(partition["name"])
+        # DETACH ... CONCURRENTLY cannot run inside a transaction block.
+        async with engine.connect() as connection:
+            connection = await connection.execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+            if old:
+                await connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+            for name in old:
+                await connection.execute(
+                    text(
+                        f"ALTER TABLE {PARENT_TABLE} "
+                        f"DETACH PARTITION {name} CONCURRENTLY"
+                    )
+                )
+                await connection.execute(
+                    text(f"ALTER TABLE {name} SET SCHEMA {schema}")
+                )
+                detached.append(f"{schema}.{name}")
+
+    if created or detached:
+        logger.info(f"Attendance partitions created: {created}, archived: {detached}")
+    return {"created": created, "archived": detached}
@@ -0,0 +1,370 @@
+"""
+Vectorised monthly attendance and payroll-hours aggregation.
+
+Attendance and leave data for the month are fetched as columnar arrays
+(`array_agg` in Postgres, one row per query) and reduced per employee with
+numpy `bincount` passes instead of looping over ORM objects.
+
+Metrics per employee:
+    working_days   working days from joining (or the 1st) up to yesterday
+    days_present   days with a check-in
+    late_days      check-ins after the shift start plus the grace period,
+                   by the same rule as the manager dashboard (`is_late`)
+    hours_worked   sum of check-out minus check-in
+    overtime_hours hours worked beyond `weekly_hours` prorated to working_days
+    leave_days     approved leave on those working days
+    absent_days    those working days with neither attendance nor approved leave
+
+Today is left out of the working days until it is over, so nobody is absent
+for a day they may still check in on.
+
+Fetching (`fetch_monthly_inputs`) and computing (`compute_monthly_metrics`)
+are separate so the CPU-bound half can run in the report process pool on
+picklable inputs, one slice of employees at a time.
+"""
+
+import csv
+import io
+from dataclasses import dataclass, replace
+from datetime import date, timedelta
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import ColumnElement, Float, Select, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.process_pool import report_pool
+from app.core.settings import settings
+from app.models import Attendance, Employee, Leave
+from app.models.leave import approved_leave_clause
+from app.services.dashboard import local_today
+from app.services.shifts import FALLBACK_SHIFT_START, is_late, parse_shift_start
+
+SECONDS_PER_DAY = 86400
+WORKING_DAYS_PER_WEEK = 5
+
+
+def month_bounds(year: int, month: int) -> Tuple[date, date]:
+    start = date(year, month, 1)
+    end = date(year + month // 12, month % 12 + 1, 1)
+    return start, end
+
+
+def _local_epoch(column: Any) -> ColumnElement[float]:
+    """Epoch seconds of a timestamptz column in the organisation's timezone."""
+    return cast(func.extract("epoch", func.timezone(settings.timezone, column)), Float)
+
+
+async def _fetch_columns(
+    session: AsyncSession, stmt: Select[Any], count: int
+) -> List[np.ndarray]:
+    row = (await session.execute(stmt)).one()
+    return [
+        np.asarray(row[i] if row[i] is not None else [], dtype=object)
+        for i in range(count)
+    ]
+
+
+REPORT_COLUMNS = (
+    "employee_id",
+    "employee_code",
+    "first_name",
+    "last_name",
+    "department_id",
+    "working_days",
+    "days_present",
+    "late_days",
+    "hours_worked",
+    "overtime_hours",
+    "leave_days",
+    "absent_days",
+)
+
+# (id, employee_id, first_name, last_name, department_id, shift_timing,
+#  weekly_hours, joining_date)
+EmployeeRow = Tuple[
+    int, str, str, str, Optional[int], Optional[str], Optional[float], date
+]
+
+
+@dataclass
+class MonthlyInputs:
+    """Everything the metrics need, as plain picklable values sorted by employee id."""
+
+    month_start: date
+    month_end: date
+    today: date
+    employees: List[EmployeeRow]
+    attendance_employee: np.ndarray
+    attendance_day: np.ndarray
+    check_in: np.ndarray
+    check_out: np.ndarray
+    leave_employee: np.ndarray
+    leave_start: np.ndarray
+    leave_end: np.ndarray
+    default_shift_start: str
+    late_grace_minutes: int
+
+    def slices(self, size: int) -> Iterator["MonthlyInputs"]:
+        """Split by contiguous employee ranges, each carrying only its own rows."""
+        # Sort rows by employee once so every slice is a pair of binary searches.
+        attendance_order = np.argsort(self.attendance_employee, kind="stable")
+        attendance_employee = self.attendance_employee[attendance_order]
+        leave_order = np.argsort(self.leave_employee, kind="stable")
+        leave_employee = self.leave_employee[leave_order]
+        for start in range(0, len(self.employees), size):
+            employees = self.employees[start : start + size]
+            low, high = employees[0][0], employees[-1][0]
+            attended = attendance_order[
+                np.searchsorted(
+                    attendance_employee, low, side="left"
+                ) : np.searchsorted(attendance_employee, high, side="right")
+            ]
+            on_leave = leave_order[
+                np.searchsorted(leave_employee, low, side="left") : np.searchsorted(
+                    leave_employee, high, side="right"
+                )
+            ]
+            yield replace(
+                self,
+                employees=employees,
+                attendance_employee=self.attendance_employee[attended],
+                attendance_day=self.attendance_day[attended],
+                check_in=self.check_in[attended],
+                check_out=self.check_out[attended],
+                leave_employee=self.leave_employee[on_leave],
+                leave_start=self.leave_start[on_leave],
+                leave_end=self.leave_end[on_leave],
+            )
+
+
+async def fetch_monthly_inputs(
+    session: AsyncSession,
+    year: int,
+    month: int,
+    department_id: Optional[int] = None,
+) -> MonthlyInputs:
+    """Load employees, attendance and approved leave for a month as arrays."""
+    month_start, month_end = month_bounds(year, month)
+
+    employees_stmt = (
+        select(
+            Employee.id,
+            Employee.employee_id,
+            Employee.first_name,
+            Employee.last_name,
+            Employee.department_id,
+            Employee.shift_timing,
+            Employee.weekly_hours,
+            Employee.joining_date,
+        )
+        .where(Employee.is_active.is_(True))
+        .order_by(Employee.id)
+    )
+    if department_id is not None:
+        employees_stmt = employees_stmt.where(Employee.department_id == department_id)
+    employees = [
+        (
+            e.id,
+            e.employee_id,
+            e.first_name,
+            e.last_name,
+            e.department_id,
+            e.shift_timing,
+            float(e.weekly_hours) if e.weekly_hours is not None else None,
+            e.joining_date,
+        )
+        for e in (await session.execute(employees_stmt)).all()
+    ]
+
+    in_department = Employee.department_id == department_id
+    attendance_stmt = select(
+        func.array_agg(Attendance.employee_id),
+        func.array_agg(Attendance.date),
+        func.array_agg(_local_epoch(Attendance.check_in)),
+        func.array_agg(_local_epoch(Attendance.check_out)),
+    ).where(Attendance.date >= month_start, Attendance.date < month_end)
+    if department_id is not None:
+        attendance_stmt = attendance_stmt.where(
+            Attendance.employee_id.in_(select(Employee.id).where(in_department))
+        )
+    attendance_employee, attendance_day, check_in, check_out = await _fetch_columns(
+        session, attendance_stmt, 4
+    )
+
+    leave_stmt = select(
+        func.array_agg(Leave.employee_id),
+        func.array_agg(func.greatest(Leave.start_date, month_start)),
+        func.array_agg(func.least(Leave.end_date, month_end - timedelta(days=1))),
+    ).where(
+        approved_leave_clause(),
+        Leave.start_date < month_end,
+        Leave.end_date >= month_start,
+    )
+    if department_id is not None:
+        leave_stmt = leave_stmt.where(
+            Leave.employee_id.in_(select(Employee.id).where(in_department))
+        )
+    leave_employee, leave_start, leave_end = await _fetch_columns(
+        session, leave_stmt, 3
+    )
+
+    return MonthlyInputs(
+        month_start=month_start,
+        month_end=month_end,
+        today=local_today(),
+        employees=employees,
+        attendance_employee=attendance_employee.astype(np.int64),
+        attendance_day=attendance_day.astype("datetime64[D]"),
+        check_in=check_in.astype(np.float64),
+        check_out=check_out.astype(np.float64),
+        leave_employee=leave_employee.astype(np.int64),
+        leave_start=leave_start.astype("datetime64[D]"),
+        leave_end=leave_end.astype("datetime64[D]"),
+        default_shift_start=settings.default_shift_start,
+        late_grace_minutes=settings.late_grace_minutes,
+    )
+
+
+def compute_monthly_metrics(inputs: MonthlyInputs) -> List[Dict[str, Any]]:
+    """Per-employee metrics; pure CPU work, safe to run in a worker process."""
+    employees = inputs.employees
+    if not employees:
+        return []
+
+    ids = np.fromiter((e[0] for e in employees), dtype=np.int64, count=len(employees))
+    n = len(ids)
+
+    # Shift start per employee: parse each distinct shift string once.
+    default_start = (
+        parse_shift_start(inputs.default_shift_start) or FALLBACK_SHIFT_START
+    )
+    shift_starts = {
+        shift: parse_shift_start(shift) for shift in {e[5] for e in employees}
+    }
+    shift_start = np.fromiter(
+        ((shift_starts[e[5]] or default_start) for e in employees),
+        dtype=np.float64,
+        count=n,
+    )
+    weekly_hours = np.fromiter(
+        (e[6] if e[6] is not None else np.nan for e in employees),
+        dtype=np.float64,
+        count=n,
+    )
+
+    # Each employee's working days run from joining (or the 1st of the month)
+    # up to yesterday (or the end of the month).
+    window_start = np.maximum(
+        np.array([e[7] for e in employees], dtype="datetime64[D]"),
+        np.datetime64(inputs.month_start, "D"),
+    )
+    window_end = np.maximum(
+        window_start, np.datetime64(min(inputs.month_end, inputs.today), "D")
+    )
+    working_days = np.busday_count(window_start, window_end)
+    days_present: np.ndarray = np.zeros(n)
+    late_days: np.ndarray = np.zeros(n)
+    hours_worked: np.ndarray = np.zeros(n)
+    present_working_days: np.ndarray = np.zeros(n)
+
+    if inputs.attendance_employee.size:
+        index = np.searchsorted(ids, inputs.attendance_employee)
+        known = (index < n) & (
+            ids[np.minimum(index, n - 1)] == inputs.attendance_employee
+        )
+        index = index[known]
+        days = inputs.attendance_day[known]
+        check_in = inputs.check_in[known]
+        check_out = inputs.check_out[known]
+
+        present = ~np.isnan(check_in)
+        late = present & is_late(
+            np.mod(check_in, SECONDS_PER_DAY),
+            shift_start[index],
+            inputs.late_grace_minutes,
+        )
+        worked = np.where(
+            present & ~np.isnan(check_out), (check_out - check_in) / 3600, 0.0
+        )
+        worked = np.clip(worked, 0, None)
+
+        days_present = np.bincount(index, weights=present, minlength=n)
+        late_days = np.bincount(index, weights=late, minlength=n)
+        hours_worked = np.bincount(index, weights=worked, minlength=n)
+        counted = (days >= window_start[index]) & (days < window_end[index])
+        present_working_days = np.bincount(
+            index, weights=present & np.is_busday(days) & counted, minlength=n
+        )
+
+    leave_days: np.ndarray = np.zeros(n)
+    if inputs.leave_employee.size:
+        leave_index = np.searchsorted(ids, inputs.leave_employee)
+        known = (leave_index < n) & (
+            ids[np.minimum(leave_index, n - 1)] == inputs.leave_employee
+        )
+        leave_index = leave_index[known]
+        starts = np.maximum(inputs.leave_start[known], window_start[leave_index])
+        ends = np.minimum(
+            inputs.leave_end[known] + np.timedelta64(1, "D"), window_end[leave_index]
+        )
+        leave_days = np.bincount(
+            leave_index,
+            weights=np.busday_count(starts, np.maximum(starts, ends)),
+            minlength=n,
+        )
+
+    expected_hours = weekly_hours * working_days / WORKING_DAYS_PER_WEEK
+    overtime = np.where(
+        np.isnan(expected_hours), 0.0, np.clip(hours_worked - expected_hours, 0, None)
+    )
+    absent = np.clip(working_days - present_working_days - leave_days, 0, None)
+
+    return [
+        {
+            "employee_id": employee[0],
+            "employee_code": employee[1],
+            "first_name": employee[2],
+            "last_name": employee[3],
+            "department_id": employee[4],
+            "working_days": int(working_days[i]),
+            "days_present": int(days_present[i]),
+            "late_days": int(late_days[i]),
+            "hours_worked": round(float(hours_worked[i]), 2),
+            "overtime_hours": round(float(overtime[i]), 2),
+            "leave_days": int(leave_days[i]),
+            "absent_days": int(absent[i]),
+        }
+        for i, employee in enumerate(employees)
+    ]
+
+
+def render_monthly_csv(inputs: MonthlyInputs) -> bytes:
+    """Compute and render one slice of the report as CSV rows (no header)."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=REPORT_COLUMNS)
+    writer.writerows(compute_monthly_metrics(inputs))
+    return buffer.getvalue().encode()
+
+
+async def stream_monthly_csv(inputs: MonthlyInputs) -> AsyncIterator[bytes]:
+    """Render the report in the process pool, yielding CSV slices in order."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(REPORT_COLUMNS)
+    yield buffer.getvalue().encode()
+    async for chunk in report_pool.map_ordered(
+        render_monthly_csv, inputs.slices(settings.report_slice_employees)
+    ):
+        yield chunk
+
+
+async def monthly_attendance_report(
+    session: AsyncSession,
+    year: int,
+    month: int,
+    department_id: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Compute monthly attendance metrics for every active employee in scope."""
+    return compute_monthly_metrics(
+        await fetch_monthly_inputs(session, year, month, department_id)
+    )
@@ -0,0 +1,236 @@
+"""
+Change-data feed over `change_log` for downstream systems.
+
+Triggers on `employees`, `leaves` and `attendance` append one row per insert,
+update or delete (see app/models/change_log.py). Consumers keep an opaque
+cursor and pull only what changed since it.
+
+Sequence numbers are taken before commit, so ordering by `seq` alone could
+skip a change whose transaction commits after a later one was served. The
+feed is ordered by `(txid, seq)` instead and only serves transactions older
+than the oldest one still running (`pg_snapshot_xmin`): every such
+transaction has finished, so nothing can appear behind the cursor later. A
+long-running transaction delays the feed until it ends.
+
+`ChangeNotifier` lets long-poll and Server-Sent-Events consumers wait for new
+changes with one cheap poll per worker instead of one per waiting client.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+from sqlalchemy import delete, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from app.core.settings import settings
+from app.models import ChangeLog
+from app.models.change_log import TRACKED_TABLES
+
+START_CURSOR = "0-0"
+
+# Transactions below this id have all committed or rolled back.
+SETTLED_TXID = text("pg_snapshot_xmin(pg_current_snapshot())::text::bigint")
+
+# Rows deleted per statement when pruning, to keep transactions short.
+PRUNE_BATCH_SIZE = 10000
+
+
+def parse_cursor(cursor: Optional[str]) -> Tuple[int, int]:
+    """Decode a `<txid>-<seq>` cursor; None starts from the oldest retained change."""
+    try:
+        txid, seq = (cursor or START_CURSOR).split("-")
+        return int(txid), int(seq)
+    except ValueError:
+        raise ValueError("Invalid change cursor")
+
+
+def format_cursor(txid: int, seq: int) -> str:
+    return f"{txid}-{seq}"
+
+
+async def fetch_changes(
+    session: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = 500,
+    tables: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """Settled changes after `cursor`, oldest first, with the cursor to resume from."""
+    after = parse_cursor(cursor)
+    stmt = (
+        select(
+            ChangeLog.seq,
+            ChangeLog.txid,
+            ChangeLog.table_name,
+            ChangeLog.row_id,
+            ChangeLog.operation,
+            ChangeLog.changes,
+            ChangeLog.changed_at,
+        )
+        .where(
+            tuple_(ChangeLog.txid, ChangeLog.seq) > after, ChangeLog.txid < SETTLED_TXID
+        )
+        .order_by(ChangeLog.txid, ChangeLog.seq)
+        .limit(limit)
+    )
+    if tables:
+        stmt = stmt.where(ChangeLog.table_name.in_(tables))
+    rows = (await session.execute(stmt)).all()
+    changes = [
+        {
+            "seq": row.seq,
+            "table": row.table_name,
+            "id": row.row_id,
+            "op": row.operation,
+            "changes": row.changes,
+            "changed_at": row.changed_at,
+        }
+        for row in rows
+    ]
+    return {
+        "items": changes,
+        "next_cursor": (
+            format_cursor(rows[-1].txid, rows[-1].seq)
+            if rows
+            else format_cursor(*after)
+        ),
+        "has_more": len(rows) == limit,
+    }
+
+
+def validate_tables(tables: Optional[str]) -> Optional[List[str]]:
+    """Turn a comma-separated `tables` parameter into tracked table names."""
+    if not tables:
+        return None
+    requested = [name.strip() for name in tables.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in TRACKED_TABLES]
+    if unknown:
+        raise ValueError(f"Unknown change feed tables: {', '.join(unknown)}")
+    return requested
+
+
+async def read_changes(
+    cursor: Optional[str] = None,
+    limit: int = 500,
+    tables: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    """`fetch_changes` on a short-lived primary session.
+
+    Waiting consumers must not hold a pooled connection between polls, and
+    the settled-transaction bound needs the primary's snapshot.
+    """
+    async with AsyncSessionLocal() as session:
+        return await fetch_changes(session, cursor, limit, tables)
+
+
+async def wait_for_changes(
+    cursor: Optional[str],
+    limit: int,
+    tables: Optional[Sequence[str]],
+    timeout: float,
+) -> Dict[str, Any]:
+    """Long poll: return as soon as changes exist after `cursor` or `timeout` passes."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        page = await read_changes(cursor, limit, tables)
+        remaining = deadline - loop.time()
+        if page["items"] or remaining <= 0:
+            return page
+        await change_notifier.wait(remaining)
+
+
+async def prune_change_log(session: AsyncSession, retention_days: int) -> int:
+    """Delete changes older than the retention window; consumers must keep up."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    deleted = 0
+    while True:
+        batch = (
+            select(ChangeLog.seq)
+            .where(ChangeLog.changed_at < cutoff)
+            .limit(PRUNE_BATCH_SIZE)
+        )
+        result = await session.execute(
+            delete(ChangeLog).where(ChangeLog.seq.in_(batch.scalar_subquery()))
+        )
+        await session.commit()
+        deleted += result.rowcount
+        if result.rowcount < PRUNE_BATCH_SIZE:
+            return deleted
+
+
+class ChangeNotifier:
+    """Wakes waiting feed consumers when the change log may have new settled rows.
+
+    Polls only while someone is waiting. The watermark is the newest settled
+    `(txid, seq)`, the last position the feed can serve, so it moves exactly
+    when consumers have something new to read: a commit alone does not move
+    it until its transaction settles, and an unrelated transaction starting
+    or ending does not move it at all.
+    """
+
+    def __init__(self) -> None:
+        self._waiters = 0
+        self._demand = asyncio.Event()
+        self._changed = asyncio.Event()
+        self._watermark: Optional[Tuple[Any, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait up to `timeout` seconds for a change; False on timeout."""
+        changed = self._changed
+        self._waiters += 1
+        self._demand.set()
+        try:
+            await asyncio.wait_for(changed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._waiters -= 1
+
+    async def _poll(self) -> None:
+        async with AsyncSessionLocal() as session:
+            newest = (
+                await session.execute(
+                    select(ChangeLog.txid, ChangeLog.seq)
+                    .where(ChangeLog.txid < SETTLED_TXID)
+                    .order_by(ChangeLog.txid.desc(), ChangeLog.seq.desc())
+                    .limit(1)
+                )
+            ).first()
+        watermark = None if newest is None else tuple(newest)
+        if watermark != self._watermark:
+            self._watermark = watermark
+            # Wake everyone waiting on the current event and start a new one.
+            self._changed.set()
+            self._changed = asyncio.Event()
+
+    async def _run(self) -> None:
+        while True:
+            if not self._waiters:
+                self._demand.clear()
+                await self._demand.wait()
+            try:
+                await self._poll()
+            except Exception as e:
+                logger.error(f"Change feed poll failed: {str(e)}")
+            await asyncio.sleep(settings.change_feed_poll_seconds)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+change_notifier = ChangeNotifier()
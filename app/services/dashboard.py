@@ -0,0 +1,165 @@
+"""
+Manager landing page aggregates: team headcount, today's attendance and
+pending leave approvals.
+
+Everything comes from one grouped query per cache miss. Employees are
+grouped by (shift, on approved leave, attendance state, check-in minute);
+there are at most as many groups as direct reports, and lateness is decided
+per group with `is_late`, the same rule the monthly report uses.
+
+Results are cached per manager and day for `DASHBOARD_CACHE_TTL_SECONDS`
+(at most `REPLICA_MAX_LAG_SECONDS` when built on a read replica) and dropped
+when a team member's attendance or leave is written.
+"""
+
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, Optional
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import Integer, Select, Time, and_, cast, exists, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core.cache import cache
+from app.core.database import cache_ttl
+from app.core.settings import settings
+from app.models import Attendance, Employee, Leave
+from app.models.attendance import AttendanceStatus
+from app.models.leave import LeaveStatus, approved_leave_clause
+from app.services.shifts import FALLBACK_SHIFT_START, is_late, parse_shift_start
+
+
+def local_today() -> date:
+    """Today in the organisation's timezone, the day attendance is filed under."""
+    return datetime.now(ZoneInfo(settings.timezone)).date()
+
+
+def _cache_key(manager_id: int, day: date) -> str:
+    return f"dashboard:manager:{manager_id}:{day.isoformat()}"
+
+
+def dashboard_query(manager_id: int, day: date) -> Select[Any]:
+    on_leave = exists().where(
+        Leave.employee_id == Employee.id,
+        approved_leave_clause(),
+        Leave.start_date <= day,
+        Leave.end_date >= day,
+    )
+    local_check_in = cast(func.timezone(settings.timezone, Attendance.check_in), Time)
+    team = (
+        select(
+            Employee.shift_timing,
+            on_leave.label("on_leave"),
+            (
+                Attendance.check_in.isnot(None)
+                | (Attendance.status == AttendanceStatus.PRESENT)
+            ).label("present"),
+            (Attendance.status == AttendanceStatus.ABSENT).label("marked_absent"),
+            cast(func.floor(func.extract("epoch", local_check_in) / 60), Integer).label(
+                "check_in_minute"
+            ),
+        )
+        .select_from(Employee)
+        .outerjoin(
+            Attendance,
+            and_(Attendance.employee_id == Employee.id, Attendance.date == day),
+        )
+        .where(Employee.manager_id == manager_id, Employee.is_active.is_(True))
+        .subquery()
+    )
+
+    reports = aliased(Employee)
+    pending_approvals = (
+        select(func.count())
+        .select_from(Leave)
+        .join(reports, reports.id == Leave.employee_id)
+        .where(reports.manager_id == manager_id, Leave.status == LeaveStatus.PENDING)
+        .scalar_subquery()
+    )
+    return select(
+        team.c.shift_timing,
+        team.c.on_leave,
+        team.c.present,
+        team.c.marked_absent,
+        team.c.check_in_minute,
+        func.count().label("employees"),
+        pending_approvals.label("pending_approvals"),
+    ).group_by(
+        team.c.shift_timing,
+        team.c.on_leave,
+        team.c.present,
+        team.c.marked_absent,
+        team.c.check_in_minute,
+    )
+
+
+async def build_manager_dashboard(
+    session: AsyncSession, manager_id: int, day: date
+) -> Dict[str, Any]:
+    rows = (await session.execute(dashboard_query(manager_id, day))).all()
+
+    default_start = (
+        parse_shift_start(settings.default_shift_start) or FALLBACK_SHIFT_START
+    )
+    shift_starts: Dict[Optional[str], int] = {}
+    counts = {"headcount": 0, "present": 0, "late": 0, "on_leave": 0, "absent": 0}
+    pending = 0
+    for row in rows:
+        pending = row.pending_approvals
+        counts["headcount"] += row.employees
+        if row.present and not row.marked_absent:
+            counts["present"] += row.employees
+            if row.shift_timing not in shift_starts:
+                shift_starts[row.shift_timing] = (
+                    parse_shift_start(row.shift_timing) or default_start
+                )
+            if row.check_in_minute is not None and is_late(
+                row.check_in_minute * 60,
+                shift_starts[row.shift_timing],
+                settings.late_grace_minutes,
+            ):
+                counts["late"] += row.employees
+        elif row.on_leave:
+            counts["on_leave"] += row.employees
+        else:
+            # Marked absent or not checked in yet.
+            counts["absent"] += row.employees
+
+    return {
+        "manager_id": manager_id,
+        "date": day.isoformat(),
+        **counts,
+        "pending_approvals": pending,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+async def get_manager_dashboard(
+    session: AsyncSession, manager_id: int, day: Optional[date] = None
+) -> Dict[str, Any]:
+    """Return the cached dashboard for a manager and day, building it on a miss."""
+    day = day or local_today()
+    key = _cache_key(manager_id, day)
+    dashboard = await cache.get(key)
+    if dashboard is None:
+        dashboard = await build_manager_dashboard(session, manager_id, day)
+        await cache.set(
+            key, dashboard, cache_ttl(session, settings.dashboard_cache_ttl_seconds)
+        )
+    return dashboard
+
+
+async def invalidate_team_dashboards(
+    session: AsyncSession, employee_ids: Iterable[int], days: Iterable[date]
+) -> None:
+    """Drop cached dashboards of the managers of `employee_ids` for `days`."""
+    employee_ids = set(employee_ids)
+    if not employee_ids:
+        return
+    managers = await session.scalars(
+        select(Employee.manager_id).where(Employee.id.in_(employee_ids)).distinct()
+    )
+    manager_ids = [manager_id for manager_id in managers if manager_id is not None]
+    for day in set(days):
+        for manager_id in manager_ids:
+            await cache.delete(_cache_key(manager_id, day))
@@ -0,0 +1,300 @@
+"""
+Streaming bulk import of employees from CSV or JSONL files.
+
+Records are read lazily from a text stream, validated against `EmployeeCreate`
+in fixed-size chunks and written with one multi-row
+`INSERT ... ON CONFLICT (employee_id) DO UPDATE` per chunk, so memory use is
+bounded by the chunk size rather than the file size. The stream is read in a
+worker thread, one chunk at a time, so a large upload spooled to disk never
+blocks the event loop.
+"""
+
+import asyncio
+import csv
+import json
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+)
+
+from loguru import logger
+from pydantic import ValidationError
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import CompanyUnit, Department, Designation, Employee, JobType
+from app.schemas.employee import EmployeeCreate
+
+DEFAULT_CHUNK_SIZE = 500
+MAX_REPORTED_ERRORS = 1000
+SUPPORTED_FORMATS = ("csv", "jsonl")
+
+# asyncpg accepts at most 32767 bind parameters per statement.
+MAX_BIND_PARAMS = 32767
+
+# Name column in the import file -> (FK column on Employee, lookup model, name column).
+LOOKUP_COLUMNS: Dict[str, Tuple[str, Any, Any]] = {
+    "department": ("department_id", Department, Department.name),
+    "designation": ("designation_id", Designation, Designation.title),
+    "company_unit": ("work_location_id", CompanyUnit, CompanyUnit.unit_name),
+    "job_type": ("job_type_id", JobType, JobType.type_name),
+}
+
+Record = Tuple[int, Dict[str, Any]]
+
+
+@dataclass
+class ImportReport:
+    processed: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+    def add_error(self, row: int, message: Any) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "errors": message})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "processed": self.processed,
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+
+def detect_format(filename: Optional[str]) -> Optional[str]:
+    """Guess the import format from a file name."""
+    if not filename:
+        return None
+    lowered = filename.lower()
+    if lowered.endswith(".csv"):
+        return "csv"
+    if lowered.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    return None
+
+
+def iter_records(stream: TextIO, fmt: str) -> Iterator[Record]:
+    """Yield `(row_number, record)` pairs from a CSV or JSONL stream."""
+    if fmt == "csv":
+        for row_number, row in enumerate(csv.DictReader(stream), start=1):
+            record: Dict[str, Any] = {
+                key.strip(): (
+                    (value.strip() or None) if isinstance(value, str) else value
+                )
+                for key, value in row.items()
+                if key
+            }
+            yield row_number, record
+    elif fmt == "jsonl":
+        for row_number, line in enumerate(stream, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                parsed = json.loads(line)
+            except json.JSONDecodeError as e:
+                parsed = {"__error__": f"Invalid JSON: {e.msg}"}
+            if not isinstance(parsed, dict):
+                parsed = {"__error__": "Each line must be a JSON object"}
+            yield row_number, parsed
+    else:
+        raise ValueError(f"Unsupported import format: {fmt}")
+
+
+async def read_chunk(records: Iterator[Record], size: int) -> List[Record]:
+    """Read the next `size` records off the event loop."""
+    return await asyncio.to_thread(lambda: list(islice(records, size)))
+
+
+async def resolve_lookup_names(
+    session: AsyncSession, records: List[Record], cache: Dict[Tuple[str, str], int]
+) -> None:
+    """Resolve every lookup name referenced by a chunk with a single query."""
+    wanted: Dict[str, set] = {key: set() for key in LOOKUP_COLUMNS}
+    for _, record in records:
+        for key in LOOKUP_COLUMNS:
+            name = record.get(key)
+            if isinstance(name, str) and (key, name) not in cache:
+                wanted[key].add(name)
+
+    selects = []
+    for key, names in wanted.items():
+        if not names:
+            continue
+        _, model, name_column = LOOKUP_COLUMNS[key]
+        selects.append(
+            select(
+                literal(key).label("kind"), model.id, name_column.label("name")
+            ).where(name_column.in_(names))
+        )
+    if not selects:
+        return
+    for kind, lookup_id, name in await session.execute(union_all(*selects)):
+        cache[(kind, name)] = lookup_id
+
+
+def prepare_record(
+    record: Dict[str, Any], cache: Dict[Tuple[str, str], int]
+) -> Tuple[Dict[str, Any], FrozenSet[str]]:
+    """Map lookup names to foreign keys and validate the record.
+
+    Returns the full row for inserts and the columns the record actually
+    provided, which are the only ones an update may overwrite.
+    """
+    if "__error__" in record:
+        raise ValueError(record["__error__"])
+
+    data = dict(record)
+    for key, (fk_column, _, _) in LOOKUP_COLUMNS.items():
+        name = data.pop(key, None)
+        if name is None:
+            continue
+        if (key, name) not in cache:
+            raise ValueError(f"Unknown {key}: {name}")
+        data[fk_column] = cache[(key, name)]
+
+    # CSV files carry benefits as an embedded JSON document.
+    if isinstance(data.get("benefits"), str):
+        try:
+            data["benefits"] = json.loads(data["benefits"])
+        except json.JSONDecodeError:
+            raise ValueError("benefits must be a JSON object")
+
+    employee = EmployeeCreate(**data)
+    return employee.model_dump(), frozenset(employee.model_fields_set)
+
+
+async def upsert_employees(
+    session: AsyncSession, rows: List[Dict[str, Any]], update_fields: FrozenSet[str]
+) -> None:
+    """Insert or update employees keyed on `employee_id`.
+
+    Existing employees only have `update_fields` overwritten, so columns
+    missing from the import file keep their current values.
+    """
+    if not rows:
+        return
+    batch_size = max(1, MAX_BIND_PARAMS // len(rows[0]))
+    for start in range(0, len(rows), batch_size):
+        stmt = insert(Employee).values(rows[start : start + batch_size])
+        update_columns: Dict[str, Any] = {
+            name: stmt.excluded[name]
+            for name in sorted(update_fields)
+            if name != "employee_id"
+        }
+        update_columns["updated_at"] = func.now()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Employee.employee_id], set_=update_columns
+        )
+        await session.execute(stmt)
+
+
+async def import_chunk(
+    session: AsyncSession,
+    records: List[Record],
+    cache: Dict[Tuple[str, str], int],
+    report: ImportReport,
+) -> None:
+    await resolve_lookup_names(session, records, cache)
+
+    # Later rows win when the same employee_id appears twice in a chunk; a
+    # single INSERT ... ON CONFLICT cannot touch the same row twice.
+    valid: Dict[str, Tuple[int, Dict[str, Any], FrozenSet[str]]] = {}
+    for row_number, record in records:
+        report.processed += 1
+        try:
+            data, update_fields = prepare_record(record, cache)
+        except ValidationError as e:
+            report.add_error(
+                row_number,
+                [
+                    {
+                        "field": ".".join(str(p) for p in err["loc"]),
+                        "message": err["msg"],
+                    }
+                    for err in e.errors()
+                ],
+            )
+            continue
+        except (ValueError, TypeError) as e:
+            report.add_error(row_number, str(e))
+            continue
+        superseded = valid.get(data["employee_id"])
+        if superseded is not None:
+            report.add_error(
+                superseded[0],
+                f"Superseded by row {row_number} with the same employee_id",
+            )
+        valid[data["employee_id"]] = (row_number, data, update_fields)
+
+    if not valid:
+        return
+
+    # Records providing different columns need different ON CONFLICT updates.
+    groups: Dict[FrozenSet[str], List[Dict[str, Any]]] = {}
+    for _, data, update_fields in valid.values():
+        groups.setdefault(update_fields, []).append(data)
+    try:
+        for update_fields, rows in groups.items():
+            await upsert_employees(session, rows, update_fields)
+        await session.commit()
+        report.imported += len(valid)
+        return
+    except DBAPIError as e:
+        await session.rollback()
+        if e.connection_invalidated:
+            raise
+
+    # A row was rejected somewhere in the chunk (a duplicate email, a value
+    # out of range, ...): retry row by row to pinpoint the offending records.
+    for row_number, data, update_fields in valid.values():
+        try:
+            await upsert_employees(session, [data], update_fields)
+            await session.commit()
+            report.imported += 1
+        except DBAPIError as e:
+            await session.rollback()
+            if e.connection_invalidated:
+                raise
+            report.add_error(row_number, str(e.orig))
+
+
+async def import_employees(
+    session: AsyncSession,
+    stream: TextIO,
+    fmt: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_chunk: Optional[Callable[[ImportReport], Awaitable[None]]] = None,
+) -> ImportReport:
+    """Import employees from `stream`, committing one chunk at a time.
+
+    `on_chunk` is awaited with the running report after every chunk, e.g. to
+    publish job progress.
+    """
+    report = ImportReport()
+    cache: Dict[Tuple[str, str], int] = {}
+    records = iter_records(stream, fmt)
+    while chunk := await read_chunk(records, chunk_size):
+        await import_chunk(session, chunk, cache, report)
+        if on_chunk is not None:
+            await on_chunk(report)
+    logger.info(
+        f"Employee import finished: {report.imported} imported, {report.failed} failed"
+    )
+    return report
@@ -0,0 +1,139 @@
+"""
+Employee queries with declared load profiles.
+
+Employee relationships are `lazy="raise_on_sql"`, so every relationship a
+caller needs must be loaded up front. A profile bundles the loader options
+for one kind of screen with the read model it is serialized to; the schema
+only touches what the options load, so a mismatch fails loudly instead of
+issuing one query per row.
+
+    directory  summary columns plus department and designation names
+    profile    every column plus all many-to-one relationships
+    payroll    pay and bank columns plus department
+    leave      summary columns, leave policy and all leave requests
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, load_only, selectinload
+
+from app import schemas
+from app.models import Department, Designation, Employee
+from app.models.employee import SUMMARY_FIELDS
+
+SUMMARY_ATTRIBUTES = [getattr(Employee, name) for name in SUMMARY_FIELDS]
+
+
+@dataclass(frozen=True)
+class LoadProfile:
+    options: Tuple[Any, ...]
+    schema: Type[BaseModel]
+
+
+LOAD_PROFILES: Dict[str, LoadProfile] = {
+    "directory": LoadProfile(
+        (
+            load_only(*SUMMARY_ATTRIBUTES),
+            joinedload(Employee.department).load_only(Department.name),
+            joinedload(Employee.designation).load_only(Designation.title),
+        ),
+        schemas.EmployeeDirectoryEntry,
+    ),
+    "profile": LoadProfile(
+        (
+            joinedload(Employee.department),
+            joinedload(Employee.designation),
+            joinedload(Employee.work_location),
+            joinedload(Employee.job_type),
+            joinedload(Employee.leave_policy),
+            joinedload(Employee.manager).load_only(*SUMMARY_ATTRIBUTES),
+        ),
+        schemas.EmployeeProfile,
+    ),
+    "payroll": LoadProfile(
+        (
+            load_only(
+                Employee.id,
+                Employee.employee_id,
+                Employee.first_name,
+                Employee.last_name,
+                Employee.weekly_hours,
+                Employee.salary,
+                Employee.currency,
+                Employee.pay_frequency,
+                Employee.bank_account,
+                Employee.bank_name,
+                Employee.tax_id,
+            ),
+            joinedload(Employee.department).load_only(Department.name),
+        ),
+        schemas.EmployeePayroll,
+    ),
+    "leave": LoadProfile(
+        (
+            load_only(*SUMMARY_ATTRIBUTES),
+            joinedload(Employee.leave_policy),
+            # A collection: one extra IN query for the whole page, not one per employee.
+            selectinload(Employee.leaves),
+        ),
+        schemas.EmployeeLeaveProfile,
+    ),
+}
+
+
+def get_profile(name: str) -> LoadProfile:
+    try:
+        return LOAD_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown load profile, expected one of: {', '.join(LOAD_PROFILES)}"
+        )
+
+
+async def get_employee(
+    session: AsyncSession, employee_id: int, profile: str = "profile"
+) -> Optional[Employee]:
+    stmt = (
+        select(Employee)
+        .options(*get_profile(profile).options)
+        .where(Employee.id == employee_id)
+    )
+    return (await session.scalars(stmt)).unique().one_or_none()
+
+
+async def list_employees(
+    session: AsyncSession,
+    profile: str = "directory",
+    ids: Optional[Iterable[int]] = None,
+    department_id: Optional[int] = None,
+    cursor: Optional[int] = None,
+    limit: int = 50,
+    designation_id: Optional[int] = None,
+    work_location_id: Optional[int] = None,
+    is_active: Optional[bool] = None,
+) -> List[Employee]:
+    """A keyset page of employees loaded with `profile`."""
+    stmt = select(Employee).options(*get_profile(profile).options)
+    if ids is not None:
+        stmt = stmt.where(Employee.id.in_(list(ids)))
+    if department_id is not None:
+        stmt = stmt.where(Employee.department_id == department_id)
+    if designation_id is not None:
+        stmt = stmt.where(Employee.designation_id == designation_id)
+    if work_location_id is not None:
+        stmt = stmt.where(Employee.work_location_id == work_location_id)
+    if is_active is not None:
+        stmt = stmt.where(Employee.is_active == is_active)
+    if cursor is not None:
+        stmt = stmt.where(Employee.id > cursor)
+    stmt = stmt.order_by(Employee.id).limit(limit)
+    return list((await session.scalars(stmt)).unique())
+
+
+def serialize(employees: Iterable[Employee], profile: str) -> List[BaseModel]:
+    schema = get_profile(profile).schema
+    return [schema.model_validate(employee) for employee in employees]
@@ -0,0 +1,309 @@
+"""
+In-memory typeahead index over employee names, emails and employee ids.
+
+Every field is normalized (case-folded, accents stripped) and split into
+tokens. A sorted token array answers prefix queries with two bisects, which
+is how a prefix trie would be walked but without a dict per character; hits
+are then ranked with RapidFuzz. When a query token has no prefix match the
+name vocabulary is searched with RapidFuzz to tolerate typos.
+
+The index is loaded in the background at startup and kept current
+incrementally: writes in this process call `upsert`/`remove`, and a refresh
+loop picks up rows changed by other workers through `employees.updated_at`.
+Until the first load finishes, searches fall back to `pg_trgm` when
+`EMPLOYEE_SEARCH_TRGM_FALLBACK` is on.
+"""
+
+import asyncio
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+from loguru import logger
+from rapidfuzz import fuzz, process
+from sqlalchemy import func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal, read_sessionmaker
+from app.core.settings import settings
+from app.models import Employee
+from app.models.employee import search_document
+from app.services.lookups import SUMMARY_COLUMNS
+
+LOAD_BATCH_SIZE = 5000
+# Prefix hits scored with RapidFuzz per query; short prefixes such as "a"
+# match most of the company, so only the closest tokens are expanded.
+MAX_CANDIDATES = 500
+# Prefix ranges up to this many tokens are expanded shortest token first.
+SORTED_PREFIX_LIMIT = 5000
+# Typo-tolerant matches taken from the vocabulary per query token.
+FUZZY_TOKEN_LIMIT = 20
+FUZZY_TOKEN_CUTOFF = 75
+# Rows committed slightly before the previous refresh can carry an older
+# `updated_at` than the watermark; re-read this much history each time.
+REFRESH_OVERLAP = timedelta(seconds=5)
+
+_TOKEN_SPLIT = re.compile(r"[\W_]+")
+
+
+def normalize(text: str) -> str:
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN_SPLIT.split(normalize(text)) if token]
+
+
+class EmployeeSearchIndex:
+    def __init__(self) -> None:
+        self.docs: Dict[int, Dict[str, Any]] = {}
+        self.texts: Dict[int, str] = {}
+        self.doc_tokens: Dict[int, Tuple[str, ...]] = {}
+        self.postings: Dict[str, Set[int]] = {}
+        self.tokens: List[str] = []
+        # Tokens from first/last names; the typo-tolerant pass only scans these.
+        self.name_tokens: Dict[str, int] = {}
+        self.ready = False
+        self.watermark: Optional[datetime] = None
+        # Set while bulk loading: tokens are sorted once at the end instead
+        # of being inserted in order one by one.
+        self._bulk = False
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    # -- maintenance -------------------------------------------------------
+
+    def upsert(self, doc: Mapping[Any, Any]) -> None:
+        """Add or replace one employee; inactive employees are removed."""
+        employee_id = doc["id"]
+        self.remove(employee_id)
+        if doc.get("is_active") is False:
+            return
+        summary = {column.name: doc[column.name] for column in SUMMARY_COLUMNS}
+        names = tokenize(f"{summary['first_name']} {summary['last_name']}")
+        tokens = tuple(
+            dict.fromkeys(
+                names
+                + tokenize(summary["email"].split("@", 1)[0])
+                + tokenize(summary["employee_id"])
+            )
+        )
+        self.docs[employee_id] = summary
+        self.texts[employee_id] = normalize(
+            f"{summary['first_name']} {summary['last_name']} "
+            f"{summary['email']} {summary['employee_id']}"
+        )
+        self.doc_tokens[employee_id] = tokens
+        for token in tokens:
+            posting = self.postings.get(token)
+            if posting is None:
+                posting = self.postings[token] = set()
+                if not self._bulk:
+                    insort(self.tokens, token)
+            posting.add(employee_id)
+        for token in names:
+            self.name_tokens[token] = self.name_tokens.get(token, 0) + 1
+
+    def remove(self, employee_id: int) -> None:
+        tokens = self.doc_tokens.pop(employee_id, None)
+        if tokens is None:
+            return
+        summary = self.docs.pop(employee_id)
+        del self.texts[employee_id]
+        for token in tokens:
+            posting = self.postings[token]
+            posting.discard(employee_id)
+            if not posting:
+                del self.postings[token]
+                del self.tokens[bisect_left(self.tokens, token)]
+        for token in tokenize(f"{summary['first_name']} {summary['last_name']}"):
+            count = self.name_tokens.get(token, 0) - 1
+            if count > 0:
+                self.name_tokens[token] = count
+            else:
+                self.name_tokens.pop(token, None)
+
+    # -- queries -----------------------------------------------------------
+
+    def _prefix_matches(self, prefix: str) -> Set[int]:
+        start = bisect_left(self.tokens, prefix)
+        end = bisect_left(self.tokens, prefix + "\uffff", start)
+        tokens = self.tokens[start:end]
+        if len(tokens) <= SORTED_PREFIX_LIMIT:
+            # Shortest tokens first: "ann" should prefer "ann" over "annabelle".
+            tokens.sort(key=len)
+        matched: Set[int] = set()
+        for token in tokens:
+            matched.update(islice(self.postings[token], MAX_CANDIDATES - len(matched)))
+            if len(matched) >= MAX_CANDIDATES:
+                break
+        return matched
+
+    def _has_prefix(self, employee_id: int, prefix: str) -> bool:
+        return any(token.startswith(prefix) for token in self.doc_tokens[employee_id])
+
+    def _fuzzy_matches(self, token: str) -> Set[int]:
+        matched: Set[int] = set()
+        for name, _, _ in process.extract(
+            token,
+            self.name_tokens.keys(),
+            scorer=fuzz.ratio,
+            score_cutoff=FUZZY_TOKEN_CUTOFF,
+            limit=FUZZY_TOKEN_LIMIT,
+        ):
+            matched.update(
+                islice(self.postings.get(name, ()), MAX_CANDIDATES - len(matched))
+            )
+            if len(matched) >= MAX_CANDIDATES:
+                break
+        return matched
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Best matches for `query`, each summary extended with a `score`."""
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return []
+        # Candidates come from the longest (most selective) token; the other
+        # tokens only filter them, so a one-letter token never expands.
+        query_tokens.sort(key=len, reverse=True)
+        candidates = self._prefix_matches(query_tokens[0]) or self._fuzzy_matches(
+            query_tokens[0]
+        )
+        for token in query_tokens[1:]:
+            if not candidates:
+                break
+            candidates = {
+                employee_id
+                for employee_id in candidates
+                if self._has_prefix(employee_id, token)
+            } or candidates & self._fuzzy_matches(token)
+        if not candidates:
+            return []
+        ranked = process.extract(
+            normalize(query),
+            {employee_id: self.texts[employee_id] for employee_id in candidates},
+            scorer=fuzz.WRatio,
+            limit=limit,
+        )
+        return [
+            {**self.docs[employee_id], "score": round(score, 1)}
+            for _, score, employee_id in ranked
+        ]
+
+    # -- loading -----------------------------------------------------------
+
+    def _track(self, updated_at: Optional[datetime]) -> None:
+        if updated_at is not None and (
+            self.watermark is None or updated_at > self.watermark
+        ):
+            self.watermark = updated_at
+
+    async def load(self) -> None:
+        """Build the index from scratch from a server-side cursor, then swap it in."""
+        fresh = EmployeeSearchIndex()
+        fresh._bulk = True
+        stmt = select(*SUMMARY_COLUMNS, Employee.updated_at).where(
+            Employee.is_active.is_(True)
+        )
+        sessionmaker = await read_sessionmaker()
+        async with sessionmaker() as session:
+            result = await session.stream(
+                stmt.execution_options(yield_per=LOAD_BATCH_SIZE)
+            )
+            async for batch in result.mappings().partitions():
+                for row in batch:
+                    fresh.upsert(row)
+                    fresh._track(row["updated_at"])
+                # Let requests run between batches of a large load.
+                await asyncio.sleep(0)
+        fresh.tokens = sorted(fresh.postings)
+        for name in (
+            "docs",
+            "texts",
+            "doc_tokens",
+            "postings",
+            "tokens",
+            "name_tokens",
+            "watermark",
+        ):
+            setattr(self, name, getattr(fresh, name))
+        self.ready = True
+        logger.info(f"Employee search index loaded with {len(self)} employees")
+
+    async def refresh(self) -> int:
+        """Apply employees changed since the last load or refresh."""
+        if self.watermark is None:
+            await self.load()
+            return len(self)
+        stmt = select(*SUMMARY_COLUMNS, Employee.updated_at).where(
+            Employee.updated_at > self.watermark - REFRESH_OVERLAP
+        )
+        # Read from the primary: a lagging replica would move the watermark
+        # past rows it has not replayed yet.
+        async with AsyncSessionLocal() as session:
+            rows = (await session.execute(stmt)).mappings().all()
+        for row in rows:
+            self.upsert(row)
+            self._track(row["updated_at"])
+        return len(rows)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Employee search index refresh failed: {str(e)}")
+            await asyncio.sleep(settings.employee_search_refresh_seconds)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+employee_search = EmployeeSearchIndex()
+
+
+async def trigram_search(
+    session: AsyncSession, query: str, limit: int = 10
+) -> List[Dict[str, Any]]:
+    """`pg_trgm` word-similarity search used until the in-memory index is ready."""
+    term = normalize(query)
+    document = search_document()
+    score = func.word_similarity(term, document)
+    stmt = (
+        select(*SUMMARY_COLUMNS, (score * 100).label("score"))
+        .where(Employee.is_active.is_(True), literal(term).op("<%")(document))
+        .order_by(score.desc(), Employee.id)
+        .limit(limit)
+    )
+    return [
+        {**row, "score": round(float(row["score"]), 1)}
+        for row in (await session.execute(stmt)).mappings()
+    ]
+
+
+async def search_employees(
+    session: AsyncSession, query: str, limit: int = 10
+) -> List[Dict[str, Any]]:
+    if employee_search.ready:
+        return employee_search.search(query, limit)
+    if settings.employee_search_trgm_fallback:
+        return await trigram_search(session, query, limit)
+    return []
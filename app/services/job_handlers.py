@@ -0,0 +1,130 @@
+"""
+Handlers for the batch work that runs on the background job queue.
+
+Each handler opens its own session on the primary and returns a
+JSON-serializable result stored on the job row.
+"""
+
+import asyncio
+import io
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+from app.core.database import AsyncSessionLocal, async_engine
+from app.core.process_pool import report_pool
+from app.core.settings import settings
+from app.services.attendance_partitions import maintain_partitions
+from app.services.attendance_report import compute_monthly_metrics, fetch_monthly_inputs
+from app.services.change_feed import prune_change_log
+from app.services.dashboard import local_today
+from app.services.employee_import import (
+    DEFAULT_CHUNK_SIZE,
+    SUPPORTED_FORMATS,
+    ImportReport,
+    detect_format,
+    import_employees,
+)
+from app.services.jobs import JobContext, job_handler
+from app.services.leave_balances import rebuild_balances
+
+
+@job_handler("reconcile-leave-balances")
+async def reconcile_leave_balances(job: JobContext) -> Dict[str, Any]:
+    year = int(job.payload.get("year") or local_today().year)
+    async with AsyncSessionLocal() as session:
+        rows = await rebuild_balances(session, year)
+    return {"year": year, "rows": rows}
+
+
+@job_handler("monthly-attendance-report")
+async def monthly_attendance_rollup(job: JobContext) -> Dict[str, Any]:
+    year, month = int(job.payload["year"]), int(job.payload["month"])
+    department_id = job.payload.get("department_id")
+    async with AsyncSessionLocal() as session:
+        inputs = await fetch_monthly_inputs(session, year, month, department_id)
+    report = await report_pool.run(compute_monthly_metrics, inputs)
+    return {
+        "year": year,
+        "month": month,
+        "department_id": department_id,
+        "rows": report,
+    }
+
+
+def resolve_import_path(path: Any) -> str:
+    """Resolve `path` under `JOB_IMPORT_DIRECTORY`; anything outside it is rejected."""
+    if not isinstance(path, str) or not path:
+        raise ValueError("An import path is required")
+    root = Path(settings.job_import_directory).resolve()
+    resolved = (root / path).resolve()
+    if not resolved.is_relative_to(root):
+        raise ValueError("Import path must be inside the import directory")
+    return str(resolved)
+
+
+@job_handler("import-employees")
+async def import_employees_file(job: JobContext) -> Dict[str, Any]:
+    """Import a CSV/JSONL file (`path`, relative to `JOB_IMPORT_DIRECTORY`)."""
+    path = resolve_import_path(job.payload.get("path"))
+    fmt = job.payload.get("format") or detect_format(path)
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(
+            "Unsupported import format, expected one of: "
+            f"{', '.join(SUPPORTED_FORMATS)}"
+        )
+    # Opening and sizing the file can block on slow or network storage.
+    size = await asyncio.to_thread(os.path.getsize, path) or 1
+    raw = await asyncio.to_thread(open, path, "rb")
+    try:
+
+        async def on_chunk(report: ImportReport) -> None:
+            # tell() only asks the OS for the file offset; it never waits on I/O.
+            await job.report_progress(
+                raw.tell() / size, f"{report.processed} rows processed"
+            )
+
+        stream = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+        async with AsyncSessionLocal() as session:
+            report = await import_employees(
+                session,
+                stream,
+                fmt,
+                int(job.payload.get("chunk_size") or DEFAULT_CHUNK_SIZE),
+                on_chunk,
+            )
+    finally:
+        await asyncio.to_thread(raw.close)
+    return report.to_dict()
+
+
+@job_handler("maintain-attendance-partitions")
+async def maintain_attendance_partitions(job: JobContext) -> Dict[str, Any]:
+    return await maintain_partitions(async_engine)
+
+
+def resolve_retention_days(payload: Dict[str, Any]) -> int:
+    """Retention window for `prune-change-log`; it may only be widened.
+
+    Consumers rely on `CHANGE_LOG_RETENTION_DAYS` of history, so a shorter
+    window in the payload is rejected.
+    """
+    minimum = settings.change_log_retention_days
+    value = payload.get("retention_days")
+    if value is None:
+        return minimum
+    try:
+        retention_days = int(value)
+    except (TypeError, ValueError):
+        raise ValueError("retention_days must be a whole number of days")
+    if retention_days < minimum:
+        raise ValueError(f"retention_days must be at least {minimum}")
+    return retention_days
+
+
+@job_handler("prune-change-log")
+async def prune_change_log_rows(job: JobContext) -> Dict[str, Any]:
+    retention_days = resolve_retention_days(job.payload)
+    async with AsyncSessionLocal() as session:
+        deleted = await prune_change_log(session, retention_days)
+    return {"retention_days": retention_days, "deleted": deleted}
@@ -0,0 +1,347 @@
+"""
+Persistent background job queue.
+
+Jobs are rows in `background_jobs`. Workers in any process or node claim the
+oldest runnable job with `SELECT ... FOR UPDATE SKIP LOCKED`, so concurrent
+workers never block on or double-run the same job. Failed attempts are
+retried with exponential backoff up to `max_attempts`; running jobs send a
+heartbeat, and jobs whose worker died are requeued once the heartbeat is
+older than `JOB_STALE_AFTER_SECONDS`. Every update a worker makes to its job
+is fenced on `locked_by` and the `running` status, so a worker whose job was
+requeued and claimed again elsewhere cannot overwrite the new attempt.
+
+Handlers are registered per job kind with `@job_handler("kind")` and receive
+a `JobContext` for the payload and progress reporting.
+"""
+
+import asyncio
+import os
+import socket
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+from sqlalchemy import case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from app.core.settings import settings
+from app.models import BackgroundJob
+from app.models.background_job import JobStatus
+
+JobHandler = Callable[["JobContext"], Awaitable[Any]]
+
+JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    def register(handler: JobHandler) -> JobHandler:
+        JOB_HANDLERS[kind] = handler
+        return handler
+
+    return register
+
+
+@dataclass
+class JobContext:
+    job_id: int
+    kind: str
+    payload: Dict[str, Any]
+    attempt: int
+    max_attempts: int
+    worker_id: str
+
+    async def report_progress(
+        self, progress: float, message: Optional[str] = None
+    ) -> None:
+        """Record progress (0..1) for `GET /jobs/{id}`; also refreshes the heartbeat."""
+        await _update_job(
+            self.job_id,
+            self.worker_id,
+            progress=min(max(progress, 0.0), 1.0),
+            progress_message=message[:255] if message else None,
+            heartbeat_at=func.now(),
+        )
+
+
+async def enqueue_job(
+    session: AsyncSession,
+    kind: str,
+    payload: Optional[Dict[str, Any]] = None,
+    max_attempts: int = 3,
+) -> BackgroundJob:
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job kind: {kind}")
+    job = BackgroundJob(
+        kind=kind,
+        payload=payload or {},
+        max_attempts=max_attempts,
+        status=JobStatus.QUEUED,
+        progress=0.0,
+        attempts=0,
+    )
+    session.add(job)
+    await session.commit()
+    await session.refresh(job)
+    return job
+
+
+async def claim_next_job(worker_id: str) -> Optional[JobContext]:
+    """Atomically move the oldest runnable job to `running` for this worker."""
+    next_job = (
+        select(BackgroundJob.id)
+        .where(
+            BackgroundJob.status == JobStatus.QUEUED, BackgroundJob.run_at <= func.now()
+        )
+        .order_by(BackgroundJob.run_at, BackgroundJob.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    stmt = (
+        update(BackgroundJob)
+        .where(BackgroundJob.id == next_job)
+        .values(
+            status=JobStatus.RUNNING,
+            attempts=BackgroundJob.attempts + 1,
+            locked_by=worker_id,
+            started_at=func.now(),
+            heartbeat_at=func.now(),
+        )
+        .returning(
+            BackgroundJob.id,
+            BackgroundJob.kind,
+            BackgroundJob.payload,
+            BackgroundJob.attempts,
+            BackgroundJob.max_attempts,
+        )
+    )
+    async with AsyncSessionLocal() as session:
+        row = (await session.execute(stmt)).first()
+        await session.commit()
+    if row is None:
+        return None
+    return JobContext(
+        job_id=row.id,
+        kind=row.kind,
+        payload=row.payload,
+        attempt=row.attempts,
+        max_attempts=row.max_attempts,
+        worker_id=worker_id,
+    )
+
+
+async def _update_job(job_id: int, worker_id: str, **values: Any) -> bool:
+    """Update a job this worker still holds.
+
+    Returns False when the job was requeued or claimed by another worker.
+    """
+    stmt = (
+        update(BackgroundJob)
+        .where(
+            BackgroundJob.id == job_id,
+            BackgroundJob.locked_by == worker_id,
+            BackgroundJob.status == JobStatus.RUNNING,
+        )
+        .values(**values)
+    )
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(stmt)
+        await session.commit()
+    if result.rowcount == 0:
+        logger.warning(f"Job {job_id} is no longer held by {worker_id}; update skipped")
+        return False
+    return True
+
+
+async def mark_succeeded(job_id: int, worker_id: str, result: Any) -> bool:
+    return await _update_job(
+        job_id,
+        worker_id,
+        status=JobStatus.SUCCEEDED,
+        result=result,
+        error=None,
+        progress=1.0,
+        locked_by=None,
+        finished_at=func.now(),
+    )
+
+
+async def mark_failed(
+    job_id: int, worker_id: str, error: str, retry: bool, attempt: int
+) -> bool:
+    if retry:
+        delay = timedelta(
+            seconds=settings.job_retry_backoff_seconds * 2 ** (attempt - 1)
+        )
+        return await _update_job(
+            job_id,
+            worker_id,
+            status=JobStatus.QUEUED,
+            error=error,
+            locked_by=None,
+            run_at=func.now() + delay,
+        )
+    return await _update_job(
+        job_id,
+        worker_id,
+        status=JobStatus.FAILED,
+        error=error,
+        locked_by=None,
+        finished_at=func.now(),
+    )
+
+
+async def requeue_stale_jobs() -> int:
+    """Return jobs whose worker stopped heartbeating to the queue (or fail them)."""
+    stale_before = func.now() - timedelta(seconds=settings.job_stale_after_seconds)
+    exhausted = BackgroundJob.attempts >= BackgroundJob.max_attempts
+    stmt = (
+        update(BackgroundJob)
+        .where(
+            BackgroundJob.status == JobStatus.RUNNING,
+            BackgroundJob.heartbeat_at < stale_before,
+        )
+        .values(
+            status=case((exhausted, JobStatus.FAILED), else_=JobStatus.QUEUED),
+            error="Worker stopped responding",
+            locked_by=None,
+            finished_at=case((exhausted, func.now()), else_=None),
+        )
+        .returning(BackgroundJob.id)
+    )
+    async with AsyncSessionLocal() as session:
+        ids = (await session.scalars(stmt)).all()
+        await session.commit()
+    if ids:
+        logger.warning(f"Recovered stale jobs: {ids}")
+    return len(ids)
+
+
+async def get_job(session: AsyncSession, job_id: int) -> Optional[BackgroundJob]:
+    return await session.get(BackgroundJob, job_id)
+
+
+class JobWorkerPool:
+    """Async workers that claim and run jobs until stopped."""
+
+    def __init__(self) -> None:
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks: List[asyncio.Task] = []
+        self._stopping = asyncio.Event()
+
+    def start(self, workers: int) -> None:
+        self._stopping.clear()
+        self._tasks = [
+            asyncio.create_task(
+                self._run(f"{self.worker_id}:{index}", recover=index == 0)
+            )
+            for index in range(workers)
+        ]
+        if workers:
+            logger.info(f"Started {workers} job workers")
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _idle(self) -> None:
+        try:
+            await asyncio.wait_for(
+                self._stopping.wait(), timeout=settings.job_poll_interval_seconds
+            )
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run(self, worker_id: str, recover: bool) -> None:
+        last_recovery = 0.0
+        while not self._stopping.is_set():
+            try:
+                if (
+                    recover
+                    and time.monotonic() - last_recovery
+                    >= settings.job_heartbeat_seconds
+                ):
+                    last_recovery = time.monotonic()
+                    await requeue_stale_jobs()
+                job = await claim_next_job(worker_id)
+            except Exception as e:
+                logger.error(
+                    f"Job worker {worker_id} could not poll the queue: {str(e)}"
+                )
+                await self._idle()
+                continue
+            if job is None:
+                await self._idle()
+                continue
+            try:
+                await self._execute(job)
+            except Exception as e:
+                # Recording the outcome failed; the job stays running until its
+                # heartbeat goes stale and recovery requeues it.
+                logger.error(
+                    f"Job worker {worker_id} could not finish job {job.job_id}: "
+                    f"{str(e)}"
+                )
+                await self._idle()
+
+    async def _heartbeat(self, job: JobContext) -> None:
+        while True:
+            await asyncio.sleep(settings.job_heartbeat_seconds)
+            try:
+                if not await _update_job(
+                    job.job_id, job.worker_id, heartbeat_at=func.now()
+                ):
+                    return
+            except Exception as e:
+                logger.error(f"Heartbeat for job {job.job_id} failed: {str(e)}")
+
+    async def _execute(self, job: JobContext) -> None:
+        handler = JOB_HANDLERS.get(job.kind)
+        if handler is None:
+            await mark_failed(
+                job.job_id,
+                job.worker_id,
+                f"No handler for job kind {job.kind}",
+                retry=False,
+                attempt=job.attempt,
+            )
+            return
+        logger.info(f"Running job {job.job_id} ({job.kind}), attempt {job.attempt}")
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            result = await handler(job)
+        except asyncio.CancelledError:
+            # Shutting down: hand the job back without spending an attempt.
+            await asyncio.shield(
+                _update_job(
+                    job.job_id,
+                    job.worker_id,
+                    status=JobStatus.QUEUED,
+                    attempts=BackgroundJob.attempts - 1,
+                    locked_by=None,
+                )
+            )
+            raise
+        except Exception as e:
+            retry = job.attempt < job.max_attempts
+            logger.error(
+                f"Job {job.job_id} ({job.kind}) failed on attempt {job.attempt}: "
+                f"{str(e)}"
+            )
+            await mark_failed(
+                job.job_id, job.worker_id, str(e), retry=retry, attempt=job.attempt
+            )
+        else:
+            if await mark_succeeded(job.job_id, job.worker_id, result):
+                logger.info(f"Job {job.job_id} ({job.kind}) succeeded")
+        finally:
+            heartbeat.cancel()
+
+
+job_workers = JobWorkerPool()
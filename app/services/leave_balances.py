@@ -0,0 +1,279 @@
+"""
+Materialised leave balances.
+
+`leave_balances` holds one row per employee, leave type and year. Approving a
+leave adds its days to `used` and cancelling an approved leave subtracts them,
+inside the same transaction as the status change, so reading a balance never
+has to look at leave history. `rebuild_balances` recomputes a whole year from
+the approved leaves and is run nightly to repair drift.
+
+The yearly allocation is the employee's entitlement under their leave policy,
+with the previous year's remaining days carried forward up to the policy's
+cap. It is fixed when the balance row is first created and refreshed by the
+nightly rebuild.
+
+Days are calendar days, split across years for leaves spanning New Year.
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Employee, Leave, LeaveBalance, LeavePolicy, LeaveType
+from app.models.leave import LeaveStatus
+from app.services.leave_policy_engine import (
+    PolicyConfigurationError,
+    get_compiled_policy,
+)
+
+BALANCE_CONSTRAINT = "uq_leave_balance_employee_type_year"
+BALANCE_COLUMNS = ["employee_id", "leave_type_id", "year", "allocated", "used"]
+
+# asyncpg accepts at most 32767 bind parameters per statement.
+MAX_BIND_PARAMS = 32767
+
+
+def leave_days_by_year(start_date: date, end_date: date) -> Dict[int, int]:
+    """Number of calendar days of a leave falling in each year."""
+    days: Dict[int, int] = {}
+    current = start_date
+    while current <= end_date:
+        year_end = min(date(current.year, 12, 31), end_date)
+        days[current.year] = (year_end - current).days + 1
+        current = year_end + timedelta(days=1)
+    return days
+
+
+# Employees without a leave policy keep the per-employee yearly totals,
+# matched to leave types by name.
+LEGACY_TOTALS = (
+    ("annual", "annual_leave_total"),
+    ("sick", "sick_leave_total"),
+    ("casual", "casual_leave_total"),
+)
+
+
+def legacy_allocation(leave_type_name: str, totals: Any) -> int:
+    name = leave_type_name.lower()
+    for keyword, field in LEGACY_TOTALS:
+        if keyword in name:
+            return getattr(totals, field) or 0
+    return 0
+
+
+async def yearly_allocations(
+    session: AsyncSession, year: int, employee_ids: Any
+) -> Dict[Tuple[int, int], int]:
+    """Days allocated for `year` per `(employee_id, leave_type_id)`.
+
+    The allocation is the entitlement under the employee's leave policy,
+    including the carry-forward left over from the previous year, in whole
+    days. `employee_ids` is a list of ids or a select of them.
+    """
+    employees = (
+        await session.execute(
+            select(
+                Employee.id,
+                Employee.joining_date,
+                Employee.leave_policy_id,
+                LeavePolicy.updated_at.label("policy_updated_at"),
+                Employee.annual_leave_total,
+                Employee.sick_leave_total,
+                Employee.casual_leave_total,
+            )
+            .outerjoin(LeavePolicy, LeavePolicy.id == Employee.leave_policy_id)
+            .where(Employee.id.in_(employee_ids))
+        )
+    ).all()
+    leave_types = (await session.execute(select(LeaveType.id, LeaveType.name))).all()
+    carried = {
+        (employee_id, leave_type_id): remaining
+        for employee_id, leave_type_id, remaining in await session.execute(
+            select(
+                LeaveBalance.employee_id,
+                LeaveBalance.leave_type_id,
+                LeaveBalance.allocated - LeaveBalance.used,
+            ).where(
+                LeaveBalance.year == year - 1,
+                LeaveBalance.employee_id.in_(employee_ids),
+            )
+        )
+    }
+
+    allocations: Dict[Tuple[int, int], int] = {}
+    for employee in employees:
+        policy = None
+        if employee.leave_policy_id is not None:
+            try:
+                policy = await get_compiled_policy(
+                    session, employee.leave_policy_id, employee.policy_updated_at
+                )
+            except PolicyConfigurationError as e:
+                logger.warning(
+                    f"{e.message}; using employee {employee.id}'s leave totals"
+                )
+        for leave_type_id, leave_type_name in leave_types:
+            key = (employee.id, leave_type_id)
+            if policy is None:
+                allocations[key] = legacy_allocation(leave_type_name, employee)
+            else:
+                allocations[key] = int(
+                    policy.entitlement(
+                        leave_type_id,
+                        employee.joining_date,
+                        year,
+                        carried.get(key, 0),
+                    )
+                )
+    return allocations
+
+
+async def adjust_balance(session: AsyncSession, leave: Leave, direction: int) -> None:
+    """Add (`direction=1`) or remove (`direction=-1`) a leave's days from `used`."""
+    leave_type_id = await session.scalar(
+        select(LeaveType.id).where(LeaveType.name == leave.leave_type)
+    )
+    if leave_type_id is None:
+        return
+    key = (leave.employee_id, leave_type_id)
+    for year, days in leave_days_by_year(leave.start_date, leave.end_date).items():
+        allocations = await yearly_allocations(session, year, [leave.employee_id])
+        stmt = insert(LeaveBalance).values(
+            employee_id=leave.employee_id,
+            leave_type_id=leave_type_id,
+            year=year,
+            allocated=allocations.get(key, 0),
+            # Cancelling with no balance row yet starts it at zero rather than negative.
+            used=max(direction * days, 0),
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint=BALANCE_CONSTRAINT,
+            set_={
+                "used": func.greatest(LeaveBalance.used + direction * days, 0),
+                "updated_at": func.now(),
+            },
+        )
+        await session.execute(stmt)
+
+
+async def apply_status_change(
+    session: AsyncSession, leave: Leave, old_status: Optional[str], new_status: str
+) -> None:
+    """Keep balances in step with a leave's status; call before committing."""
+    if new_status == LeaveStatus.APPROVED and old_status != LeaveStatus.APPROVED:
+        await adjust_balance(session, leave, 1)
+    elif old_status == LeaveStatus.APPROVED and new_status != LeaveStatus.APPROVED:
+        await adjust_balance(session, leave, -1)
+
+
+async def rebuild_balances(session: AsyncSession, year: int) -> int:
+    """Recompute balances for `year` from approved leaves and current policies.
+
+    Covers active employees and anyone who already has a balance or approved
+    leave in `year`, so leavers' balances are repaired too.
+    """
+    year_start, year_end = date(year, 1, 1), date(year, 12, 31)
+    used_rows = await session.execute(
+        select(
+            Leave.employee_id,
+            LeaveType.id,
+            func.sum(
+                func.least(Leave.end_date, year_end)
+                - func.greatest(Leave.start_date, year_start)
+                + 1
+            ),
+        )
+        .join(LeaveType, LeaveType.name == Leave.leave_type)
+        .where(
+            Leave.status == LeaveStatus.APPROVED,
+            Leave.start_date <= year_end,
+            Leave.end_date >= year_start,
+        )
+        .group_by(Leave.employee_id, LeaveType.id)
+    )
+    used = {
+        (employee_id, leave_type_id): days
+        for employee_id, leave_type_id, days in used_rows
+    }
+    employee_ids = set(
+        (
+            await session.scalars(
+                select(Employee.id).where(Employee.is_active.is_(True))
+            )
+        ).all()
+    )
+    employee_ids.update(
+        (
+            await session.scalars(
+                select(LeaveBalance.employee_id).where(LeaveBalance.year == year)
+            )
+        ).all()
+    )
+    employee_ids.update(employee_id for employee_id, _ in used)
+
+    rows = [
+        {
+            "employee_id": employee_id,
+            "leave_type_id": leave_type_id,
+            "year": year,
+            "allocated": allocated,
+            "used": used.get((employee_id, leave_type_id), 0),
+        }
+        for (employee_id, leave_type_id), allocated in sorted(
+            (await yearly_allocations(session, year, sorted(employee_ids))).items()
+        )
+    ]
+    batch_size = MAX_BIND_PARAMS // len(BALANCE_COLUMNS)
+    for start in range(0, len(rows), batch_size):
+        stmt = insert(LeaveBalance).values(rows[start : start + batch_size])
+        stmt = stmt.on_conflict_do_update(
+            constraint=BALANCE_CONSTRAINT,
+            set_={
+                "allocated": stmt.excluded.allocated,
+                "used": stmt.excluded.used,
+                "updated_at": func.now(),
+            },
+        )
+        await session.execute(stmt)
+    await session.commit()
+    return len(rows)
+
+
+async def get_balances(
+    session: AsyncSession,
+    year: int,
+    employee_id: Optional[int] = None,
+    department_id: Optional[int] = None,
+    cursor: Optional[int] = None,
+    limit: int = 100,
+) -> List[Dict[str, Any]]:
+    """Balances for one employee, or for a page of employees in a department."""
+    page = select(Employee.id).order_by(Employee.id).limit(limit)
+    if employee_id is not None:
+        page = page.where(Employee.id == employee_id)
+    if department_id is not None:
+        page = page.where(Employee.department_id == department_id)
+    if cursor is not None:
+        page = page.where(Employee.id > cursor)
+    employees = page.subquery()
+
+    stmt = (
+        select(
+            LeaveBalance.employee_id,
+            LeaveBalance.leave_type_id,
+            LeaveType.name.label("leave_type"),
+            LeaveBalance.year,
+            LeaveBalance.allocated,
+            LeaveBalance.used,
+            (LeaveBalance.allocated - LeaveBalance.used).label("remaining"),
+        )
+        .join(employees, employees.c.id == LeaveBalance.employee_id)
+        .join(LeaveType, LeaveType.id == LeaveBalance.leave_type_id)
+        .where(LeaveBalance.year == year)
+        .order_by(LeaveBalance.employee_id, LeaveBalance.leave_type_id)
+    )
+    return [dict(row) for row in (await session.execute(stmt)).mappings()]
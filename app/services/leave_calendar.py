@@ -0,0 +1,253 @@
+"""
+Month view of who is on leave or absent, built from per-employee day bitmaps.
+
+Each employee gets one `uint32` per month with bit `d - 1` set for day `d`:
+
+    leave    approved leave overlapping the day
+    absent   an "Absent" attendance row, or an elapsed working day with
+             neither attendance nor approved leave
+
+Leave ranges become bitmasks with one shift per row (`((1 << length) - 1)
+<< first_day`) and are OR-ed per employee with `np.bitwise_or.at`, so the
+cost is one pass over the rows instead of employees x days x leaves. Daily
+coverage counts come from unpacking the bitmaps into an employees x days
+matrix and summing the columns.
+
+Calendars are cached per `(department_id, manager_id, month)`; either id
+may be omitted, so a scope is a department, a manager's direct reports or
+the whole organisation. Approving or cancelling an approved leave
+invalidates the affected months; attendance changes are picked up when
+`LEAVE_CALENDAR_TTL_SECONDS` expires. Calendars built on a read replica are
+cached for at most `REPLICA_MAX_LAG_SECONDS`.
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import cache
+from app.core.database import cache_ttl
+from app.core.settings import settings
+from app.models import Attendance, Employee, Leave
+from app.models.attendance import AttendanceStatus
+from app.models.leave import approved_leave_clause
+from app.services.attendance_report import month_bounds
+from app.services.dashboard import local_today
+
+
+def _cache_key(
+    month_start: date, department_id: Optional[int], manager_id: Optional[int]
+) -> str:
+    return (
+        f"leave_calendar:{month_start:%Y-%m}"
+        f":department:{department_id or '*'}:manager:{manager_id or '*'}"
+    )
+
+
+def range_masks(first_day: np.ndarray, last_day: np.ndarray) -> np.ndarray:
+    """Bitmask per row covering the zero-based days `first_day..last_day`."""
+    lengths = (last_day - first_day + 1).astype(np.uint64)
+    masks: np.ndarray = ((np.uint64(1) << lengths) - np.uint64(1)) << first_day.astype(
+        np.uint64
+    )
+    return masks
+
+
+def day_counts(bitmaps: np.ndarray, days: int) -> np.ndarray:
+    """Number of bitmaps with each of the first `days` bits set."""
+    if not bitmaps.size:
+        return np.zeros(days, dtype=np.int64)
+    bits = (bitmaps[:, None] >> np.arange(days, dtype=np.uint32)) & np.uint32(1)
+    counts: np.ndarray = bits.sum(axis=0)
+    return counts
+
+
+def _day_offsets(days: Sequence[date], month_start: date) -> np.ndarray:
+    return (
+        np.asarray(days, dtype="datetime64[D]") - np.datetime64(month_start)
+    ).astype(np.int64)
+
+
+def _or_into(
+    bitmaps: np.ndarray, ids: np.ndarray, employee_ids: np.ndarray, masks: np.ndarray
+) -> None:
+    index = np.searchsorted(ids, employee_ids)
+    known = (index < len(ids)) & (ids[np.minimum(index, len(ids) - 1)] == employee_ids)
+    np.bitwise_or.at(bitmaps, index[known], masks[known])
+
+
+async def build_leave_calendar(
+    session: AsyncSession,
+    year: int,
+    month: int,
+    department_id: Optional[int] = None,
+    manager_id: Optional[int] = None,
+    today: Optional[date] = None,
+) -> Dict[str, Any]:
+    """Leave and absence bitmaps plus daily counts for active employees in scope."""
+    month_start, month_end = month_bounds(year, month)
+    days = (month_end - month_start).days
+    today = today or local_today()
+
+    scope = select(Employee.id).where(Employee.is_active.is_(True))
+    if department_id is not None:
+        scope = scope.where(Employee.department_id == department_id)
+    if manager_id is not None:
+        scope = scope.where(Employee.manager_id == manager_id)
+
+    employees = (
+        await session.execute(
+            select(
+                Employee.id,
+                Employee.employee_id,
+                Employee.first_name,
+                Employee.last_name,
+            )
+            .where(Employee.id.in_(scope))
+            .order_by(Employee.id)
+        )
+    ).all()
+    ids = np.fromiter((e.id for e in employees), dtype=np.int64, count=len(employees))
+    leave_bits = np.zeros(len(ids), dtype=np.uint64)
+    present_bits = np.zeros(len(ids), dtype=np.uint64)
+    absent_bits = np.zeros(len(ids), dtype=np.uint64)
+
+    leaves = (
+        await session.execute(
+            select(
+                Leave.employee_id,
+                func.greatest(Leave.start_date, month_start),
+                func.least(Leave.end_date, month_end - timedelta(days=1)),
+            ).where(
+                approved_leave_clause(),
+                Leave.start_date < month_end,
+                Leave.end_date >= month_start,
+                Leave.employee_id.in_(scope),
+            )
+        )
+    ).all()
+    if leaves and ids.size:
+        employee_ids, starts, ends = zip(*leaves)
+        masks = range_masks(
+            _day_offsets(starts, month_start), _day_offsets(ends, month_start)
+        )
+        _or_into(leave_bits, ids, np.asarray(employee_ids, dtype=np.int64), masks)
+
+    attendance = (
+        await session.execute(
+            select(
+                Attendance.employee_id,
+                Attendance.date,
+                Attendance.status,
+                Attendance.check_in,
+            ).where(
+                Attendance.date >= month_start,
+                Attendance.date < month_end,
+                Attendance.employee_id.in_(scope),
+            )
+        )
+    ).all()
+    if attendance and ids.size:
+        employee_ids, dates, statuses, check_ins = zip(*attendance)
+        attendees = np.asarray(employee_ids, dtype=np.int64)
+        masks = np.uint64(1) << _day_offsets(dates, month_start).astype(np.uint64)
+        absent = np.fromiter(
+            (status == AttendanceStatus.ABSENT for status in statuses),
+            dtype=bool,
+            count=len(statuses),
+        )
+        present = ~absent & np.fromiter(
+            (
+                status == AttendanceStatus.PRESENT or check_in is not None
+                for status, check_in in zip(statuses, check_ins)
+            ),
+            dtype=bool,
+            count=len(statuses),
+        )
+        _or_into(present_bits, ids, attendees[present], masks[present])
+        _or_into(absent_bits, ids, attendees[absent], masks[absent])
+
+    # Elapsed working days with no attendance and no approved leave count as absent.
+    month_days = np.arange(np.datetime64(month_start), np.datetime64(month_end))
+    elapsed_working = np.is_busday(month_days) & (month_days < np.datetime64(today))
+    elapsed_mask = int(
+        (elapsed_working.astype(np.uint64) << np.arange(days, dtype=np.uint64)).sum()
+    )
+    absent_bits |= np.uint64(elapsed_mask) & ~(present_bits | leave_bits)
+    absent_bits &= ~leave_bits
+
+    leave_bits = leave_bits.astype(np.uint32)
+    absent_bits = absent_bits.astype(np.uint32)
+    on_leave = day_counts(leave_bits, days)
+    absent_count = day_counts(absent_bits, days)
+
+    return {
+        "month": f"{month_start:%Y-%m}",
+        "days_in_month": days,
+        "headcount": len(employees),
+        "days": [
+            {
+                "date": (month_start + timedelta(days=day)).isoformat(),
+                "on_leave": int(on_leave[day]),
+                "absent": int(absent_count[day]),
+            }
+            for day in range(days)
+        ],
+        # Bit d - 1 of leave_days / absent_days is day d of the month.
+        "employees": [
+            {
+                "id": employee.id,
+                "employee_id": employee.employee_id,
+                "first_name": employee.first_name,
+                "last_name": employee.last_name,
+                "leave_days": int(leave_bits[i]),
+                "absent_days": int(absent_bits[i]),
+            }
+            for i, employee in enumerate(employees)
+            if leave_bits[i] or absent_bits[i]
+        ],
+    }
+
+
+async def get_leave_calendar(
+    session: AsyncSession,
+    year: int,
+    month: int,
+    department_id: Optional[int] = None,
+    manager_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Return the cached calendar for a scope and month, building it on a miss."""
+    key = _cache_key(date(year, month, 1), department_id, manager_id)
+    calendar = await cache.get(key)
+    if calendar is None:
+        calendar = await build_leave_calendar(
+            session, year, month, department_id, manager_id
+        )
+        await cache.set(
+            key, calendar, cache_ttl(session, settings.leave_calendar_ttl_seconds)
+        )
+    return calendar
+
+
+async def invalidate_leave_calendar(
+    session: AsyncSession, employee_id: int, start_date: date, end_date: date
+) -> None:
+    """Drop cached calendars showing the employee in any month of the period."""
+    row = (
+        await session.execute(
+            select(Employee.department_id, Employee.manager_id).where(
+                Employee.id == employee_id
+            )
+        )
+    ).one_or_none()
+    departments = {None} if row is None else {None, row.department_id}
+    managers = {None} if row is None else {None, row.manager_id}
+    month = date(start_date.year, start_date.month, 1)
+    while month <= end_date:
+        for department_id in departments:
+            for manager_id in managers:
+                await cache.delete(_cache_key(month, department_id, manager_id))
+        month = month_bounds(month.year, month.month)[1]
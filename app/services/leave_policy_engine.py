@@ -0,0 +1,313 @@
+"""
+Compiled leave-policy evaluation.
+
+`LeavePolicy.details` is parsed once per policy version into a
+`CompiledPolicy`, cached under `(policy_id, updated_at)`. Checking a leave
+request or computing an entitlement then works on plain tuples and dicts
+instead of re-validating the JSON document every time. A stored document
+that no longer validates (written before a schema change) raises
+`PolicyConfigurationError` rather than a bare `ValidationError`.
+"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Employee, LeaveBalance, LeavePolicy
+from app.schemas.leave_policy import LeavePolicyDetails
+
+SIMULATION_BATCH_SIZE = 5000
+
+_PROBATION_UNITS = {"day": 1, "week": 7, "month": 30, "year": 365}
+_PROBATION_PATTERN = re.compile(r"(\d+)\s*(day|week|month|year)", re.IGNORECASE)
+
+
+class PolicyConfigurationError(Exception):
+    """A stored leave policy whose `details` do not validate."""
+
+    def __init__(self, policy_id: int, error: ValidationError):
+        self.policy_id = policy_id
+        self.message = (
+            f"Leave policy {policy_id} is misconfigured, "
+            f"{error.error_count()} invalid field(s) in its details"
+        )
+        super().__init__(self.message)
+
+
+def parse_probation_days(probation_period: Optional[str]) -> int:
+    """Turn values such as "90 days" or "6 months" into a number of days."""
+    if not probation_period:
+        return 0
+    match = _PROBATION_PATTERN.search(probation_period)
+    if match is None:
+        return int(probation_period) if probation_period.strip().isdigit() else 0
+    return int(match.group(1)) * _PROBATION_UNITS[match.group(2).lower()]
+
+
+def months_served(joining_date: date, year: int) -> int:
+    """Whole or started months of service within `year`."""
+    if joining_date.year > year:
+        return 0
+    if joining_date.year < year:
+        return 12
+    return 12 - joining_date.month + 1
+
+
+@dataclass(frozen=True)
+class CompiledAllocation:
+    days_allocated: int
+    accrual_rate: Optional[float]
+    carry_forward_cap: int
+    max_consecutive_days: Optional[int]
+    allowed_during_probation: bool
+
+
+@dataclass(frozen=True)
+class CompiledPolicy:
+    policy_id: Optional[int]
+    allocations: Dict[int, CompiledAllocation]
+    max_consecutive_days: Optional[int]
+    # Merged, sorted, non-overlapping blackout ranges for bisection.
+    blackout_starts: Tuple[date, ...]
+    blackout_ends: Tuple[date, ...]
+
+    def in_blackout(self, start_date: date, end_date: date) -> bool:
+        index = bisect_right(self.blackout_starts, end_date) - 1
+        return index >= 0 and self.blackout_ends[index] >= start_date
+
+    def evaluate(
+        self,
+        leave_type_id: int,
+        start_date: date,
+        end_date: date,
+        joining_date: date,
+        probation_days: int = 0,
+    ) -> List[str]:
+        """Return the policy violations of a leave request (empty when allowed)."""
+        violations = []
+        allocation = self.allocations.get(leave_type_id)
+        if allocation is None:
+            return ["Leave type is not covered by the employee's leave policy"]
+
+        days = (end_date - start_date).days + 1
+        max_days = allocation.max_consecutive_days or self.max_consecutive_days
+        if max_days is not None and days > max_days:
+            violations.append(
+                f"Leave exceeds the maximum of {max_days} consecutive days"
+            )
+        if self.in_blackout(start_date, end_date):
+            violations.append("Leave falls within a blackout period")
+        if (
+            not allocation.allowed_during_probation
+            and start_date < joining_date + timedelta(days=probation_days)
+        ):
+            violations.append("Leave type is not available during probation")
+        return violations
+
+    def entitlement(
+        self, leave_type_id: int, joining_date: date, year: int, carried_over: float = 0
+    ) -> float:
+        """Days available for `year`, including capped carry-forward."""
+        allocation = self.allocations.get(leave_type_id)
+        if allocation is None:
+            return 0
+        base: float
+        if allocation.accrual_rate is None:
+            base = allocation.days_allocated if joining_date.year <= year else 0
+        else:
+            base = min(
+                allocation.days_allocated,
+                allocation.accrual_rate * months_served(joining_date, year),
+            )
+        return base + min(max(carried_over, 0), allocation.carry_forward_cap)
+
+
+def compile_policy(details: Any, policy_id: Optional[int] = None) -> CompiledPolicy:
+    """Validate a policy document and turn it into a `CompiledPolicy`."""
+    parsed = LeavePolicyDetails.model_validate(details or {})
+
+    blackout: List[List[date]] = []
+    for period in sorted(parsed.blackout_dates, key=lambda p: p.start_date):
+        if blackout and period.start_date <= blackout[-1][1] + timedelta(days=1):
+            blackout[-1][1] = max(blackout[-1][1], period.end_date)
+        else:
+            blackout.append([period.start_date, period.end_date])
+
+    return CompiledPolicy(
+        policy_id=policy_id,
+        allocations={
+            allocation.leave_type_id: CompiledAllocation(
+                days_allocated=allocation.days_allocated,
+                accrual_rate=allocation.accrual_rate,
+                carry_forward_cap=allocation.carry_forward_cap,
+                max_consecutive_days=allocation.max_consecutive_days,
+                allowed_during_probation=allocation.allowed_during_probation,
+            )
+            for allocation in parsed.allocations
+        },
+        max_consecutive_days=parsed.max_consecutive_days,
+        blackout_starts=tuple(start for start, _ in blackout),
+        blackout_ends=tuple(end for _, end in blackout),
+    )
+
+
+_compiled: Dict[Tuple[int, Optional[datetime]], CompiledPolicy] = {}
+
+
+async def get_compiled_policy(
+    session: AsyncSession, policy_id: int, updated_at: Optional[datetime]
+) -> Optional[CompiledPolicy]:
+    """Return the compiled policy version, loading `details` only on a miss.
+
+    Raises `PolicyConfigurationError` when the stored details do not validate.
+    """
+    key = (policy_id, updated_at)
+    compiled = _compiled.get(key)
+    if compiled is not None:
+        return compiled
+
+    row = (
+        await session.execute(
+            select(LeavePolicy.details, LeavePolicy.updated_at).where(
+                LeavePolicy.id == policy_id
+            )
+        )
+    ).first()
+    if row is None:
+        return None
+    try:
+        compiled = compile_policy(row.details, policy_id)
+    except ValidationError as e:
+        raise PolicyConfigurationError(policy_id, e) from e
+    # Older versions of the same policy are never asked for again.
+    for stale in [k for k in _compiled if k[0] == policy_id]:
+        del _compiled[stale]
+    _compiled[(policy_id, row.updated_at)] = compiled
+    return compiled
+
+
+def invalidate_policy(policy_id: int) -> None:
+    for stale in [k for k in _compiled if k[0] == policy_id]:
+        del _compiled[stale]
+
+
+async def evaluate_leave_request(
+    session: AsyncSession,
+    employee_id: int,
+    leave_type_id: int,
+    start_date: date,
+    end_date: date,
+) -> List[str]:
+    """Check a leave request against the employee's policy, if one is assigned."""
+    row = (
+        await session.execute(
+            select(
+                Employee.leave_policy_id,
+                LeavePolicy.updated_at,
+                Employee.joining_date,
+                Employee.probation_period,
+            )
+            .join(LeavePolicy, LeavePolicy.id == Employee.leave_policy_id)
+            .where(Employee.id == employee_id)
+        )
+    ).first()
+    if row is None:
+        return []
+    policy = await get_compiled_policy(session, row.leave_policy_id, row.updated_at)
+    if policy is None:
+        return []
+    return policy.evaluate(
+        leave_type_id,
+        start_date,
+        end_date,
+        row.joining_date,
+        parse_probation_days(row.probation_period),
+    )
+
+
+async def simulate_policy_change(
+    session: AsyncSession,
+    policy_id: int,
+    proposed_details: LeavePolicyDetails,
+    year: int,
+) -> Optional[Dict[str, Any]]:
+    """Compare entitlements under the current and a proposed version of a policy.
+
+    Employees assigned to the policy are streamed in batches; only employees
+    whose entitlement changes are listed.
+    """
+    current = await get_compiled_policy(
+        session,
+        policy_id,
+        await session.scalar(
+            select(LeavePolicy.updated_at).where(LeavePolicy.id == policy_id)
+        ),
+    )
+    if current is None:
+        return None
+    proposed = compile_policy(proposed_details.model_dump())
+    leave_type_ids = sorted(set(current.allocations) | set(proposed.allocations))
+
+    # Carry-forward comes from what was left over at the end of the previous year.
+    previous = {
+        (employee_id, leave_type_id): remaining
+        for employee_id, leave_type_id, remaining in await session.execute(
+            select(
+                LeaveBalance.employee_id,
+                LeaveBalance.leave_type_id,
+                LeaveBalance.allocated - LeaveBalance.used,
+            )
+            .join(Employee, Employee.id == LeaveBalance.employee_id)
+            .where(Employee.leave_policy_id == policy_id, LeaveBalance.year == year - 1)
+        )
+    }
+
+    employees = await session.stream(
+        select(Employee.id, Employee.joining_date)
+        .where(Employee.leave_policy_id == policy_id, Employee.is_active.is_(True))
+        .order_by(Employee.id)
+        .execution_options(yield_per=SIMULATION_BATCH_SIZE)
+    )
+    changes = []
+    totals = {
+        leave_type_id: {"current": 0.0, "proposed": 0.0}
+        for leave_type_id in leave_type_ids
+    }
+    employee_count = 0
+    async for employee_id, joining_date in employees:
+        employee_count += 1
+        employee_changes = []
+        for leave_type_id in leave_type_ids:
+            carried = previous.get((employee_id, leave_type_id), 0)
+            before = current.entitlement(leave_type_id, joining_date, year, carried)
+            after = proposed.entitlement(leave_type_id, joining_date, year, carried)
+            totals[leave_type_id]["current"] += before
+            totals[leave_type_id]["proposed"] += after
+            if before != after:
+                employee_changes.append(
+                    {
+                        "leave_type_id": leave_type_id,
+                        "current": before,
+                        "proposed": after,
+                    }
+                )
+        if employee_changes:
+            changes.append({"employee_id": employee_id, "changes": employee_changes})
+
+    return {
+        "policy_id": policy_id,
+        "year": year,
+        "employees": employee_count,
+        "employees_affected": len(changes),
+        "totals": [
+            {"leave_type_id": leave_type_id, **values}
+            for leave_type_id, values in totals.items()
+        ],
+        "changes": changes,
+    }
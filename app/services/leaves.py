@@ -0,0 +1,184 @@
+"""
+Leave request workflow: applying for leave and moving requests between statuses.
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Employee, Leave
+from app.models.leave import (
+    LeaveStatus,
+    active_leave_clause,
+    approved_leave_clause,
+    leave_period,
+)
+from app.schemas.leave import LeaveCreate
+from app.services.dashboard import invalidate_team_dashboards, local_today
+from app.services.leave_balances import apply_status_change
+from app.services.leave_calendar import invalidate_leave_calendar
+from app.services.leave_policy_engine import (
+    PolicyConfigurationError,
+    evaluate_leave_request,
+)
+from app.services.lookups import get_employee_summaries, lookup_names
+
+# Status -> statuses it may move to.
+ALLOWED_TRANSITIONS: Dict[Optional[str], Set[str]] = {
+    LeaveStatus.PENDING: {
+        LeaveStatus.APPROVED,
+        LeaveStatus.REJECTED,
+        LeaveStatus.CANCELLED,
+    },
+    LeaveStatus.APPROVED: {LeaveStatus.CANCELLED},
+}
+
+
+class LeaveError(Exception):
+    """A leave request that cannot be accepted or changed."""
+
+    def __init__(self, message: str, status_code: int = 422):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+async def apply_for_leave(session: AsyncSession, payload: LeaveCreate) -> Leave:
+    if payload.end_date < payload.start_date:
+        raise LeaveError("end_date must not be before start_date")
+    leave_type_ids = {
+        name: lookup_id
+        for lookup_id, name in (await lookup_names(session, "leave_types")).items()
+    }
+    if payload.leave_type not in leave_type_ids:
+        raise LeaveError(f"Unknown leave type: {payload.leave_type}")
+
+    overlapping = await find_overlapping_leave(
+        session, payload.employee_id, payload.start_date, payload.end_date
+    )
+    if overlapping is not None:
+        raise LeaveError(
+            f"Leave overlaps existing request {overlapping}", status_code=409
+        )
+
+    try:
+        violations = await evaluate_leave_request(
+            session,
+            payload.employee_id,
+            leave_type_ids[payload.leave_type],
+            payload.start_date,
+            payload.end_date,
+        )
+    except PolicyConfigurationError as e:
+        raise LeaveError(e.message)
+    if violations:
+        raise LeaveError("; ".join(violations))
+
+    leave = Leave(**payload.model_dump(exclude={"status", "approved_by_id"}))
+    leave.status = LeaveStatus.PENDING
+    session.add(leave)
+    try:
+        await session.commit()
+    except IntegrityError as e:
+        await session.rollback()
+        # A concurrent request won the race for the same days.
+        if "ex_leaves_employee_period" in str(e.orig):
+            raise LeaveError("Leave overlaps an existing request", status_code=409)
+        if "fk_leaves_employee_id_employees" in str(e.orig):
+            raise LeaveError("Employee not found", status_code=404)
+        raise
+    await invalidate_team_dashboards(session, [leave.employee_id], [local_today()])
+    return leave
+
+
+async def find_overlapping_leave(
+    session: AsyncSession, employee_id: int, start_date: date, end_date: date
+) -> Optional[int]:
+    """Id of a pending or approved leave of the employee overlapping the dates."""
+    leave_id: Optional[int] = await session.scalar(
+        select(Leave.id)
+        .where(
+            Leave.employee_id == employee_id,
+            active_leave_clause(),
+            leave_period(Leave.start_date, Leave.end_date).op("&&")(
+                leave_period(start_date, end_date)
+            ),
+        )
+        .limit(1)
+    )
+    return leave_id
+
+
+async def get_team_leaves(
+    session: AsyncSession,
+    start_date: date,
+    end_date: date,
+    manager_id: Optional[int] = None,
+    department_id: Optional[int] = None,
+    include_pending: bool = False,
+) -> List[Dict[str, Any]]:
+    """Leaves of a manager's direct reports or a department overlapping a period."""
+    stmt = (
+        select(
+            Leave.employee_id,
+            Leave.id.label("leave_id"),
+            Leave.leave_type,
+            Leave.start_date,
+            Leave.end_date,
+            Leave.status,
+        )
+        .join(Employee, Employee.id == Leave.employee_id)
+        .where(
+            active_leave_clause() if include_pending else approved_leave_clause(),
+            leave_period(Leave.start_date, Leave.end_date).op("&&")(
+                leave_period(start_date, end_date)
+            ),
+        )
+        .order_by(Leave.start_date, Employee.id)
+    )
+    if manager_id is not None:
+        stmt = stmt.where(Employee.manager_id == manager_id)
+    if department_id is not None:
+        stmt = stmt.where(Employee.department_id == department_id)
+    leaves = [dict(row) for row in (await session.execute(stmt)).mappings()]
+    employees = await get_employee_summaries(
+        session, (leave["employee_id"] for leave in leaves)
+    )
+    for leave in leaves:
+        leave["employee"] = employees[leave["employee_id"]]
+    return leaves
+
+
+async def change_leave_status(
+    session: AsyncSession,
+    leave_id: int,
+    new_status: str,
+    actor_id: Optional[int] = None,
+) -> Leave:
+    """Move a leave to `new_status` and update balances in the same transaction."""
+    # Lock the row so two concurrent approvals cannot both count the days.
+    leave = await session.scalar(
+        select(Leave).where(Leave.id == leave_id).with_for_update()
+    )
+    if leave is None:
+        raise LeaveError("Leave not found", status_code=404)
+    old_status = leave.status
+    if new_status not in ALLOWED_TRANSITIONS.get(old_status, set()):
+        raise LeaveError(
+            f"Cannot change leave from {old_status} to {new_status}", status_code=409
+        )
+
+    leave.status = new_status
+    if new_status in (LeaveStatus.APPROVED, LeaveStatus.REJECTED):
+        leave.approved_by_id = actor_id
+    await apply_status_change(session, leave, old_status, new_status)
+    await session.commit()
+    if LeaveStatus.APPROVED in (old_status, new_status):
+        await invalidate_leave_calendar(
+            session, leave.employee_id, leave.start_date, leave.end_date
+        )
+    await invalidate_team_dashboards(session, [leave.employee_id], [local_today()])
+    return leave
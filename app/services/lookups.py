@@ -0,0 +1,136 @@
+"""
+Read-through cache for small, rarely changing lookup tables.
+
+Each table is cached as a whole snapshot (`rows` plus an `etag`) for
+`LOOKUP_CACHE_TTL_SECONDS` and dropped explicitly whenever it is written
+through the API. Snapshots back the list endpoints (with ETag support) and
+id -> name resolution for employee pages.
+"""
+
+import asyncio
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import cache
+from app.core.database import AsyncSessionLocal
+from app.core.settings import settings
+from app.models import (
+    CompanyUnit,
+    Department,
+    Designation,
+    Employee,
+    JobType,
+    LeaveType,
+)
+from app.models.employee import SUMMARY_FIELDS
+from app.schemas import EmployeeSummary
+
+
+@dataclass(frozen=True)
+class LookupTable:
+    model: Any
+    name_field: str
+
+
+LOOKUP_TABLES: Dict[str, LookupTable] = {
+    "departments": LookupTable(Department, "name"),
+    "designations": LookupTable(Designation, "title"),
+    "job_types": LookupTable(JobType, "type_name"),
+    "leave_types": LookupTable(LeaveType, "name"),
+    "company_units": LookupTable(CompanyUnit, "unit_name"),
+}
+
+# Employee foreign key -> (lookup table, key added to the employee payload).
+EMPLOYEE_LOOKUP_FIELDS = {
+    "department_id": ("departments", "department_name"),
+    "designation_id": ("designations", "designation_name"),
+    "work_location_id": ("company_units", "work_location_name"),
+    "job_type_id": ("job_types", "job_type_name"),
+}
+
+SUMMARY_COLUMNS = [Employee.__table__.c[name] for name in SUMMARY_FIELDS]
+
+_load_locks: Dict[str, asyncio.Lock] = {}
+
+
+def _cache_key(table: str) -> str:
+    return f"lookup:{table}"
+
+
+async def _load_snapshot(session: AsyncSession, table: str) -> Dict[str, Any]:
+    model = LOOKUP_TABLES[table].model
+    columns = model.__table__.c
+    result = await session.execute(select(*columns).order_by(columns.id))
+    rows = jsonable_encoder([dict(row) for row in result.mappings()])
+    etag = hashlib.sha1(json.dumps(rows, sort_keys=True).encode()).hexdigest()
+    return {"rows": rows, "etag": f'"{etag}"'}
+
+
+async def get_lookup(session: AsyncSession, table: str) -> Dict[str, Any]:
+    """Return the cached snapshot of a lookup table, loading it on a miss."""
+    key = _cache_key(table)
+    snapshot: Optional[Dict[str, Any]] = await cache.get(key)
+    if snapshot is not None:
+        return snapshot
+
+    # Only one coroutine per process reloads a table; the others wait for it.
+    lock = _load_locks.setdefault(table, asyncio.Lock())
+    async with lock:
+        snapshot = await cache.get(key)
+        if snapshot is None:
+            # Always reload from the primary: a lagging replica would pin a
+            # stale snapshot in the cache for a whole TTL after a write.
+            async with AsyncSessionLocal() as primary:
+                snapshot = await _load_snapshot(primary, table)
+            await cache.set(key, snapshot, settings.lookup_cache_ttl_seconds)
+    return snapshot
+
+
+async def get_lookup_row(
+    session: AsyncSession, table: str, row_id: int
+) -> Optional[Dict[str, Any]]:
+    snapshot = await get_lookup(session, table)
+    return next((row for row in snapshot["rows"] if row["id"] == row_id), None)
+
+
+async def invalidate_lookup(table: str) -> None:
+    await cache.delete(_cache_key(table))
+
+
+async def lookup_names(session: AsyncSession, table: str) -> Dict[int, str]:
+    """Map ids to display names for a lookup table."""
+    name_field = LOOKUP_TABLES[table].name_field
+    snapshot = await get_lookup(session, table)
+    return {row["id"]: row[name_field] for row in snapshot["rows"]}
+
+
+async def resolve_employee_names(
+    session: AsyncSession, items: Iterable[Dict[str, Any]]
+) -> None:
+    """Add lookup names next to the foreign keys present in employee rows."""
+    items = list(items)
+    if not items:
+        return
+    for fk_field, (table, name_key) in EMPLOYEE_LOOKUP_FIELDS.items():
+        if fk_field not in items[0]:
+            continue
+        names = await lookup_names(session, table)
+        for item in items:
+            item[name_key] = names.get(item[fk_field])
+
+
+async def get_employee_summaries(
+    session: AsyncSession, employee_ids: Iterable[int]
+) -> Dict[int, EmployeeSummary]:
+    """Summaries for a set of employee ids, served from `ix_employees_summary`."""
+    ids: List[int] = list(set(employee_ids))
+    if not ids:
+        return {}
+    result = await session.execute(select(*SUMMARY_COLUMNS).where(Employee.id.in_(ids)))
+    return {row["id"]: EmployeeSummary.model_validate(row) for row in result.mappings()}
@@ -0,0 +1,141 @@
+"""
+Reporting-hierarchy queries over `Employee.manager_id`.
+
+Every query is a single recursive CTE, so walking a tree costs one round trip
+regardless of its depth. Each CTE row carries the path walked so far, which
+guards against accidental `manager_id` cycles.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import CTE, Integer, all_, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, array
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models import Employee
+
+# Hard stop for runaway recursion on corrupt data.
+MAX_ORG_DEPTH = 64
+
+ORG_NODE_COLUMNS = (
+    Employee.id,
+    Employee.employee_id,
+    Employee.first_name,
+    Employee.last_name,
+    Employee.designation_id,
+    Employee.department_id,
+    Employee.manager_id,
+    Employee.is_active,
+)
+
+
+def _subtree_cte(root_id: int, max_depth: Optional[int] = None) -> CTE:
+    """CTE of `(id, depth, branch_id, path)` for `root_id` and everyone below it.
+
+    `branch_id` is the direct report of the root each row descends from.
+    """
+    depth_limit = (
+        min(max_depth, MAX_ORG_DEPTH) if max_depth is not None else MAX_ORG_DEPTH
+    )
+    tree = (
+        select(
+            Employee.id.label("id"),
+            literal(0).label("depth"),
+            literal(None, type_=Integer).label("branch_id"),
+            array([Employee.id], type_=Integer).label("path"),
+        )
+        .where(Employee.id == root_id)
+        .cte("org_subtree", recursive=True)
+    )
+    child = aliased(Employee)
+    tree = tree.union_all(
+        select(
+            child.id,
+            tree.c.depth + 1,
+            func.coalesce(tree.c.branch_id, child.id),
+            func.array_append(tree.c.path, child.id, type_=ARRAY(Integer)),
+        ).where(
+            child.manager_id == tree.c.id,
+            child.id != all_(tree.c.path),
+            tree.c.depth < depth_limit,
+        )
+    )
+    return tree
+
+
+async def get_subtree(
+    session: AsyncSession, root_id: int, max_depth: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Return the root and everyone reporting to it, directly or indirectly."""
+    tree = _subtree_cte(root_id, max_depth)
+    stmt = (
+        select(*ORG_NODE_COLUMNS, tree.c.depth)
+        .join(tree, tree.c.id == Employee.id)
+        .order_by(tree.c.depth, Employee.id)
+    )
+    return [dict(row) for row in (await session.execute(stmt)).mappings()]
+
+
+async def get_management_chain(
+    session: AsyncSession, employee_id: int
+) -> List[Dict[str, Any]]:
+    """Return the employee followed by each manager up to the root."""
+    chain = (
+        select(
+            Employee.id.label("id"),
+            Employee.manager_id.label("manager_id"),
+            literal(0).label("level"),
+            array([Employee.id], type_=Integer).label("path"),
+        )
+        .where(Employee.id == employee_id)
+        .cte("management_chain", recursive=True)
+    )
+    manager = aliased(Employee)
+    chain = chain.union_all(
+        select(
+            manager.id,
+            manager.manager_id,
+            chain.c.level + 1,
+            func.array_append(chain.c.path, manager.id, type_=ARRAY(Integer)),
+        ).where(
+            manager.id == chain.c.manager_id,
+            manager.id != all_(chain.c.path),
+            chain.c.level < MAX_ORG_DEPTH,
+        )
+    )
+    stmt = (
+        select(*ORG_NODE_COLUMNS, chain.c.level)
+        .join(chain, chain.c.id == Employee.id)
+        .order_by(chain.c.level)
+    )
+    return [dict(row) for row in (await session.execute(stmt)).mappings()]
+
+
+async def get_headcount(
+    session: AsyncSession, root_id: int
+) -> Optional[Dict[str, Any]]:
+    """Active headcount under `root_id`, in total and per direct-report branch."""
+    tree = _subtree_cte(root_id)
+    stmt = (
+        select(tree.c.branch_id, func.count().label("headcount"))
+        .select_from(tree)
+        .join(Employee, Employee.id == tree.c.id)
+        .where(Employee.is_active.is_(True) | (tree.c.depth == 0))
+        .group_by(tree.c.branch_id)
+    )
+    rows = (await session.execute(stmt)).all()
+    if not rows:
+        return None
+
+    branches = {branch_id: headcount for branch_id, headcount in rows}
+    # The root is the only row without a branch.
+    branches.pop(None, None)
+    return {
+        "employee_id": root_id,
+        "total": sum(branches.values()),
+        "branches": [
+            {"employee_id": branch_id, "headcount": headcount}
+            for branch_id, headcount in sorted(branches.items())
+        ],
+    }
@@ -0,0 +1,44 @@
+"""
+Shift start times and the lateness rule.
+
+The monthly attendance report and the manager dashboard both decide
+lateness with `is_late`, so an employee late on the dashboard is late in the
+report too.
+"""
+
+import re
+from typing import Any, Optional
+
+# Used when neither the employee's shift nor DEFAULT_SHIFT_START parses.
+FALLBACK_SHIFT_START = 9 * 3600
+
+_SHIFT_START_PATTERN = re.compile(r"^\s*(\d{1,2})(?::(\d{2}))?\s*([AaPp][Mm])?")
+
+
+def parse_shift_start(shift_timing: Optional[str]) -> Optional[int]:
+    """Seconds after midnight at which a shift such as "9:00 AM - 6:00 PM" starts."""
+    if not shift_timing:
+        return None
+    match = _SHIFT_START_PATTERN.match(shift_timing)
+    if match is None:
+        return None
+    hour, minute, meridiem = (
+        int(match.group(1)),
+        int(match.group(2) or 0),
+        match.group(3),
+    )
+    if meridiem:
+        hour = hour % 12 + (12 if meridiem.lower() == "pm" else 0)
+    if hour > 23 or minute > 59:
+        return None
+    return hour * 3600 + minute * 60
+
+
+def is_late(check_in: Any, shift_start: Any, grace_minutes: int) -> Any:
+    """Whether a check-in, in seconds after local midnight, is late.
+
+    Check-ins count by the minute: with a 9:00 start and 10 minutes' grace,
+    9:10:59 is on time and 9:11:00 is late. Works element-wise on numpy
+    arrays; a NaN check-in is never late.
+    """
+    return check_in // 60 * 60 > shift_start + grace_minutes * 60
@@ -0,0 +1,137 @@
+"""
+Attendance ingestion benchmark.
+
+Compares one transaction per punch with the micro-batched upsert path used by
+`POST /api/v1/attendance/batch`. Requires the database configured in `.env`.
+
+Usage:
+    python -m benchmarks.attendance_ingest --employees 2000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import List
+
+from sqlalchemy import delete, select
+
+from app.core.database import AsyncSessionLocal, async_engine, create_tables
+from app.models import Attendance, Employee
+from app.schemas.attendance import AttendanceEvent
+from app.services.attendance_ingest import AttendanceBatcher, write_events
+from app.services.employee_import import upsert_employees
+
+BENCH_PREFIX = "BENCH-ATT-"
+
+
+async def seed_employees(count: int) -> List[int]:
+    rows = [
+        {
+            "employee_id": f"{BENCH_PREFIX}{i:06d}",
+            "first_name": "Bench",
+            "last_name": f"Employee {i}",
+            "email": f"bench.attendance.{i}@example.com",
+            "joining_date": date(2020, 1, 1),
+        }
+        for i in range(count)
+    ]
+    async with AsyncSessionLocal() as session:
+        await upsert_employees(session, rows, frozenset(rows[0]))
+        await session.commit()
+        result = await session.execute(
+            select(Employee.id).where(Employee.employee_id.like(f"{BENCH_PREFIX}%"))
+        )
+        return list(result.scalars())
+
+
+async def cleanup() -> None:
+    async with AsyncSessionLocal() as session:
+        ids = select(Employee.id).where(Employee.employee_id.like(f"{BENCH_PREFIX}%"))
+        await session.execute(delete(Attendance).where(Attendance.employee_id.in_(ids)))
+        await session.execute(
+            delete(Employee).where(Employee.employee_id.like(f"{BENCH_PREFIX}%"))
+        )
+        await session.commit()
+
+
+def make_events(employee_ids: List[int], day: date) -> List[AttendanceEvent]:
+    start = datetime(day.year, day.month, day.day, 9, tzinfo=timezone.utc)
+    events = []
+    for employee_id in employee_ids:
+        events.append(
+            AttendanceEvent(
+                employee_id=employee_id,
+                event_type="check_in",
+                timestamp=start + timedelta(seconds=random.randint(-1800, 1800)),
+            )
+        )
+        events.append(
+            AttendanceEvent(
+                employee_id=employee_id,
+                event_type="check_out",
+                timestamp=start
+                + timedelta(hours=9, seconds=random.randint(-1800, 1800)),
+            )
+        )
+    random.shuffle(events)
+    return events
+
+
+async def run_per_punch(events: List[AttendanceEvent], concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def punch(event: AttendanceEvent) -> None:
+        async with semaphore:
+            async with AsyncSessionLocal() as session:
+                await write_events(session, [event])
+
+    started = time.perf_counter()
+    await asyncio.gather(*(punch(event) for event in events))
+    return time.perf_counter() - started
+
+
+async def run_batched(events: List[AttendanceEvent], concurrency: int) -> float:
+    batcher = AttendanceBatcher()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def punch(event: AttendanceEvent) -> None:
+        async with semaphore:
+            await batcher.submit([event])
+
+    started = time.perf_counter()
+    await asyncio.gather(*(punch(event) for event in events))
+    await batcher.close()
+    return time.perf_counter() - started
+
+
+async def main(args: argparse.Namespace) -> dict:
+    await create_tables()
+    try:
+        employee_ids = await seed_employees(args.employees)
+        results = {}
+        for offset, (name, runner) in enumerate(
+            [("per_punch", run_per_punch), ("batched", run_batched)]
+        ):
+            events = make_events(
+                employee_ids, date(2000, 1, 1) + timedelta(days=offset)
+            )
+            elapsed = await runner(events, args.concurrency)
+            results[name] = {
+                "events": len(events),
+                "seconds": round(elapsed, 3),
+                "events_per_second": round(len(events) / elapsed, 1),
+            }
+        return results
+    finally:
+        await cleanup()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--employees", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
@@ -0,0 +1,80 @@
+"""
+Compare two benchmark result files from `benchmarks.run`.
+
+Prints every latency (`*_ms`) and throughput (`*_per_second`) metric present
+in both files with its relative change, flagging changes beyond
+`--threshold` percent in the wrong direction as regressions.
+
+Usage:
+    python -m benchmarks.compare benchmarks/results/base.json \
+        benchmarks/results/head.json
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, Iterator, Tuple
+
+
+def flatten(data: Any, prefix: str = "") -> Iterator[Tuple[str, float]]:
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield from flatten(value, f"{prefix}.{key}" if prefix else key)
+    elif isinstance(data, (int, float)) and not isinstance(data, bool):
+        yield prefix, float(data)
+
+
+def metrics(path: str) -> Dict[str, float]:
+    with open(path) as f:
+        results = json.load(f)
+    return {
+        key: value
+        for key, value in flatten(results.get("suites", {}))
+        if key.endswith("_ms") or key.endswith("_per_second")
+    }
+
+
+def compare(base: Dict[str, float], head: Dict[str, float], threshold: float):
+    rows, regressions = [], 0
+    for key in sorted(base.keys() & head.keys()):
+        before, after = base[key], head[key]
+        change = (after - before) / before * 100 if before else 0.0
+        # Latency should go down, throughput up.
+        worse = change > threshold if key.endswith("_ms") else change < -threshold
+        regressions += worse
+        rows.append((key, before, after, change, worse))
+    return rows, regressions
+
+
+def main(args: argparse.Namespace) -> int:
+    rows, regressions = compare(metrics(args.base), metrics(args.head), args.threshold)
+    width = max((len(row[0]) for row in rows), default=10)
+    print(f"{'metric':<{width}}  {'base':>12}  {'head':>12}  {'change':>8}")
+    for key, before, after, change, worse in rows:
+        flag = "  REGRESSION" if worse else ""
+        print(
+            f"{key:<{width}}  {before:>12.3f}  {after:>12.3f}  {change:>+7.1f}%{flag}"
+        )
+    print(
+        f"\n{len(rows)} metrics compared, "
+        f"{regressions} regressions beyond {args.threshold:g}%"
+    )
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="Percent change treated as significant",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit 1 when any metric regresses",
+    )
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,476 @@
+"""
+Synthetic dataset generator for the benchmark suite.
+
+Fills an empty database with N employees spread over company units,
+departments, designations and job types, a management tree, and `--years`
+of attendance and leave up to yesterday. Rows are generated inside Postgres
+with `generate_series`, and "random" choices hash the row key with the seed
+(`hashtext`), so the same arguments always produce the same data regardless
+of query plan. Millions of attendance rows load in seconds.
+
+Refuses to touch a database that already has employees unless `--reset` is
+given, which TRUNCATEs every HRMS table. Point `.env` at a scratch database;
+the load runs with `session_replication_role = replica`, so the database
+user must be a superuser.
+
+Usage:
+    python -m benchmarks.datagen --employees 10000 --years 2 --reset
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import date, timedelta
+
+from loguru import logger
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import async_engine, create_tables
+from app.core.settings import settings
+from app.models import Attendance, ChangeLog, Employee, Leave
+from app.services.attendance_partitions import ensure_partitions
+from app.services.leave_balances import rebuild_balances
+
+TABLES = (
+    "change_log",
+    "background_jobs",
+    "leave_balances",
+    "attendance",
+    "leaves",
+    "employees",
+    "leave_policies",
+    "leave_types",
+    "job_types",
+    "designations",
+    "departments",
+    "company_units",
+)
+
+FIRST_NAMES = [
+    "Aarav",
+    "Aditi",
+    "Alice",
+    "Amir",
+    "Ana",
+    "Arjun",
+    "Ben",
+    "Carlos",
+    "Chen",
+    "Chloe",
+    "Daniel",
+    "Deepa",
+    "Elena",
+    "Emma",
+    "Fatima",
+    "Gabriel",
+    "Hana",
+    "Ibrahim",
+    "Isha",
+    "James",
+    "Jin",
+    "Kavya",
+    "Lars",
+    "Leila",
+    "Liam",
+    "Lucia",
+    "Maya",
+    "Mei",
+    "Mohammed",
+    "Nadia",
+    "Noah",
+    "Olivia",
+    "Omar",
+    "Priya",
+    "Rahul",
+    "Rosa",
+    "Sakura",
+    "Samuel",
+    "Sara",
+    "Sofia",
+    "Tariq",
+    "Thomas",
+    "Uma",
+    "Victor",
+    "Wei",
+    "Yara",
+    "Yusuf",
+    "Zara",
+    "Zoe",
+    "Krish",
+]
+LAST_NAMES = [
+    "Agarwal",
+    "Ahmed",
+    "Alvarez",
+    "Anderson",
+    "Bauer",
+    "Brown",
+    "Chen",
+    "Costa",
+    "Das",
+    "Dubois",
+    "Fernandes",
+    "Garcia",
+    "Gupta",
+    "Hansen",
+    "Hernandez",
+    "Ito",
+    "Iyer",
+    "Jansen",
+    "Johnson",
+    "Kapoor",
+    "Khan",
+    "Kim",
+    "Kowalski",
+    "Kumar",
+    "Lee",
+    "Li",
+    "Lopez",
+    "Martin",
+    "Mehta",
+    "Miller",
+    "Moreau",
+    "Nakamura",
+    "Nguyen",
+    "Novak",
+    "Okafor",
+    "Patel",
+    "Perez",
+    "Reddy",
+    "Rossi",
+    "Sato",
+    "Schmidt",
+    "Shah",
+    "Silva",
+    "Singh",
+    "Smith",
+    "Tanaka",
+    "Verma",
+    "Wang",
+    "Williams",
+    "Yilmaz",
+]
+SHIFTS = [
+    "9:00 AM - 6:00 PM",
+    "8:00 AM - 5:00 PM",
+    "10:00 AM - 7:00 PM",
+    "2:00 PM - 11:00 PM",
+]
+LEAVE_TYPES = ["Annual Leave", "Sick Leave", "Casual Leave"]
+
+
+def pick(seed: int, salt: str, key: str, modulo: int) -> str:
+    """SQL for a deterministic pseudo-random integer in [0, modulo) per row key."""
+    return f"(abs(hashtext('{seed}:{salt}:' || {key})) % {modulo})"
+
+
+async def seed_lookups(session: AsyncSession, args: argparse.Namespace) -> None:
+    await session.execute(
+        text(
+            "INSERT INTO company_units (unit_name, address) "
+            "SELECT 'Office ' || n, n || ' Main Street' FROM generate_series(1, :n) n"
+        ),
+        {"n": args.units},
+    )
+    await session.execute(
+        text(
+            "INSERT INTO departments (name) "
+            "SELECT 'Department ' || n FROM generate_series(1, :n) n"
+        ),
+        {"n": args.departments},
+    )
+    await session.execute(
+        text(
+            "INSERT INTO designations (title) "
+            "SELECT 'Designation ' || n FROM generate_series(1, :n) n"
+        ),
+        {"n": args.designations},
+    )
+    await session.execute(
+        text(
+            "INSERT INTO job_types (type_name) "
+            "VALUES ('Full-time'), ('Part-time'), ('Contract')"
+        )
+    )
+    await session.execute(
+        text("INSERT INTO leave_types (name) SELECT unnest(CAST(:names AS text[]))"),
+        {"names": LEAVE_TYPES},
+    )
+    await session.execute(
+        text(
+            "INSERT INTO leave_policies (policy_name, details) "
+            "VALUES ('Standard', '{}'::jsonb)"
+        )
+    )
+
+
+async def seed_employees(session: AsyncSession, args: argparse.Namespace) -> None:
+    seed, key = args.seed, "n::text"
+    await session.execute(
+        text(
+            f"""
+            INSERT INTO employees (
+                employee_id, first_name, last_name, email, department_id,
+                designation_id, work_location_id, job_type_id, joining_date,
+                shift_timing, weekly_hours, annual_leave_total, sick_leave_total,
+                casual_leave_total, leave_policy_id, salary, currency,
+                pay_frequency, is_active
+            )
+            SELECT
+                'EMP' || lpad(n::text, 7, '0'),
+                (CAST(:first_names AS text[]))[
+                    1 + {pick(seed, 'first', key, len(FIRST_NAMES))}
+                ],
+                (CAST(:last_names AS text[]))[
+                    1 + {pick(seed, 'last', key, len(LAST_NAMES))}
+                ],
+                'employee' || n || '@example.com',
+                1 + {pick(seed, 'department', key, args.departments)},
+                1 + {pick(seed, 'designation', key, args.designations)},
+                1 + {pick(seed, 'unit', key, args.units)},
+                1 + {pick(seed, 'job_type', key, 3)},
+                CAST(:history_start AS date) - {pick(seed, 'joined', key, 3650)},
+                (CAST(:shifts AS text[]))[
+                    1 + {pick(seed, 'shift', key, len(SHIFTS))}
+                ],
+                40,
+                20, 10, 8, 1,
+                30000 + {pick(seed, 'salary', key, 170000)},
+                'USD', 'Monthly',
+                {pick(seed, 'inactive', key, 50)} > 0
+            FROM generate_series(1, :n) n
+            """
+        ),
+        {
+            "n": args.employees,
+            "first_names": FIRST_NAMES,
+            "last_names": LAST_NAMES,
+            "shifts": SHIFTS,
+            "history_start": args.history_start,
+        },
+    )
+    # A tree with `fanout` direct reports per manager, rooted at the first employee.
+    await session.execute(
+        text(
+            """
+            WITH ranked AS (
+                SELECT id, row_number() OVER (ORDER BY id) - 1 AS n FROM employees
+            )
+            UPDATE employees e SET manager_id = m.id
+            FROM ranked r JOIN ranked m ON m.n = (r.n - 1) / :fanout
+            WHERE e.id = r.id AND r.n > 0
+            """
+        ),
+        {"fanout": args.fanout},
+    )
+
+
+async def seed_leaves(session: AsyncSession, args: argparse.Namespace) -> None:
+    """Up to one leave per employee per 30-day slot.
+
+    Pending and approved leaves therefore never overlap.
+    """
+    seed, key = args.seed, "e.id || ':' || s"
+    await session.execute(
+        text(
+            f"""
+            INSERT INTO leaves (
+                employee_id, leave_type, start_date, end_date, reason, status
+            )
+            SELECT
+                e.id,
+                (CAST(:leave_types AS text[]))[
+                    1 + {pick(seed, 'leave_type', key, len(LEAVE_TYPES))}
+                ],
+                slot_start,
+                slot_start + {pick(seed, 'leave_length', key, 5)},
+                'Synthetic leave',
+                CASE
+                    WHEN slot_start >= CAST(:today AS date) - 14
+                        AND {pick(seed, 'pending', key, 2)} = 0 THEN 'Pending'
+                    WHEN {pick(seed, 'status', key, 10)} = 0 THEN 'Rejected'
+                    ELSE 'Approved'
+                END
+            FROM employees e
+            CROSS JOIN generate_series(0, :slots - 1) s
+            CROSS JOIN LATERAL (
+                SELECT CAST(:history_start AS date) + s * 30
+                    + {pick(seed, 'leave_offset', key, 24)} AS slot_start
+            ) slot
+            WHERE {pick(seed, 'takes_leave', key, 100)} < :leave_percent
+            """
+        ),
+        {
+            "leave_types": LEAVE_TYPES,
+            "history_start": args.history_start,
+            "today": args.today,
+            "slots": (args.today - args.history_start).days // 30 + 1,
+            "leave_percent": args.leave_percent,
+        },
+    )
+
+
+async def seed_attendance(session: AsyncSession, args: argparse.Namespace) -> None:
+    """One row per working day not on approved leave.
+
+    A few days are missed or marked absent.
+    """
+    months = []
+    month = args.history_start.replace(day=1)
+    while month <= args.today:
+        months.append(month)
+        month = (month + timedelta(days=32)).replace(day=1)
+    await ensure_partitions(session, months)
+
+    seed, key = args.seed, "e.id || ':' || g.day"
+    for month in months:
+        # One statement per month keeps each transaction and its WAL bounded.
+        month_end = min((month + timedelta(days=32)).replace(day=1), args.today)
+        await session.execute(
+            text(
+                f"""
+                INSERT INTO attendance (
+                    employee_id, date, check_in, check_out, status
+                )
+                SELECT
+                    e.id,
+                    g.day,
+                    CASE WHEN absent THEN NULL ELSE check_in END,
+                    CASE WHEN absent THEN NULL
+                        ELSE check_in + interval '9 hours'
+                            + make_interval(mins => {pick(seed, 'out', key, 90)})
+                    END,
+                    CASE WHEN absent THEN 'Absent' ELSE 'Present' END
+                FROM employees e
+                -- Integer day offsets keep the days plain dates, independent
+                -- of the session timezone.
+                CROSS JOIN (
+                    SELECT CAST(:start AS date) + i AS day
+                    FROM generate_series(
+                        0, CAST(:end AS date) - CAST(:start AS date) - 1
+                    ) i
+                ) g
+                CROSS JOIN LATERAL (
+                    SELECT
+                        {pick(seed, 'absent', key, 100)} < 2 AS absent,
+                        timezone(
+                            :tz,
+                            g.day
+                            + CAST(
+                                split_part(e.shift_timing, ' ', 1) || ' '
+                                || split_part(e.shift_timing, ' ', 2) AS time
+                            )
+                            + make_interval(mins => {pick(seed, 'in', key, 45)} - 20)
+                        ) AS check_in
+                ) a
+                WHERE extract(isodow FROM g.day) < 6
+                  AND e.joining_date <= g.day
+                  AND {pick(seed, 'missing', key, 100)} >= 2
+                  AND NOT EXISTS (
+                      SELECT 1 FROM leaves l
+                      WHERE l.employee_id = e.id AND l.status = 'Approved'
+                        AND l.start_date <= g.day AND l.end_date >= g.day
+                  )
+                """
+            ),
+            {"start": month, "end": month_end, "tz": args.timezone},
+        )
+        await session.commit()
+        logger.info(f"Attendance generated for {month:%Y-%m}")
+
+
+async def count_rows(session: AsyncSession) -> dict:
+    return {
+        "employees": await session.scalar(select(func.count()).select_from(Employee)),
+        "leaves": await session.scalar(select(func.count()).select_from(Leave)),
+        "attendance": await session.scalar(
+            select(func.count()).select_from(Attendance)
+        ),
+        "change_log": await session.scalar(select(func.count()).select_from(ChangeLog)),
+    }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    args.today = date.today()
+    args.history_start = args.today - timedelta(days=365 * args.years)
+    await create_tables()
+    started = time.perf_counter()
+    try:
+        # A dedicated connection so the session setting below cannot leak
+        # into the pool.
+        async with async_engine.connect() as conn:
+            session = AsyncSession(bind=conn, expire_on_commit=False)
+            if await session.scalar(select(func.count()).select_from(Employee)):
+                if not args.reset:
+                    raise SystemExit(
+                        "Database already has employees; pass --reset "
+                        "(make bench-data BENCH_RESET=1) to TRUNCATE every HRMS table"
+                    )
+                await session.execute(
+                    text(f"TRUNCATE {', '.join(TABLES)} RESTART IDENTITY CASCADE")
+                )
+                await session.commit()
+            # Skips the change feed triggers (and FK checks) during the bulk
+            # load, so the feed starts empty. Needs a superuser, as local
+            # Postgres installs usually are.
+            await session.execute(text("SET session_replication_role = replica"))
+            try:
+                await seed_lookups(session, args)
+                await seed_employees(session, args)
+                await seed_leaves(session, args)
+                await session.commit()
+                await seed_attendance(session, args)
+            finally:
+                await session.rollback()
+                await session.execute(text("RESET session_replication_role"))
+                await session.commit()
+
+            for year in range(args.history_start.year, args.today.year + 1):
+                await rebuild_balances(session, year)
+            counts = await count_rows(session)
+            await session.close()
+            # ANALYZE so plans match a long-lived database, not empty-table estimates.
+            await conn.execute(text("ANALYZE"))
+            await conn.commit()
+    finally:
+        await async_engine.dispose()
+    return {
+        "seed": args.seed,
+        "years": args.years,
+        "seconds": round(time.perf_counter() - started, 1),
+        **counts,
+    }
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--employees", type=int, default=10000)
+    parser.add_argument("--years", type=int, default=2)
+    parser.add_argument("--departments", type=int, default=40)
+    parser.add_argument("--designations", type=int, default=120)
+    parser.add_argument("--units", type=int, default=8)
+    parser.add_argument(
+        "--fanout", type=int, default=8, help="Direct reports per manager"
+    )
+    parser.add_argument(
+        "--leave-percent",
+        type=int,
+        default=30,
+        help="Chance of a leave per employee per 30 days",
+    )
+    parser.add_argument(
+        "--timezone",
+        default=settings.timezone,
+        help="Timezone shift times are interpreted in",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--reset", action="store_true", help="TRUNCATE existing HRMS data first"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_arguments(parser)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
@@ -0,0 +1,98 @@
+"""
+Employee typeahead benchmark.
+
+Builds the in-memory search index over synthetic employees and times a mix
+of prefix, multi-word, typo and employee-id queries, reporting p50/p99.
+
+Usage:
+    python -m benchmarks.employee_search --employees 100000 --queries 2000
+"""
+
+import argparse
+import json
+import random
+import string
+import time
+
+from app.services.employee_search import EmployeeSearchIndex
+
+
+def make_name(rng: random.Random, low: int, high: int) -> str:
+    return "".join(
+        rng.choice(string.ascii_lowercase) for _ in range(rng.randint(low, high))
+    )
+
+
+def build_index(count: int, rng: random.Random):
+    first = [make_name(rng, 3, 9) for _ in range(3000)]
+    last = [make_name(rng, 4, 10) for _ in range(8000)]
+    index = EmployeeSearchIndex()
+    index._bulk = True
+    for i in range(1, count + 1):
+        first_name, last_name = rng.choice(first), rng.choice(last)
+        index.upsert(
+            {
+                "id": i,
+                "employee_id": f"EMP{i:06d}",
+                "first_name": first_name.title(),
+                "last_name": last_name.title(),
+                "email": f"{first_name}.{last_name}{i}@example.com",
+                "department_id": rng.randint(1, 40),
+                "designation_id": rng.randint(1, 120),
+                "is_active": True,
+            }
+        )
+    index.tokens = sorted(index.postings)
+    index._bulk = False
+    return index, first, last
+
+
+def make_queries(count: int, first: list, last: list, rng: random.Random) -> list:
+    queries = []
+    for _ in range(count):
+        first_name, last_name = rng.choice(first), rng.choice(last)
+        kind = rng.random()
+        if kind < 0.3:
+            queries.append(first_name[: rng.randint(1, len(first_name))])
+        elif kind < 0.6:
+            queries.append(f"{first_name} {last_name[:3]}")
+        elif kind < 0.8:
+            queries.append(first_name[:2] + "x" + first_name[3:])
+        else:
+            queries.append(f"EMP0{rng.randint(1000, 9999)}")
+    return queries
+
+
+def main(args: argparse.Namespace) -> dict:
+    rng = random.Random(42)
+    started = time.perf_counter()
+    index, first, last = build_index(args.employees, rng)
+    build_seconds = time.perf_counter() - started
+
+    timings = []
+    for query in make_queries(args.queries, first, last, rng):
+        started = time.perf_counter()
+        index.search(query)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+
+    started = time.perf_counter()
+    index.upsert({**index.docs[1], "first_name": "Renamed"})
+    update_ms = (time.perf_counter() - started) * 1000
+    return {
+        "employees": args.employees,
+        "tokens": len(index.tokens),
+        "build_seconds": round(build_seconds, 2),
+        "queries": args.queries,
+        "p50_ms": round(timings[len(timings) // 2], 3),
+        "p99_ms": round(timings[int(len(timings) * 0.99)], 3),
+        "max_ms": round(timings[-1], 3),
+        "update_ms": round(update_ms, 3),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--employees", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=2000)
+    print(json.dumps(main(parser.parse_args()), indent=2))
@@ -0,0 +1,242 @@
+"""
+HTTP load driver.
+
+Sends a closed-loop load (`--concurrency` clients, `--requests` requests per
+endpoint) at the hot read endpoints and reports p50/p95/p99 latency,
+throughput, errors and queries per request (from the `Server-Timing`
+header) for each. Runs `app.main:app` in-process through httpx's ASGI
+transport by default, or targets a running server with `--url`, e.g.
+`uvicorn app.main:app --workers 4`. Request inputs are drawn from the
+`benchmarks.datagen` dataset.
+
+Usage:
+    python -m benchmarks.http_load --requests 500 --concurrency 20
+    python -m benchmarks.http_load --url http://localhost:8000
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import random
+import re
+import time
+from collections import Counter
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from app.core.database import async_engine
+from benchmarks.query_paths import Sample, load_sample
+from benchmarks.stats import summarize
+
+QUERY_COUNT = re.compile(r'desc="(\d+) queries"')
+
+# (path, params, headers) for one request.
+Request = Tuple[str, Dict[str, Any], Dict[str, str]]
+
+
+def build_endpoints(
+    sample: Sample, rng: random.Random
+) -> Dict[str, Callable[[], Request]]:
+    today = sample.today
+    last_month = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
+
+    def employee() -> int:
+        return rng.choice(sample.employee_ids)
+
+    def department() -> Optional[int]:
+        return rng.choice(sample.department_ids)
+
+    def manager_headers() -> Dict[str, str]:
+        return {
+            "X-Employee-Id": str(rng.choice(sample.manager_ids)),
+            "X-Role": "manager",
+        }
+
+    return {
+        "employees_list": lambda: (
+            "/api/v1/employees",
+            {"limit": 50, "cursor": employee()},
+            {},
+        ),
+        "employee_detail": lambda: (
+            f"/api/v1/employees/{employee()}",
+            {"profile": "directory"},
+            {},
+        ),
+        "employee_search": lambda: (
+            "/api/v1/employees/search",
+            {"q": rng.choice(sample.names)[:3]},
+            {},
+        ),
+        "employee_summaries": lambda: (
+            "/api/v1/employees/summaries",
+            {
+                "ids": ",".join(
+                    str(i)
+                    for i in rng.sample(
+                        sample.employee_ids, min(100, len(sample.employee_ids))
+                    )
+                )
+            },
+            {},
+        ),
+        "departments": lambda: ("/api/v1/departments", {}, {}),
+        "leaves_pending": lambda: ("/api/v1/leaves/pending", {"limit": 50}, {}),
+        "team_availability": lambda: (
+            "/api/v1/leaves/team-availability",
+            {
+                "start_date": today.isoformat(),
+                "end_date": (today + timedelta(days=13)).isoformat(),
+                "department_id": department(),
+            },
+            {},
+        ),
+        "leave_calendar": lambda: (
+            "/api/v1/leaves/calendar",
+            {
+                "year": last_month.year,
+                "month": last_month.month,
+                "department_id": department(),
+            },
+            {},
+        ),
+        "leave_balance": lambda: (
+            "/api/v1/leaves/balance",
+            {"department_id": department(), "limit": 100},
+            {},
+        ),
+        "manager_dashboard": lambda: (
+            "/api/v1/dashboard/manager",
+            {},
+            manager_headers(),
+        ),
+        "monthly_report": lambda: (
+            "/api/v1/attendance/reports/monthly",
+            {
+                "year": last_month.year,
+                "month": last_month.month,
+                "department_id": department(),
+            },
+            {},
+        ),
+        "changes": lambda: ("/api/v1/changes", {"limit": 500}, {}),
+    }
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    make_request: Callable[[], Request],
+    requests: int,
+    concurrency: int,
+) -> Dict[str, Any]:
+    timings: List[float] = []
+    statuses: Counter = Counter()
+    queries: List[int] = []
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            path, params, headers = make_request()
+            started = time.perf_counter()
+            try:
+                response = await client.get(
+                    path,
+                    params={k: v for k, v in params.items() if v is not None},
+                    headers=headers,
+                )
+                await response.aread()
+            except httpx.HTTPError as e:
+                statuses[type(e).__name__] += 1
+                continue
+            timings.append((time.perf_counter() - started) * 1000)
+            statuses[str(response.status_code)] += 1
+            match = QUERY_COUNT.search(response.headers.get("server-timing", ""))
+            if match:
+                queries.append(int(match.group(1)))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    errors = sum(
+        count for status, count in statuses.items() if not status.startswith(("2", "3"))
+    )
+    return {
+        **summarize(timings),
+        "requests_per_second": round(requests / elapsed, 1),
+        "errors": errors,
+        "statuses": dict(statuses),
+        "queries_per_request": max(queries) if queries else None,
+    }
+
+
+@contextlib.asynccontextmanager
+async def open_client(url: Optional[str], timeout: float):
+    if url:
+        async with httpx.AsyncClient(base_url=url, timeout=timeout) as client:
+            yield client
+        return
+    from app.main import app
+
+    # httpx's ASGI transport does not run the lifespan; drive it directly so
+    # caches, the search index and the pools start as they would under uvicorn.
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://localhost", timeout=timeout
+        ) as client:
+            yield client
+
+
+async def main(args: argparse.Namespace) -> dict:
+    rng = random.Random(args.seed)
+    sample = await load_sample(args.sample_size, rng)
+    # Connections made while sampling must not be shared with the app.
+    await async_engine.dispose()
+    endpoints = build_endpoints(sample, rng)
+    selected = args.endpoints or list(endpoints)
+    results: Dict[str, Any] = {}
+    async with open_client(args.url, args.timeout) as client:
+        for name in selected:
+            await drive(client, endpoints[name], args.warmup, args.concurrency)
+            results[name] = await drive(
+                client, endpoints[name], args.requests, args.concurrency
+            )
+    return {
+        "target": args.url or "in-process",
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "endpoints": results,
+    }
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--url",
+        help="Base URL of a running server (default: run app.main:app in-process)",
+    )
+    parser.add_argument(
+        "--requests", type=int, default=500, help="Measured requests per endpoint"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=20, help="Unmeasured requests per endpoint"
+    )
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument(
+        "--endpoints", nargs="*", help="Subset of endpoints to hit (default: all)"
+    )
+    parser.add_argument(
+        "--sample-size", type=int, default=2000, help="Employee ids sampled as inputs"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_arguments(parser)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
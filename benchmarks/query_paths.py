@@ -0,0 +1,182 @@
+"""
+Query path micro-benchmarks.
+
+Times the service functions behind the hot endpoints against the dataset
+from `benchmarks.datagen`, each call on a fresh session (so pool checkout is
+included), and reports latency percentiles plus queries per call.
+
+Usage:
+    python -m benchmarks.query_paths --iterations 50
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import select
+
+from app.core.database import AsyncSessionLocal, async_engine
+from app.core.metrics import instrument_engine, measure_queries
+from app.models import Department, Employee
+from app.services.attendance_report import fetch_monthly_inputs, month_bounds
+from app.services.change_feed import fetch_changes
+from app.services.dashboard import build_manager_dashboard
+from app.services.employee_repository import get_employee, list_employees
+from app.services.employee_search import trigram_search
+from app.services.leave_balances import get_balances
+from app.services.leave_calendar import build_leave_calendar
+from app.services.leaves import get_team_leaves
+from app.services.lookups import get_employee_summaries
+from app.services.org_chart import get_subtree
+from benchmarks.stats import summarize
+
+
+@dataclass
+class Sample:
+    """Ids drawn from the dataset that the cases pick from."""
+
+    employee_ids: List[int]
+    manager_ids: List[int]
+    department_ids: List[Optional[int]]
+    names: List[str]
+    today: date
+
+
+async def load_sample(size: int, rng: random.Random) -> Sample:
+    """Draw inputs reproducibly: same dataset and seed, same sample."""
+    async with AsyncSessionLocal() as session:
+        employee_ids = list(
+            (await session.scalars(select(Employee.id).order_by(Employee.id))).all()
+        )
+        managers = await session.scalars(
+            select(Employee.manager_id).distinct().order_by(Employee.manager_id)
+        )
+        manager_ids = [manager_id for manager_id in managers if manager_id is not None]
+        department_ids: List[Optional[int]] = list(
+            (await session.scalars(select(Department.id).order_by(Department.id))).all()
+        )
+        names = list(
+            (
+                await session.scalars(
+                    select(Employee.last_name)
+                    .distinct()
+                    .order_by(Employee.last_name)
+                    .limit(100)
+                )
+            ).all()
+        )
+    if not employee_ids:
+        raise SystemExit(
+            "No employees found; "
+            "generate a dataset with `python -m benchmarks.datagen` first"
+        )
+    return Sample(
+        employee_ids=rng.sample(employee_ids, min(size, len(employee_ids))),
+        manager_ids=rng.sample(manager_ids, min(size, len(manager_ids)))
+        or employee_ids[:1],
+        department_ids=department_ids or [None],
+        names=names,
+        today=date.today(),
+    )
+
+
+def build_cases(
+    sample: Sample, rng: random.Random
+) -> Dict[str, Callable[[Any], Awaitable[Any]]]:
+    today = sample.today
+    last_month = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
+    month_start, month_end = month_bounds(last_month.year, last_month.month)
+
+    def employee():
+        return rng.choice(sample.employee_ids)
+
+    def manager():
+        return rng.choice(sample.manager_ids)
+
+    def department():
+        return rng.choice(sample.department_ids)
+
+    return {
+        "employee_directory_page": lambda s: list_employees(
+            s, "directory", cursor=employee(), limit=50
+        ),
+        "employee_profile": lambda s: get_employee(s, employee(), "profile"),
+        "employee_summaries_500": lambda s: get_employee_summaries(
+            s, rng.sample(sample.employee_ids, min(500, len(sample.employee_ids)))
+        ),
+        "employee_trigram_search": lambda s: trigram_search(
+            s, rng.choice(sample.names)[:4]
+        ),
+        "org_subtree_depth_3": lambda s: get_subtree(s, manager(), 3),
+        "team_leaves_department_month": lambda s: get_team_leaves(
+            s, month_start, month_end - timedelta(days=1), department_id=department()
+        ),
+        "leave_balances_department_page": lambda s: get_balances(
+            s, today.year, department_id=department(), limit=100
+        ),
+        "leave_calendar_department": lambda s: build_leave_calendar(
+            s, last_month.year, last_month.month, department_id=department()
+        ),
+        "manager_dashboard": lambda s: build_manager_dashboard(s, manager(), today),
+        "monthly_report_inputs_department": lambda s: fetch_monthly_inputs(
+            s, last_month.year, last_month.month, department()
+        ),
+        "change_feed_page": lambda s: fetch_changes(s, None, 500),
+    }
+
+
+async def time_case(
+    case: Callable[[Any], Awaitable[Any]], iterations: int, warmup: int
+) -> Dict[str, Any]:
+    timings, queries = [], []
+    for i in range(warmup + iterations):
+        async with AsyncSessionLocal() as session:
+            with measure_queries() as metrics:
+                started = time.perf_counter()
+                await case(session)
+                elapsed = (time.perf_counter() - started) * 1000
+        if i >= warmup:
+            timings.append(elapsed)
+            queries.append(metrics.db_queries)
+    return {**summarize(timings), "queries_per_call": max(queries)}
+
+
+async def main(args: argparse.Namespace) -> dict:
+    rng = random.Random(args.seed)
+    instrument_engine(async_engine)
+    try:
+        sample = await load_sample(args.sample_size, rng)
+        cases = build_cases(sample, rng)
+        selected = args.cases or list(cases)
+        return {
+            "iterations": args.iterations,
+            "cases": {
+                name: await time_case(cases[name], args.iterations, args.warmup)
+                for name in selected
+            },
+        }
+    finally:
+        await async_engine.dispose()
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument(
+        "--sample-size", type=int, default=2000, help="Employee ids sampled as inputs"
+    )
+    parser.add_argument(
+        "--cases", nargs="*", help="Subset of cases to run (default: all)"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_arguments(parser)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
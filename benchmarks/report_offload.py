@@ -0,0 +1,138 @@
+"""
+Report offload benchmark.
+
+Renders a synthetic monthly attendance report as CSV while a probe task
+measures event-loop lag, i.e. the extra latency every other request on the
+worker would see. Compares rendering on the event loop with rendering in
+the report process pool.
+
+Usage:
+    python -m benchmarks.report_offload --employees 100000 --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import date
+from itertools import islice
+
+import numpy as np
+
+from app.core.process_pool import ReportProcessPool
+from app.services.attendance_report import (
+    MonthlyInputs,
+    month_bounds,
+    render_monthly_csv,
+)
+
+PROBE_INTERVAL = 0.005
+
+
+def make_inputs(employees: int, seed: int = 42) -> MonthlyInputs:
+    rng = np.random.default_rng(seed)
+    month_start, month_end = month_bounds(2026, 3)
+    ids = np.arange(1, employees + 1, dtype=np.int64)
+    days = np.arange(np.datetime64(month_start), np.datetime64(month_end))
+    days = days[np.is_busday(days)]
+    attendance_employee = np.repeat(ids, len(days))
+    attendance_day = np.tile(days, employees)
+    base = attendance_day.astype("datetime64[s]").astype(np.float64)
+    check_in = base + 9 * 3600 + rng.normal(0, 900, attendance_day.size)
+    check_out = check_in + rng.normal(8.5 * 3600, 1800, attendance_day.size)
+    leave_employee = rng.choice(ids, size=employees // 10)
+    leave_start = np.full(leave_employee.size, np.datetime64(date(2026, 3, 9)))
+    return MonthlyInputs(
+        month_start=month_start,
+        month_end=month_end,
+        today=month_end,
+        employees=[
+            (
+                int(i),
+                f"EMP{i:06d}",
+                f"First{i}",
+                f"Last{i}",
+                int(i % 40),
+                "9:00 AM - 6:00 PM",
+                40.0,
+                date(2020, 1, 1),
+            )
+            for i in ids
+        ],
+        attendance_employee=attendance_employee,
+        attendance_day=attendance_day,
+        check_in=check_in,
+        check_out=check_out,
+        leave_employee=leave_employee,
+        leave_start=leave_start,
+        leave_end=leave_start + np.timedelta64(2, "D"),
+        default_shift_start="09:00",
+        late_grace_minutes=5,
+    )
+
+
+async def probe(lags: list, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append((time.perf_counter() - started - PROBE_INTERVAL) * 1000)
+
+
+async def render(
+    pool: ReportProcessPool, inputs: MonthlyInputs, slice_size: int
+) -> dict:
+    lags: list = []
+    stop = asyncio.Event()
+    prober = asyncio.create_task(probe(lags, stop))
+    await asyncio.sleep(0.05)
+    started = time.perf_counter()
+    size = 0
+    async for chunk in pool.map_ordered(render_monthly_csv, inputs.slices(slice_size)):
+        size += len(chunk)
+        # Let the probe (other requests) run between slices, as a streaming
+        # response would.
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await prober
+    lags.sort()
+    return {
+        "render_seconds": round(elapsed, 2),
+        "bytes": size,
+        "loop_lag_p50_ms": round(lags[len(lags) // 2], 2),
+        "loop_lag_p99_ms": round(lags[int(len(lags) * 0.99)], 2),
+        "loop_lag_max_ms": round(lags[-1], 2),
+    }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    inputs = make_inputs(args.employees)
+    inline = ReportProcessPool()
+    inline.start(0, args.max_pending)
+    pooled = ReportProcessPool()
+    pooled.start(args.workers, args.max_pending)
+    # Warm the workers so process spawn time is not counted.
+    await asyncio.gather(
+        *(
+            pooled.run(render_monthly_csv, part)
+            for part in islice(inputs.slices(10), args.workers)
+        )
+    )
+    try:
+        return {
+            "employees": args.employees,
+            "workers": args.workers,
+            "event_loop": await render(inline, inputs, args.slice_employees),
+            "process_pool": await render(pooled, inputs, args.slice_employees),
+        }
+    finally:
+        pooled.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--employees", type=int, default=100000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--max-pending", type=int, default=16)
+    parser.add_argument("--slice-employees", type=int, default=2000)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
@@ -0,0 +1,118 @@
+"""
+Response envelope serialization benchmark.
+
+Renders a synthetic page of employees (Decimal salary and weekly hours,
+dates, timestamps) through the old `JSONResponse(jsonable_encoder(...))`
+path, the current `success()` path and `stream_success()`.
+
+Usage:
+    python -m benchmarks.response_envelope --employees 5000 --iterations 20
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import AsyncIterator, cast
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core import response
+
+
+def make_employees(count: int) -> list:
+    rng = random.Random(42)
+    joined = date(2015, 1, 1)
+    return [
+        {
+            "id": i,
+            "employee_id": f"EMP{i:06d}",
+            "first_name": f"First{i}",
+            "last_name": f"Last{i}",
+            "email": f"employee{i}@example.com",
+            "department_id": rng.randint(1, 40),
+            "designation_id": rng.randint(1, 120),
+            "date_of_joining": joined + timedelta(days=rng.randint(0, 3650)),
+            "salary": Decimal(rng.randint(300000, 2500000)) / 100,
+            "weekly_hours": Decimal("40.00"),
+            "is_active": True,
+            "created_at": datetime(2024, 1, 1, 9, 0) + timedelta(minutes=i),
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def legacy(items: list) -> bytes:
+    return bytes(
+        JSONResponse(
+            content={
+                "status": "success",
+                "message": "Success",
+                "data": jsonable_encoder(items),
+            }
+        ).body
+    )
+
+
+def fast(items: list) -> bytes:
+    return bytes(response.success(data=items).body)
+
+
+def streamed(items: list) -> bytes:
+    async def collect() -> bytes:
+        chunks = cast(
+            AsyncIterator[bytes], response.stream_success(items).body_iterator
+        )
+        return b"".join([chunk async for chunk in chunks])
+
+    return asyncio.run(collect())
+
+
+def time_path(render, items: list, iterations: int) -> dict:
+    body = render(items)
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        render(items)
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        "mean_ms": round(statistics.mean(timings), 2),
+        "p50_ms": round(statistics.median(timings), 2),
+        "bytes": len(body),
+    }
+
+
+def main(args: argparse.Namespace) -> dict:
+    items = make_employees(args.employees)
+    assert (
+        json.loads(legacy(items))
+        == json.loads(fast(items))
+        == json.loads(streamed(items))
+    )
+    results = {
+        "backend": "orjson" if response.orjson is not None else "pydantic-core",
+        "employees": args.employees,
+        "iterations": args.iterations,
+    }
+    for name, render in (
+        ("legacy", legacy),
+        ("success", fast),
+        ("stream_success", streamed),
+    ):
+        results[name] = time_path(render, items, args.iterations)
+    results["speedup"] = round(
+        results["legacy"]["mean_ms"] / results["success"]["mean_ms"], 1
+    )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--employees", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=20)
+    print(json.dumps(main(parser.parse_args()), indent=2))
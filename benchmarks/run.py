@@ -0,0 +1,159 @@
+"""
+Benchmark suite runner.
+
+Runs the micro-benchmarks (serialization, search, report offload), the
+query path benchmarks and the HTTP load driver with fixed seeds and sizes,
+and writes one JSON document with the results plus the commit, machine and
+dataset they were measured on. Compare two runs with `benchmarks.compare`.
+
+The database suites expect a dataset from `benchmarks.datagen` (see
+`make bench-data`); results are only comparable on the same dataset.
+
+Usage:
+    python -m benchmarks.run \
+        --output benchmarks/results/$(git rev-parse --short HEAD).json
+    python -m benchmarks.run --suites serialization search --quick
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict
+
+from app.core.database import AsyncSessionLocal, async_engine
+from app.core.settings import settings
+from benchmarks import (
+    datagen,
+    employee_search,
+    http_load,
+    query_paths,
+    report_offload,
+    response_envelope,
+)
+
+SUITES = ("serialization", "search", "report", "queries", "http")
+
+
+def git(*args: str) -> str:
+    try:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        "commit": git("rev-parse", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "db_pool_size": settings.db_pool_size,
+    }
+
+
+async def dataset() -> Dict[str, Any]:
+    try:
+        async with AsyncSessionLocal() as session:
+            return await datagen.count_rows(session)
+    finally:
+        await async_engine.dispose()
+
+
+def suite_arguments(args: argparse.Namespace) -> Dict[str, argparse.Namespace]:
+    """Fixed sizes per suite so runs stay comparable.
+
+    --quick shrinks them for smoke runs.
+    """
+    scale = 10 if args.quick else 1
+    return {
+        "serialization": argparse.Namespace(employees=5000 // scale, iterations=20),
+        "search": argparse.Namespace(employees=100000 // scale, queries=2000 // scale),
+        "report": argparse.Namespace(
+            employees=100000 // scale, workers=4, max_pending=16, slice_employees=2000
+        ),
+        "queries": argparse.Namespace(
+            iterations=50 // scale,
+            warmup=5,
+            sample_size=2000,
+            cases=None,
+            seed=args.seed,
+        ),
+        "http": argparse.Namespace(
+            url=args.url,
+            requests=500 // scale,
+            warmup=20,
+            concurrency=args.concurrency,
+            timeout=30.0,
+            endpoints=None,
+            sample_size=2000,
+            seed=args.seed,
+        ),
+    }
+
+
+async def run_suite(name: str, suite_args: argparse.Namespace) -> Any:
+    # The synchronous suites may start their own event loop, so they run in a thread.
+    if name == "serialization":
+        return await asyncio.to_thread(response_envelope.main, suite_args)
+    if name == "search":
+        return await asyncio.to_thread(employee_search.main, suite_args)
+    if name == "report":
+        return await report_offload.main(suite_args)
+    if name == "queries":
+        return await query_paths.main(suite_args)
+    return await http_load.main(suite_args)
+
+
+async def main(args: argparse.Namespace) -> dict:
+    results: Dict[str, Any] = {
+        "environment": environment(),
+        "quick": args.quick,
+        "suites": {},
+    }
+    if {"queries", "http"} & set(args.suites):
+        results["dataset"] = await dataset()
+    arguments = suite_arguments(args)
+    for name in args.suites:
+        started = time.perf_counter()
+        print(f"Running {name} benchmarks...", file=sys.stderr)
+        results["suites"][name] = await run_suite(name, arguments[name])
+        results["suites"][name]["suite_seconds"] = round(
+            time.perf_counter() - started, 1
+        )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--suites", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument(
+        "--output", help="Write results to this JSON file as well as stdout"
+    )
+    parser.add_argument(
+        "--url",
+        help="Run the HTTP suite against a running server instead of in-process",
+    )
+    parser.add_argument("--concurrency", type=int, default=20, help="HTTP clients")
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Smaller sizes for a smoke run (not comparable)",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    output = json.dumps(asyncio.run(main(args)), indent=2)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(output + "\n")
+    print(output)
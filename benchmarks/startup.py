@@ -0,0 +1,50 @@
+"""
+Worker startup benchmark.
+
+Times the schema step each uvicorn worker runs on boot, for every
+DB_STARTUP_MODE, with a fresh engine per iteration to mimic a new process.
+The `verify` mode needs the database migrated with `alembic upgrade head`.
+
+Usage:
+    python -m benchmarks.startup --iterations 20
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.migrations import head_revisions, prepare_database
+from app.core.settings import settings
+
+
+async def time_mode(mode: str, iterations: int) -> dict:
+    timings = []
+    for _ in range(iterations):
+        head_revisions.cache_clear()
+        engine = create_async_engine(settings.database_url, poolclass=NullPool)
+        started = time.perf_counter()
+        await prepare_database(engine, mode)
+        timings.append((time.perf_counter() - started) * 1000)
+        await engine.dispose()
+    return {
+        "iterations": iterations,
+        "mean_ms": round(statistics.mean(timings), 2),
+        "p50_ms": round(statistics.median(timings), 2),
+        "max_ms": round(max(timings), 2),
+    }
+
+
+async def main(args: argparse.Namespace) -> dict:
+    return {mode: await time_mode(mode, args.iterations) for mode in args.modes}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--modes", nargs="+", default=["create_all", "verify"])
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
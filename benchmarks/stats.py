@@ -0,0 +1,26 @@
+"""Latency summaries shared by the benchmark suite."""
+
+import math
+import statistics
+from typing import Dict, List
+
+
+def percentile(sorted_samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    rank = max(1, math.ceil(fraction * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples_ms: List[float]) -> Dict[str, float]:
+    """Count, mean and p50/p95/p99/max of latencies in milliseconds."""
+    if not samples_ms:
+        return {"count": 0}
+    samples = sorted(samples_ms)
+    return {
+        "count": len(samples),
+        "mean_ms": round(statistics.mean(samples), 3),
+        "p50_ms": round(percentile(samples, 0.50), 3),
+        "p95_ms": round(percentile(samples, 0.95), 3),
+        "p99_ms": round(percentile(samples, 0.99), 3),
+        "max_ms": round(samples[-1], 3),
+    }
@@ -1,4 +1,5 @@
 import uvicorn
+
 from app.core.settings import settings
 
 if __name__ == "__main__":
@@ -8,5 +9,5 @@ if __name__ == "__main__":
         port=8000,
         reload=settings.debug,
         workers=1 if settings.debug else 4,
-        log_level="info"
-    ) 
\ No newline at end of file
+        log_level="info",
+    )
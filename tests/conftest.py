@@ -0,0 +1,28 @@
+import pytest
+
+from app.core.database import async_engine
+from app.core.migrations import verify_schema_revision
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    # asyncpg and the app's background tasks only run on asyncio.
+    return "asyncio"
+
+
+@pytest.fixture(scope="module")
+async def database():
+    """The PostgreSQL database `DATABASE_URL` points at, at the latest migration.
+
+    Only an unreachable server skips the module; a stale schema or bad
+    credentials fail it.
+    """
+    try:
+        await verify_schema_revision(async_engine)
+    except OSError as e:
+        await async_engine.dispose()
+        pytest.skip(f"needs a reachable PostgreSQL server: {e}")
+    try:
+        yield async_engine
+    finally:
+        await async_engine.dispose()
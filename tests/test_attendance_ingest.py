@@ -0,0 +1,155 @@
+"""Coalescing and micro-batching of attendance events; no database needed."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timezone
+from typing import AsyncIterator, cast
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.metrics import current_request_metrics, measure_queries
+from app.core.settings import settings
+from app.schemas.attendance import AttendanceEvent
+from app.services import attendance_ingest
+from app.services.attendance_ingest import (
+    AttendanceBatcher,
+    BatchResult,
+    coalesce_events,
+    events_outside_window,
+)
+
+
+@pytest.fixture(autouse=True)
+def utc(monkeypatch):
+    monkeypatch.setattr(settings, "timezone", "UTC")
+
+
+def punch(employee_id: int, event_type: str, hour: int, day: int = 3):
+    return AttendanceEvent(
+        employee_id=employee_id,
+        event_type=event_type,
+        timestamp=datetime(2025, 3, day, hour, tzinfo=timezone.utc),
+    )
+
+
+def test_coalesce_keeps_earliest_check_in_and_latest_check_out():
+    rows = coalesce_events(
+        [
+            punch(1, "check_in", 9),
+            punch(1, "check_out", 17),
+            punch(1, "check_in", 8),
+            punch(1, "check_out", 12),
+        ]
+    )
+
+    assert len(rows) == 1
+    assert rows[0]["check_in"].hour == 8
+    assert rows[0]["check_out"].hour == 17
+
+
+def test_coalesce_returns_one_row_per_employee_day_in_key_order():
+    rows = coalesce_events(
+        [
+            punch(2, "check_in", 9),
+            punch(1, "check_in", 9, day=4),
+            punch(1, "check_in", 9),
+        ]
+    )
+
+    assert [(row["employee_id"], row["date"].day) for row in rows] == [
+        (1, 3),
+        (1, 4),
+        (2, 3),
+    ]
+
+
+def test_coalesce_files_events_under_the_local_day(monkeypatch):
+    monkeypatch.setattr(settings, "timezone", "Asia/Tokyo")
+
+    rows = coalesce_events([punch(1, "check_in", 20)])
+
+    assert rows[0]["date"] == date(2025, 3, 4)
+
+
+def test_events_outside_window():
+    events = [punch(1, "check_in", 9, day=1), punch(1, "check_in", 9, day=10)]
+
+    assert events_outside_window(events, date(2025, 3, 2), date(2025, 3, 10)) == [0]
+
+
+def test_batch_result_for_events_only_reports_the_callers_share():
+    result = BatchResult(rows_written=3, unknown_employee_ids={2, 3})
+
+    mine = result.for_events([punch(1, "check_in", 9), punch(2, "check_in", 9)])
+
+    assert mine.unknown_employee_ids == {2}
+    assert mine.rows_written == 1
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    """Replace the database writes with a recorder of the batches flushed."""
+    flushed = []
+
+    async def write_events(session, events):
+        flushed.append((list(events), current_request_metrics()))
+        return BatchResult(
+            rows_written=len(coalesce_events(events)),
+            unknown_employee_ids={e.employee_id for e in events if e.employee_id < 0},
+        )
+
+    async def invalidate_team_dashboards(session, employee_ids, days):
+        pass
+
+    monkeypatch.setattr(attendance_ingest, "write_events", write_events)
+    monkeypatch.setattr(
+        attendance_ingest, "invalidate_team_dashboards", invalidate_team_dashboards
+    )
+    return flushed
+
+
+@asynccontextmanager
+async def _no_session() -> AsyncIterator[None]:
+    yield None
+
+
+# The batcher only opens sessions to flush, which the tests stub out.
+no_session = cast(async_sessionmaker[AsyncSession], _no_session)
+
+
+@pytest.mark.anyio
+async def test_batcher_coalesces_concurrent_callers_into_one_batch(batches):
+    batcher = AttendanceBatcher(no_session, max_events=100, max_delay_ms=10)
+
+    first, second = await asyncio.gather(
+        batcher.submit([punch(1, "check_in", 9), punch(-5, "check_in", 9)]),
+        batcher.submit([punch(2, "check_in", 9)]),
+    )
+
+    assert len(batches) == 1
+    assert len(batches[0][0]) == 3
+    assert first == BatchResult(rows_written=1, unknown_employee_ids={-5})
+    assert second == BatchResult(rows_written=1, unknown_employee_ids=set())
+
+
+@pytest.mark.anyio
+async def test_batcher_flushes_when_the_batch_is_full(batches):
+    batcher = AttendanceBatcher(no_session, max_events=2, max_delay_ms=60_000)
+
+    result = await asyncio.wait_for(
+        batcher.submit([punch(1, "check_in", 9), punch(2, "check_in", 9)]), 1
+    )
+
+    assert result.rows_written == 2
+    assert len(batches) == 1
+
+
+@pytest.mark.anyio
+async def test_batch_queries_are_not_charged_to_the_first_caller(batches):
+    batcher = AttendanceBatcher(no_session, max_events=100, max_delay_ms=10)
+
+    with measure_queries():
+        await batcher.submit([punch(1, "check_in", 9)])
+
+    assert batches[0][1] is None
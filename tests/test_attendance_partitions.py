@@ -0,0 +1,84 @@
+"""
+Attendance partition maintenance.
+
+The archiving test runs against PostgreSQL in 2001 so it never touches the
+partitions holding current attendance.
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.settings import settings
+from app.services.attendance_partitions import (
+    add_months,
+    list_partitions,
+    maintain_partitions,
+    partition_name,
+    upper_bound,
+)
+
+ARCHIVE = "test_attendance_archive"
+# Sorts after "attendance_p..." so only the bounds show it is old.
+HAND_MADE = "attendance_y2001m01"
+
+
+def test_add_months_rolls_over_years():
+    assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert partition_name(date(2026, 3, 1)) == "attendance_p202603"
+
+
+@pytest.mark.parametrize(
+    "bounds, upper",
+    [
+        ("FOR VALUES FROM ('2025-01-01') TO ('2025-02-01')", date(2025, 2, 1)),
+        ("FOR VALUES FROM (MINVALUE) TO ('2001-02-01')", date(2001, 2, 1)),
+        ("FOR VALUES FROM ('2025-01-01') TO (MAXVALUE)", None),
+        ("DEFAULT", None),
+    ],
+)
+def test_upper_bound(bounds, upper):
+    assert upper_bound(bounds) == upper
+
+
+@pytest.mark.anyio
+async def test_partitions_past_retention_are_archived_by_their_bounds(
+    database, monkeypatch
+):
+    monkeypatch.setattr(settings, "attendance_partitions_ahead", 0)
+    monkeypatch.setattr(settings, "attendance_retention_months", 3)
+    monkeypatch.setattr(settings, "attendance_archive_schema", ARCHIVE)
+    async with AsyncSession(database) as session:
+        await session.execute(
+            text(
+                f"CREATE TABLE {HAND_MADE} PARTITION OF attendance "
+                "FOR VALUES FROM ('2001-01-01') TO ('2001-02-01')"
+            )
+        )
+        await session.execute(
+            text(
+                "CREATE TABLE attendance_p200103 PARTITION OF attendance "
+                "FOR VALUES FROM ('2001-03-01') TO ('2001-04-01')"
+            )
+        )
+        await session.commit()
+    try:
+        result = await maintain_partitions(database, today=date(2001, 6, 15))
+
+        assert result == {
+            "created": ["attendance_p200106"],
+            "archived": [f"{ARCHIVE}.{HAND_MADE}"],
+        }
+        async with AsyncSession(database) as session:
+            names = {partition["name"] for partition in await list_partitions(session)}
+        assert HAND_MADE not in names
+        assert {"attendance_p200103", "attendance_p200106"} <= names
+    finally:
+        async with AsyncSession(database) as session:
+            for name in ("attendance_p200103", "attendance_p200106", HAND_MADE):
+                await session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+            await session.execute(text(f"DROP SCHEMA IF EXISTS {ARCHIVE} CASCADE"))
+            await session.commit()
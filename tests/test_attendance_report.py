@@ -0,0 +1,217 @@
+"""
+Monthly attendance metrics.
+
+The metrics are computed from hand-built inputs; only the department
+scoping of `fetch_monthly_inputs` runs against PostgreSQL.
+"""
+
+import uuid
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+from sqlalchemy import delete
+
+from app.core.database import AsyncSessionLocal
+from app.models import Department, Employee, Leave
+from app.models.leave import LeaveStatus
+from app.services.attendance_report import (
+    MonthlyInputs,
+    compute_monthly_metrics,
+    fetch_monthly_inputs,
+    month_bounds,
+    render_monthly_csv,
+)
+from app.services.shifts import is_late, parse_shift_start
+
+# March 2026 starts on a Sunday; the report is run on Wednesday the 11th.
+TODAY = date(2026, 3, 11)
+
+
+def local_epoch(day: int, hour: int, minute: int = 0, second: int = 0) -> float:
+    return (
+        datetime(2026, 3, day, hour, minute, second) - datetime(1970, 1, 1)
+    ).total_seconds()
+
+
+def make_inputs(attendance, leaves, today=TODAY, grace=10) -> MonthlyInputs:
+    month_start, month_end = month_bounds(2026, 3)
+    return MonthlyInputs(
+        month_start=month_start,
+        month_end=month_end,
+        today=today,
+        employees=[
+            (
+                1,
+                "E-1",
+                "Ada",
+                "Lovelace",
+                10,
+                "9:00 AM - 6:00 PM",
+                40.0,
+                date(2020, 1, 1),
+            ),
+            (2, "E-2", "Alan", "Turing", 10, None, None, date(2026, 3, 9)),
+        ],
+        attendance_employee=np.array([a[0] for a in attendance], dtype=np.int64),
+        attendance_day=np.array(
+            [date(2026, 3, a[1]) for a in attendance], dtype="datetime64[D]"
+        ),
+        check_in=np.array([a[2] for a in attendance], dtype=np.float64),
+        check_out=np.array([a[3] for a in attendance], dtype=np.float64),
+        leave_employee=np.array([leave[0] for leave in leaves], dtype=np.int64),
+        leave_start=np.array([leave[1] for leave in leaves], dtype="datetime64[D]"),
+        leave_end=np.array([leave[2] for leave in leaves], dtype="datetime64[D]"),
+        default_shift_start="09:00",
+        late_grace_minutes=grace,
+    )
+
+
+ATTENDANCE = [
+    (1, 2, local_epoch(2, 9, 10, 59), local_epoch(2, 17, 10, 59)),
+    (1, 3, local_epoch(3, 9, 11), np.nan),
+    # Today: counted as present, but today is not a working day yet.
+    (1, 11, local_epoch(11, 9), np.nan),
+]
+LEAVES = [(1, date(2026, 3, 5), date(2026, 3, 13))]
+
+
+@pytest.mark.parametrize(
+    "shift, start",
+    [
+        ("9:00 AM - 6:00 PM", 9 * 3600),
+        ("9 pm", 21 * 3600),
+        ("12:30 AM", 30 * 60),
+        ("07:45", 7 * 3600 + 45 * 60),
+        ("25:00", None),
+        ("night", None),
+        (None, None),
+    ],
+)
+def test_parse_shift_start(shift, start):
+    assert parse_shift_start(shift) == start
+
+
+def test_is_late_compares_by_the_minute():
+    start = 9 * 3600
+    assert not is_late(9 * 3600 + 10 * 60 + 59, start, 10)
+    assert is_late(9 * 3600 + 11 * 60, start, 10)
+    assert list(is_late(np.array([start, start + 61, np.nan]), start, 0)) == [
+        False,
+        True,
+        False,
+    ]
+
+
+def test_metrics():
+    ada, alan = compute_monthly_metrics(make_inputs(ATTENDANCE, LEAVES))
+
+    assert ada == {
+        "employee_id": 1,
+        "employee_code": "E-1",
+        "first_name": "Ada",
+        "last_name": "Lovelace",
+        "department_id": 10,
+        # 2-6 and 9-10 March; today is not over yet.
+        "working_days": 7,
+        "days_present": 3,
+        "late_days": 1,
+        "hours_worked": 8.0,
+        "overtime_hours": 0.0,
+        # 5, 6, 9 and 10 March; the rest of the leave is still ahead.
+        "leave_days": 4,
+        "absent_days": 1,
+    }
+    # Joined on Monday the 9th.
+    assert alan["working_days"] == 2
+    assert alan["absent_days"] == 2
+
+
+def test_past_month_counts_every_working_day():
+    ada, alan = compute_monthly_metrics(
+        make_inputs(ATTENDANCE, LEAVES, today=date(2026, 6, 1))
+    )
+
+    assert ada["working_days"] == 22
+    assert ada["leave_days"] == 7
+    assert ada["absent_days"] == 22 - 3 - 7
+    assert alan["working_days"] == 17
+
+
+def test_future_month_has_no_working_days():
+    ada, _ = compute_monthly_metrics(
+        make_inputs(ATTENDANCE, LEAVES, today=date(2026, 2, 20))
+    )
+
+    assert ada["working_days"] == 0
+    assert ada["leave_days"] == 0
+    assert ada["absent_days"] == 0
+
+
+def test_overtime_is_prorated_to_working_days():
+    long_days = [
+        (1, day, local_epoch(day, 8), local_epoch(day, 20)) for day in (2, 3, 4)
+    ]
+
+    ada, _ = compute_monthly_metrics(make_inputs(long_days, [], today=date(2026, 3, 5)))
+
+    # Three working days of an 8-hour day against 36 hours worked.
+    assert ada["hours_worked"] == 36.0
+    assert ada["overtime_hours"] == 12.0
+
+
+def test_slices_render_the_same_rows_as_the_whole_month():
+    inputs = make_inputs(ATTENDANCE, LEAVES)
+
+    whole = render_monthly_csv(inputs)
+    sliced = b"".join(render_monthly_csv(part) for part in inputs.slices(1))
+
+    assert sliced == whole
+
+
+@pytest.mark.anyio
+async def test_department_report_only_loads_its_own_leave(database):
+    tag = uuid.uuid4().hex[:8]
+    async with AsyncSessionLocal() as session:
+        departments = [Department(name=f"Report {tag} {i}") for i in range(2)]
+        session.add_all(departments)
+        await session.flush()
+        employees = [
+            Employee(
+                employee_id=f"REP-{tag}-{i}",
+                first_name="Report",
+                last_name=str(i),
+                email=f"rep-{tag}-{i}@example.com",
+                joining_date=date(2020, 1, 1),
+                department_id=department.id,
+            )
+            for i, department in enumerate(departments)
+        ]
+        session.add_all(employees)
+        await session.flush()
+        session.add_all(
+            Leave(
+                employee_id=employee.id,
+                leave_type="Annual",
+                start_date=date(2026, 3, 2),
+                end_date=date(2026, 3, 3),
+                status=LeaveStatus.APPROVED,
+            )
+            for employee in employees
+        )
+        await session.commit()
+        ids = [employee.id for employee in employees]
+        try:
+            inputs = await fetch_monthly_inputs(session, 2026, 3, departments[0].id)
+
+            assert [e[0] for e in inputs.employees] == [ids[0]]
+            assert inputs.leave_employee.tolist() == [ids[0]]
+        finally:
+            await session.execute(delete(Leave).where(Leave.employee_id.in_(ids)))
+            await session.execute(delete(Employee).where(Employee.id.in_(ids)))
+            await session.execute(
+                delete(Department).where(
+                    Department.id.in_([department.id for department in departments])
+                )
+            )
+            await session.commit()
@@ -0,0 +1,158 @@
+"""
+The change_log triggers and the change feed, against PostgreSQL.
+"""
+
+import uuid
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import delete, select, text, update
+
+from app.core.database import AsyncSessionLocal, Base
+from app.models import ChangeLog, Employee
+from app.models.change_log import PUBLISHED_COLUMNS
+from app.services.change_feed import (
+    ChangeNotifier,
+    fetch_changes,
+    format_cursor,
+    parse_cursor,
+)
+
+
+def test_cursors_round_trip():
+    assert parse_cursor(None) == (0, 0)
+    assert parse_cursor(format_cursor(812, 40)) == (812, 40)
+    with pytest.raises(ValueError):
+        parse_cursor("812")
+
+
+@pytest.mark.parametrize("table", sorted(PUBLISHED_COLUMNS))
+def test_published_columns_exist(table):
+    columns = set(Base.metadata.tables[table].c.keys())
+
+    assert set(PUBLISHED_COLUMNS[table]) <= columns
+    assert "id" in PUBLISHED_COLUMNS[table]
+
+
+@pytest.fixture
+async def employee(database):
+    tag = uuid.uuid4().hex[:8]
+    async with AsyncSessionLocal() as session:
+        employee = Employee(
+            employee_id=f"CDC-{tag}",
+            first_name="Change",
+            last_name="Feed",
+            email=f"cdc-{tag}@example.com",
+            joining_date=date(2020, 1, 1),
+            salary=Decimal("85000"),
+            bank_account="DE89370400440532013000",
+            tax_id="123-45-6789",
+        )
+        session.add(employee)
+        await session.commit()
+        yield employee.id
+
+        await session.execute(delete(Employee).where(Employee.id == employee.id))
+        await session.execute(
+            delete(ChangeLog).where(
+                ChangeLog.table_name == "employees", ChangeLog.row_id == employee.id
+            )
+        )
+        await session.commit()
+
+
+async def logged_changes(employee_id: int):
+    async with AsyncSessionLocal() as session:
+        rows = await session.execute(
+            select(ChangeLog.operation, ChangeLog.changes)
+            .where(ChangeLog.table_name == "employees", ChangeLog.row_id == employee_id)
+            .order_by(ChangeLog.seq)
+        )
+        return rows.all()
+
+
+@pytest.mark.anyio
+async def test_only_published_columns_are_logged(employee):
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            update(Employee)
+            .where(Employee.id == employee)
+            .values(salary=Decimal("90000"), tax_id="987-65-4321")
+        )
+        await session.execute(
+            update(Employee).where(Employee.id == employee).values(last_name="Log")
+        )
+        await session.commit()
+
+    insert, paid, renamed = await logged_changes(employee)
+
+    assert insert.operation == "I"
+    assert set(insert.changes) == set(PUBLISHED_COLUMNS["employees"])
+    # Only the timestamp of the salary and tax id update is published; both
+    # updates share now(), so the rename does not repeat it.
+    assert paid.operation == "U"
+    assert set(paid.changes) == {"updated_at"}
+    assert renamed.changes == {"last_name": "Log"}
+
+
+@pytest.mark.anyio
+async def test_updates_to_unpublished_columns_are_not_logged(employee):
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            text("UPDATE employees SET bank_account = 'GB29NWBK' WHERE id = :id"),
+            {"id": employee},
+        )
+        await session.commit()
+
+    assert [row.operation for row in await logged_changes(employee)] == ["I"]
+
+
+@pytest.mark.anyio
+async def test_feed_serves_settled_changes_after_the_cursor(employee):
+    async with AsyncSessionLocal() as session:
+        latest = (
+            await session.execute(
+                select(ChangeLog.txid, ChangeLog.seq)
+                .where(ChangeLog.row_id == employee)
+                .order_by(ChangeLog.seq.desc())
+            )
+        ).first()
+        assert latest is not None
+        before = format_cursor(latest.txid, latest.seq - 1)
+
+        page = await fetch_changes(session, before, tables=["employees"])
+
+    first = page["items"][0]
+    assert (first["table"], first["id"], first["op"]) == ("employees", employee, "I")
+    assert "bank_account" not in first["changes"]
+    assert parse_cursor(page["next_cursor"]) >= (latest.txid, latest.seq)
+
+
+@pytest.mark.anyio
+async def test_notifier_watermark_moves_with_new_settled_changes(employee):
+    notifier = ChangeNotifier()
+    await notifier._poll()
+    changed = notifier._changed
+
+    await notifier._poll()
+    assert not changed.is_set()
+
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            update(Employee).where(Employee.id == employee).values(first_name="New")
+        )
+        await session.commit()
+    await notifier._poll()
+
+    assert changed.is_set()
+    async with AsyncSessionLocal() as session:
+        newest = (
+            await session.execute(
+                select(ChangeLog.txid, ChangeLog.seq)
+                .order_by(ChangeLog.txid.desc(), ChangeLog.seq.desc())
+                .limit(1)
+            )
+        ).first()
+    assert newest is not None
+    assert notifier._watermark == tuple(newest)
@@ -0,0 +1,116 @@
+"""Parsing and validation of employee import files; no database needed."""
+
+import io
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+
+from app.services.employee_import import (
+    detect_format,
+    iter_records,
+    prepare_record,
+    read_chunk,
+)
+
+CSV = (
+    "\ufeffemployee_id,first_name,last_name,email,joining_date,department,benefits\n"
+    "E-1, Ada ,Lovelace,ada@example.com,2024-01-15,Engineering,\n"
+    'E-2,Alan,Turing,alan@example.com,2024-02-01,,"{""gym"": true}"\n'
+)
+
+
+def csv_stream(text: str = CSV) -> io.TextIOWrapper:
+    return io.TextIOWrapper(
+        io.BytesIO(text.encode("utf-8")), encoding="utf-8-sig", newline=""
+    )
+
+
+def test_detect_format():
+    assert detect_format("people.CSV") == "csv"
+    assert detect_format("people.ndjson") == "jsonl"
+    assert detect_format("people.xlsx") is None
+    assert detect_format(None) is None
+
+
+def test_iter_records_csv_strips_values_and_blanks_empty_cells():
+    records = list(iter_records(csv_stream(), "csv"))
+
+    assert [row for row, _ in records] == [1, 2]
+    first = records[0][1]
+    assert first["employee_id"] == "E-1"
+    assert first["first_name"] == "Ada"
+    assert first["benefits"] is None
+    assert records[1][1]["department"] is None
+
+
+def test_iter_records_jsonl_reports_bad_lines_in_place():
+    stream = io.StringIO(
+        '{"employee_id": "E-1"}\n'
+        "\n"
+        "not json\n"
+        "[1, 2]\n"
+        '{"employee_id": "E-5"}\n'
+    )
+
+    records = list(iter_records(stream, "jsonl"))
+
+    assert [row for row, _ in records] == [1, 3, 4, 5]
+    assert records[0][1] == {"employee_id": "E-1"}
+    assert records[1][1]["__error__"].startswith("Invalid JSON")
+    assert records[2][1] == {"__error__": "Each line must be a JSON object"}
+
+
+def test_iter_records_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        list(iter_records(io.StringIO(""), "xml"))
+
+
+def test_prepare_record_resolves_lookup_names():
+    record = dict(next(iter_records(csv_stream(), "csv"))[1])
+
+    data, provided = prepare_record(record, {("department", "Engineering"): 7})
+
+    assert data["department_id"] == 7
+    assert data["joining_date"] == date(2024, 1, 15)
+    assert "department" not in data
+    assert "department_id" in provided
+    assert "salary" not in provided
+
+
+def test_prepare_record_decodes_embedded_benefits():
+    record = list(iter_records(csv_stream(), "csv"))[1][1]
+
+    data, _ = prepare_record(record, {})
+
+    assert data["benefits"] == {"gym": True}
+
+
+def test_prepare_record_errors():
+    base = {
+        "employee_id": "E-1",
+        "first_name": "Ada",
+        "last_name": "Lovelace",
+        "email": "ada@example.com",
+        "joining_date": "2024-01-15",
+    }
+    with pytest.raises(ValueError, match="Unknown department: Sales"):
+        prepare_record({**base, "department": "Sales"}, {})
+    with pytest.raises(ValueError, match="benefits must be a JSON object"):
+        prepare_record({**base, "benefits": "{gym"}, {})
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        prepare_record({"__error__": "Invalid JSON: Expecting value"}, {})
+    with pytest.raises(ValidationError):
+        prepare_record({**base, "email": "not-an-email"}, {})
+
+
+@pytest.mark.anyio
+async def test_read_chunk_consumes_the_stream_in_order():
+    records = iter_records(csv_stream(), "csv")
+
+    first = await read_chunk(records, 1)
+    rest = await read_chunk(records, 10)
+
+    assert [row for row, _ in first] == [1]
+    assert [row for row, _ in rest] == [2]
+    assert await read_chunk(records, 10) == []
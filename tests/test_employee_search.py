@@ -0,0 +1,99 @@
+"""
+The in-memory employee typeahead index, built from hand-made rows.
+"""
+
+from app.services.employee_search import EmployeeSearchIndex, normalize, tokenize
+
+
+def employee(id, first_name, last_name, employee_id=None, **extra):
+    return {
+        "id": id,
+        "employee_id": employee_id or f"EMP-{id:03d}",
+        "first_name": first_name,
+        "last_name": last_name,
+        "email": f"{first_name}.{last_name}@example.com".lower(),
+        "department_id": 1,
+        "designation_id": None,
+        "is_active": True,
+        **extra,
+    }
+
+
+def make_index(*docs):
+    index = EmployeeSearchIndex()
+    for doc in docs:
+        index.upsert(doc)
+    return index
+
+
+def ids(results):
+    return [result["id"] for result in results]
+
+
+def test_tokens_are_case_folded_and_accent_free():
+    assert normalize("Zoë Ångström") == "zoe angstrom"
+    assert tokenize("O'Brien-Smith, EMP_042") == ["o", "brien", "smith", "emp", "042"]
+
+
+def test_prefix_search_matches_names_emails_and_employee_ids():
+    index = make_index(
+        employee(1, "Ann", "Lee"),
+        employee(2, "Annabelle", "Stone"),
+        employee(3, "José", "Núñez", employee_id="HR-77"),
+    )
+
+    assert set(ids(index.search("ann"))) == {1, 2}
+    assert ids(index.search("nunez")) == [3]
+    assert ids(index.search("hr-77")) == [3]
+    assert ids(index.search("annabelle.stone")) == [2]
+    assert index.search("   ") == []
+
+
+def test_every_query_token_must_match():
+    index = make_index(employee(1, "Ann", "Lee"), employee(2, "Ann", "Stone"))
+
+    assert ids(index.search("ann st")) == [2]
+    assert ids(index.search("l ann")) == [1]
+
+
+def test_typos_fall_back_to_the_name_vocabulary():
+    index = make_index(employee(1, "Margaret", "Hamilton"), employee(2, "Ann", "Lee"))
+
+    assert ids(index.search("margret")) == [1]
+    assert ids(index.search("hamiltn marg")) == [1]
+    assert index.search("zzzz") == []
+
+
+def test_results_carry_the_summary_and_a_score():
+    index = make_index(employee(1, "Ann", "Lee", salary=90000))
+
+    (result,) = index.search("ann lee")
+
+    assert "salary" not in result
+    assert result["email"] == "ann.lee@example.com"
+    assert 0 < result["score"] <= 100
+
+
+def test_upsert_replaces_and_deactivation_removes():
+    index = make_index(employee(1, "Ann", "Lee"), employee(2, "Ann", "Stone"))
+
+    index.upsert(employee(1, "Anne", "Moore"))
+    assert ids(index.search("lee")) == []
+    assert ids(index.search("moore")) == [1]
+
+    index.upsert(employee(2, "Ann", "Stone", is_active=False))
+    assert len(index) == 1
+    assert ids(index.search("stone")) == []
+
+
+def test_remove_drops_unused_tokens():
+    index = make_index(employee(1, "Ann", "Lee"), employee(2, "Ann", "Stone"))
+
+    index.remove(2)
+    index.remove(99)
+
+    assert "stone" not in index.postings
+    assert "stone" not in index.tokens
+    assert "stone" not in index.name_tokens
+    assert index.name_tokens["ann"] == 1
+    assert index.tokens == sorted(index.postings)
@@ -0,0 +1,89 @@
+"""
+Queueing and reading background jobs through the API, against PostgreSQL.
+
+No worker runs here, so queued jobs stay queued.
+"""
+
+from typing import List
+
+import httpx
+import pytest
+from sqlalchemy import delete
+
+from app.core.database import AsyncSessionLocal
+from app.core.settings import settings
+from app.main import app
+from app.models import BackgroundJob
+from app.services.job_handlers import resolve_retention_days
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(scope="module")
+async def client(database):
+    transport = httpx.ASGITransport(app=app.router)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://localhost/api/v1"
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+async def queued():
+    ids: List[int] = []
+    yield ids
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(BackgroundJob).where(BackgroundJob.id.in_(ids)))
+        await session.commit()
+
+
+async def test_enqueue_and_read_a_job(client, queued):
+    created = await client.post(
+        "/jobs",
+        json={"kind": "reconcile-leave-balances", "payload": {"year": 2026}},
+    )
+    assert created.status_code == 202, created.text
+    job = created.json()["data"]
+    queued.append(job["id"])
+    assert job["kind"] == "reconcile-leave-balances"
+    assert job["status"] == "queued"
+    assert job["payload"] == {"year": 2026}
+    assert job["attempts"] == 0
+    assert job["max_attempts"] == 3
+
+    fetched = await client.get(f"/jobs/{job['id']}")
+    assert fetched.status_code == 200
+    assert fetched.json()["data"] == job
+
+    missing = await client.get(f"/jobs/{job['id'] + 1_000_000}")
+    assert missing.status_code == 404
+
+
+async def test_unknown_kinds_and_bad_payloads_are_rejected(client):
+    unknown = await client.post("/jobs", json={"kind": "mine-bitcoin"})
+    assert unknown.status_code == 422
+    assert "reconcile-leave-balances" in unknown.json()["data"]["kinds"]
+
+    outside = await client.post(
+        "/jobs", json={"kind": "import-employees", "payload": {"path": "../x.csv"}}
+    )
+    assert outside.status_code == 422
+
+    too_short = await client.post(
+        "/jobs", json={"kind": "prune-change-log", "payload": {"retention_days": 0}}
+    )
+    assert too_short.status_code == 422
+    assert too_short.json()["message"] == (
+        f"retention_days must be at least {settings.change_log_retention_days}"
+    )
+
+
+async def test_retention_can_only_be_widened(monkeypatch):
+    monkeypatch.setattr(settings, "change_log_retention_days", 30)
+
+    assert resolve_retention_days({}) == 30
+    assert resolve_retention_days({"retention_days": "90"}) == 90
+    with pytest.raises(ValueError):
+        resolve_retention_days({"retention_days": 29})
+    with pytest.raises(ValueError):
+        resolve_retention_days({"retention_days": "a week"})
@@ -0,0 +1,197 @@
+"""
+Materialised leave balances, driven through the leave API against PostgreSQL.
+
+The helpers at the top need no database.
+"""
+
+import uuid
+from datetime import date
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from sqlalchemy import delete, select
+
+from app.core.database import AsyncSessionLocal
+from app.main import app
+from app.models import Employee, Leave, LeaveBalance, LeavePolicy, LeaveType
+from app.models.leave import LeaveStatus
+from app.services.leave_balances import (
+    leave_days_by_year,
+    legacy_allocation,
+    rebuild_balances,
+)
+from app.services.lookups import invalidate_lookup
+
+YEAR = 2026
+
+
+def test_leave_days_by_year_splits_at_new_year():
+    assert leave_days_by_year(date(2025, 12, 30), date(2026, 1, 2)) == {
+        2025: 2,
+        2026: 2,
+    }
+    assert leave_days_by_year(date(2026, 3, 2), date(2026, 3, 2)) == {2026: 1}
+
+
+def test_legacy_allocation_matches_leave_types_by_name():
+    totals = SimpleNamespace(
+        annual_leave_total=15, sick_leave_total=None, casual_leave_total=4
+    )
+
+    assert legacy_allocation("Annual Leave", totals) == 15
+    assert legacy_allocation("Sick", totals) == 0
+    assert legacy_allocation("casual", totals) == 4
+    assert legacy_allocation("Parental", totals) == 0
+
+
+@pytest.fixture
+async def staff(database):
+    """A leave type, a policy granting 20 days of it, and three employees.
+
+    `on_policy` and `leaver` (inactive) are on the policy and `legacy` has no
+    policy but an annual total of 15 days.
+    """
+    tag = uuid.uuid4().hex[:8]
+    async with AsyncSessionLocal() as session:
+        leave_type = LeaveType(name=f"Annual {tag}")
+        session.add(leave_type)
+        await session.flush()
+        policy = LeavePolicy(
+            policy_name=f"Balances {tag}",
+            details={
+                "allocations": [
+                    {
+                        "leave_type_id": leave_type.id,
+                        "days_allocated": 20,
+                        "carry_forward_cap": 5,
+                    }
+                ]
+            },
+        )
+        session.add(policy)
+        await session.flush()
+        employees = {
+            name: Employee(
+                employee_id=f"BAL-{tag}-{name}",
+                first_name="Balance",
+                last_name=name,
+                email=f"bal-{tag}-{name}@example.com",
+                joining_date=date(2020, 1, 1),
+                leave_policy_id=None if name == "legacy" else policy.id,
+                annual_leave_total=15,
+                is_active=name != "leaver",
+            )
+            for name in ("on_policy", "legacy", "leaver")
+        }
+        session.add_all(employees.values())
+        await session.flush()
+        # Eight days left over from last year, of which five carry forward.
+        session.add(
+            LeaveBalance(
+                employee_id=employees["on_policy"].id,
+                leave_type_id=leave_type.id,
+                year=YEAR - 1,
+                allocated=20,
+                used=12,
+            )
+        )
+        session.add(
+            Leave(
+                employee_id=employees["leaver"].id,
+                leave_type=leave_type.name,
+                start_date=date(YEAR, 2, 2),
+                end_date=date(YEAR, 2, 4),
+                status=LeaveStatus.APPROVED,
+            )
+        )
+        await session.commit()
+        # The leave type was written around the API; drop the cached list.
+        await invalidate_lookup("leave_types")
+        ids = {name: employee.id for name, employee in employees.items()}
+        yield SimpleNamespace(leave_type=leave_type.name, type_id=leave_type.id, **ids)
+
+        await session.execute(
+            delete(LeaveBalance).where(LeaveBalance.employee_id.in_(ids.values()))
+        )
+        await session.execute(delete(Leave).where(Leave.employee_id.in_(ids.values())))
+        await session.execute(delete(Employee).where(Employee.id.in_(ids.values())))
+        await session.execute(delete(LeavePolicy).where(LeavePolicy.id == policy.id))
+        await session.execute(delete(LeaveType).where(LeaveType.id == leave_type.id))
+        await session.commit()
+
+
+@pytest.fixture
+async def client():
+    transport = httpx.ASGITransport(app=app.router)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://localhost/api/v1"
+    ) as client:
+        yield client
+
+
+async def balances(employee_id: int, leave_type_id: int):
+    async with AsyncSessionLocal() as session:
+        rows = await session.execute(
+            select(LeaveBalance.year, LeaveBalance.allocated, LeaveBalance.used).where(
+                LeaveBalance.employee_id == employee_id,
+                LeaveBalance.leave_type_id == leave_type_id,
+                LeaveBalance.year == YEAR,
+            )
+        )
+        return [tuple(row) for row in rows]
+
+
+@pytest.mark.anyio
+async def test_approving_a_leave_allocates_from_the_policy(staff, client):
+    applied = await client.post(
+        "/leaves/apply",
+        json={
+            "employee_id": staff.on_policy,
+            "leave_type": staff.leave_type,
+            "start_date": f"{YEAR}-03-02",
+            "end_date": f"{YEAR}-03-04",
+        },
+    )
+    assert applied.status_code == 201, applied.text
+    leave = applied.json()["data"]
+    assert leave["status"] == LeaveStatus.PENDING
+    assert leave["employee_id"] == staff.on_policy
+
+    approved = await client.post(f"/leaves/{leave['id']}/approve")
+    assert approved.status_code == 200, approved.text
+    assert approved.json()["data"]["status"] == LeaveStatus.APPROVED
+    assert await balances(staff.on_policy, staff.type_id) == [(YEAR, 25, 3)]
+
+    listed = await client.get(f"/leaves/employee/{staff.on_policy}")
+    assert [row["id"] for row in listed.json()["data"]] == [leave["id"]]
+
+    cancelled = await client.post(f"/leaves/{leave['id']}/cancel")
+    assert cancelled.status_code == 200, cancelled.text
+    assert await balances(staff.on_policy, staff.type_id) == [(YEAR, 25, 0)]
+
+
+@pytest.mark.anyio
+async def test_rebuild_covers_leavers_and_employees_without_a_policy(staff, client):
+    async with AsyncSessionLocal() as session:
+        await rebuild_balances(session, YEAR)
+
+    assert await balances(staff.on_policy, staff.type_id) == [(YEAR, 25, 0)]
+    assert await balances(staff.legacy, staff.type_id) == [(YEAR, 15, 0)]
+    assert await balances(staff.leaver, staff.type_id) == [(YEAR, 20, 3)]
+
+    response = await client.get(
+        "/leaves/balance", params={"employee_id": staff.leaver, "year": YEAR}
+    )
+    assert response.status_code == 200
+    assert response.json()["data"] == [
+        {
+            "employee_id": staff.leaver,
+            "leave_type_id": staff.type_id,
+            "leave_type": staff.leave_type,
+            "year": YEAR,
+            "allocated": 20,
+            "used": 3,
+            "remaining": 17,
+        }
+    ]
@@ -0,0 +1,165 @@
+"""
+Leave calendar bitmaps.
+
+The bit helpers need no database; one calendar is built against PostgreSQL.
+"""
+
+import uuid
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from typing import cast
+
+import numpy as np
+import pytest
+from sqlalchemy import delete, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal, async_engine, cache_ttl
+from app.core.settings import settings
+from app.models import Attendance, Department, Employee, Leave
+from app.models.attendance import AttendanceStatus
+from app.models.leave import LeaveStatus
+from app.services.attendance_partitions import ensure_partitions
+from app.services.leave_calendar import (
+    _or_into,
+    build_leave_calendar,
+    day_counts,
+    range_masks,
+)
+
+
+def bits(*days):
+    """Bitmap with the given one-based days of the month set."""
+    return sum(1 << (day - 1) for day in days)
+
+
+def test_range_masks_cover_inclusive_zero_based_days():
+    masks = range_masks(np.array([0, 4, 30]), np.array([0, 6, 30]))
+
+    assert masks.tolist() == [bits(1), bits(5, 6, 7), bits(31)]
+
+
+def test_range_masks_cover_a_whole_month():
+    assert range_masks(np.array([0]), np.array([30])).tolist() == [2**31 - 1]
+
+
+def test_day_counts():
+    bitmaps = np.array([bits(1, 2), bits(2, 31), 0], dtype=np.uint32)
+
+    counts = day_counts(bitmaps, 31)
+
+    assert counts[:3].tolist() == [1, 2, 0]
+    assert counts[30] == 1
+    assert counts.sum() == 4
+    assert day_counts(bitmaps, 28).tolist() == counts[:28].tolist()
+    assert day_counts(np.array([], dtype=np.uint32), 30).tolist() == [0] * 30
+
+
+def test_or_into_merges_per_employee_and_skips_unknown_ids():
+    bitmaps = np.zeros(3, dtype=np.uint64)
+    ids = np.array([10, 20, 30])
+
+    _or_into(
+        bitmaps,
+        ids,
+        np.array([20, 20, 99, 10, 5]),
+        np.array([bits(1), bits(3), bits(4), bits(2), bits(5)], dtype=np.uint64),
+    )
+
+    assert bitmaps.tolist() == [bits(2), bits(1, 3), 0]
+
+
+def test_cache_ttl_is_bounded_on_replicas(monkeypatch):
+    monkeypatch.setattr(settings, "replica_max_lag_seconds", 10.0)
+
+    primary = cast(AsyncSession, SimpleNamespace(bind=async_engine))
+    replica = cast(AsyncSession, SimpleNamespace(bind=object()))
+
+    assert cache_ttl(primary, 300) == 300
+    assert cache_ttl(replica, 300) == 10.0
+    assert cache_ttl(replica, 5) == 5
+
+
+@pytest.mark.anyio
+async def test_calendar_month(database):
+    tag = uuid.uuid4().hex[:8]
+    async with AsyncSessionLocal() as session:
+        department = Department(name=f"Calendar {tag}")
+        session.add(department)
+        await session.flush()
+        employees = [
+            Employee(
+                employee_id=f"CAL-{tag}-{i}",
+                first_name="Calendar",
+                last_name=str(i),
+                email=f"cal-{tag}-{i}@example.com",
+                joining_date=date(2020, 1, 1),
+                department_id=department.id,
+            )
+            for i in range(3)
+        ]
+        session.add_all(employees)
+        await session.flush()
+        on_leave, absent, present = [employee.id for employee in employees]
+        session.add(
+            Leave(
+                employee_id=on_leave,
+                leave_type="Annual",
+                start_date=date(2001, 2, 27),
+                end_date=date(2001, 3, 2),
+                status=LeaveStatus.APPROVED,
+            )
+        )
+        await ensure_partitions(session, [date(2001, 3, 1)])
+        session.add_all(
+            [
+                Attendance(
+                    employee_id=absent,
+                    date=date(2001, 3, 1),
+                    status=AttendanceStatus.ABSENT,
+                ),
+                Attendance(
+                    employee_id=present,
+                    date=date(2001, 3, 1),
+                    check_in=datetime(2001, 3, 1, 9, tzinfo=timezone.utc),
+                    status=AttendanceStatus.PRESENT,
+                ),
+                Attendance(
+                    employee_id=present,
+                    date=date(2001, 3, 2),
+                    check_in=datetime(2001, 3, 2, 9, tzinfo=timezone.utc),
+                    status=AttendanceStatus.PRESENT,
+                ),
+            ]
+        )
+        await session.commit()
+        ids = [employee.id for employee in employees]
+        try:
+            # Thursday the 1st and Friday the 2nd have elapsed; the 3rd is a Saturday.
+            calendar = await build_leave_calendar(
+                session, 2001, 3, department.id, today=date(2001, 3, 3)
+            )
+        finally:
+            await session.execute(delete(Leave).where(Leave.employee_id.in_(ids)))
+            await session.execute(
+                delete(Attendance).where(Attendance.employee_id.in_(ids))
+            )
+            await session.execute(delete(Employee).where(Employee.id.in_(ids)))
+            await session.execute(
+                delete(Department).where(Department.id == department.id)
+            )
+            await session.execute(text("DROP TABLE IF EXISTS attendance_p200103"))
+            await session.commit()
+
+    assert calendar["month"] == "2001-03"
+    assert calendar["days_in_month"] == 31
+    assert calendar["headcount"] == 3
+    assert calendar["days"][:3] == [
+        {"date": "2001-03-01", "on_leave": 1, "absent": 1},
+        {"date": "2001-03-02", "on_leave": 1, "absent": 1},
+        {"date": "2001-03-03", "on_leave": 0, "absent": 0},
+    ]
+    assert [
+        (row["id"], row["leave_days"], row["absent_days"])
+        for row in calendar["employees"]
+    ] == [(on_leave, bits(1, 2), 0), (absent, 0, bits(1, 2))]
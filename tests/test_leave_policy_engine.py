@@ -0,0 +1,268 @@
+"""
+Leave policy compilation and evaluation.
+
+The compiler tests need no database; simulation and the handling of stored
+policies that no longer validate run against PostgreSQL.
+"""
+
+import uuid
+from datetime import date
+from typing import cast
+
+import httpx
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from app.main import app
+from app.models import Employee, LeaveBalance, LeavePolicy, LeaveType
+from app.schemas.leave_policy import LeavePolicyDetails
+from app.services.leave_policy_engine import (
+    PolicyConfigurationError,
+    compile_policy,
+    get_compiled_policy,
+    months_served,
+    parse_probation_days,
+    simulate_policy_change,
+)
+from app.services.lookups import invalidate_lookup
+
+ANNUAL, SICK = 1, 2
+
+DETAILS = {
+    "allocations": [
+        {"leave_type_id": ANNUAL, "days_allocated": 20, "carry_forward_cap": 5},
+        {
+            "leave_type_id": SICK,
+            "days_allocated": 12,
+            "accrual_rate": 1.5,
+            "max_consecutive_days": 3,
+            "allowed_during_probation": False,
+        },
+    ],
+    "max_consecutive_days": 10,
+    "blackout_dates": [
+        {"start_date": "2025-12-20", "end_date": "2025-12-24"},
+        {"start_date": "2025-12-25", "end_date": "2025-12-31"},
+        {"start_date": "2025-06-01", "end_date": "2025-06-03"},
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "value, days",
+    [(None, 0), ("", 0), ("90 days", 90), ("6 Months", 180), ("2 weeks", 14)]
+    + [("45", 45), ("soon", 0)],
+)
+def test_parse_probation_days(value, days):
+    assert parse_probation_days(value) == days
+
+
+def test_months_served():
+    assert months_served(date(2024, 3, 15), 2025) == 12
+    assert months_served(date(2025, 3, 15), 2025) == 10
+    assert months_served(date(2026, 1, 1), 2025) == 0
+
+
+def test_compile_merges_adjacent_blackouts():
+    policy = compile_policy(DETAILS, policy_id=7)
+
+    assert policy.policy_id == 7
+    assert policy.blackout_starts == (date(2025, 6, 1), date(2025, 12, 20))
+    assert policy.blackout_ends == (date(2025, 6, 3), date(2025, 12, 31))
+    assert policy.in_blackout(date(2025, 12, 28), date(2026, 1, 2))
+    assert policy.in_blackout(date(2025, 5, 25), date(2025, 6, 1))
+    assert not policy.in_blackout(date(2025, 6, 4), date(2025, 12, 19))
+
+
+def test_compile_accepts_the_legacy_allocation_list():
+    policy = compile_policy(DETAILS["allocations"])
+
+    assert set(policy.allocations) == {ANNUAL, SICK}
+    assert policy.max_consecutive_days is None
+
+
+def test_evaluate_reports_every_violation():
+    policy = compile_policy(DETAILS)
+    joined = date(2025, 5, 1)
+
+    assert policy.evaluate(ANNUAL, date(2025, 7, 1), date(2025, 7, 10), joined) == []
+    assert policy.evaluate(SICK, date(2025, 5, 30), date(2025, 6, 4), joined, 60) == [
+        "Leave exceeds the maximum of 3 consecutive days",
+        "Leave falls within a blackout period",
+        "Leave type is not available during probation",
+    ]
+    assert policy.evaluate(ANNUAL, date(2025, 7, 1), date(2025, 7, 11), joined) == [
+        "Leave exceeds the maximum of 10 consecutive days"
+    ]
+    assert policy.evaluate(99, date(2025, 7, 1), date(2025, 7, 1), joined) == [
+        "Leave type is not covered by the employee's leave policy"
+    ]
+
+
+def test_entitlement_accrues_and_caps_carry_forward():
+    policy = compile_policy(DETAILS)
+
+    assert policy.entitlement(ANNUAL, date(2020, 1, 1), 2025, carried_over=8) == 25
+    assert policy.entitlement(ANNUAL, date(2020, 1, 1), 2025, carried_over=-3) == 20
+    assert policy.entitlement(ANNUAL, date(2026, 1, 1), 2025) == 0
+    # 1.5 days a month from October, capped at the yearly 12.
+    assert policy.entitlement(SICK, date(2025, 10, 1), 2025) == 4.5
+    assert policy.entitlement(SICK, date(2020, 1, 1), 2025) == 12
+    assert policy.entitlement(99, date(2020, 1, 1), 2025) == 0
+
+
+class OneRowSession:
+    """Stands in for an AsyncSession whose query returns a single row."""
+
+    def __init__(self, row):
+        self.row = row
+
+    async def execute(self, stmt):
+        return self
+
+    def first(self):
+        return self.row
+
+
+@pytest.mark.anyio
+async def test_stored_policy_that_no_longer_validates():
+    row = type("Row", (), {"details": {"allocations": [{"leave_type_id": "x"}]}})
+
+    with pytest.raises(PolicyConfigurationError) as raised:
+        await get_compiled_policy(cast(AsyncSession, OneRowSession(row)), 41, None)
+
+    assert raised.value.policy_id == 41
+    assert "Leave policy 41 is misconfigured" in raised.value.message
+
+
+@pytest.fixture
+async def policy_team(database):
+    """A leave type, a policy on it and two employees assigned to the policy."""
+    tag = uuid.uuid4().hex[:8]
+    async with AsyncSessionLocal() as session:
+        leave_type = LeaveType(name=f"Policy {tag}")
+        session.add(leave_type)
+        await session.flush()
+        policy = LeavePolicy(
+            policy_name=f"Policy {tag}",
+            details={
+                "allocations": [
+                    {
+                        "leave_type_id": leave_type.id,
+                        "days_allocated": 20,
+                        "carry_forward_cap": 5,
+                    }
+                ]
+            },
+        )
+        session.add(policy)
+        await session.flush()
+        employees = [
+            Employee(
+                employee_id=f"POL-{tag}-{index}",
+                first_name="Policy",
+                last_name=str(index),
+                email=f"pol-{tag}-{index}@example.com",
+                joining_date=joined,
+                leave_policy_id=policy.id,
+            )
+            for index, joined in enumerate([date(2020, 1, 1), date(2026, 2, 1)])
+        ]
+        session.add_all(employees)
+        await session.flush()
+        session.add(
+            LeaveBalance(
+                employee_id=employees[0].id,
+                leave_type_id=leave_type.id,
+                year=2025,
+                allocated=20,
+                used=12,
+            )
+        )
+        await session.commit()
+        # The leave type was written around the API; drop the cached list.
+        await invalidate_lookup("leave_types")
+        ids = [employee.id for employee in employees]
+        yield policy.id, leave_type.id, ids
+
+        employees_on_policy = Employee.employee_id.like(f"POL-{tag}-%")
+        await session.execute(
+            delete(LeaveBalance).where(LeaveBalance.employee_id.in_(ids))
+        )
+        await session.execute(delete(Employee).where(employees_on_policy))
+        await session.execute(delete(LeavePolicy).where(LeavePolicy.id == policy.id))
+        await session.execute(delete(LeaveType).where(LeaveType.id == leave_type.id))
+        await session.commit()
+
+
+@pytest.mark.anyio
+async def test_simulate_lists_only_changed_entitlements(policy_team):
+    policy_id, leave_type_id, (veteran, newcomer) = policy_team
+    proposed = LeavePolicyDetails.model_validate(
+        {
+            "allocations": [
+                {
+                    "leave_type_id": leave_type_id,
+                    "days_allocated": 24,
+                    "accrual_rate": 2,
+                    "carry_forward_cap": 5,
+                }
+            ]
+        }
+    )
+
+    async with AsyncSessionLocal() as session:
+        result = await simulate_policy_change(session, policy_id, proposed, 2026)
+    assert result is not None
+
+    assert result["employees"] == 2
+    # 8 days left over in 2025, capped at 5; the newcomer accrues from February.
+    assert result["changes"] == [
+        {
+            "employee_id": veteran,
+            "changes": [
+                {"leave_type_id": leave_type_id, "current": 25, "proposed": 29}
+            ],
+        },
+        {
+            "employee_id": newcomer,
+            "changes": [
+                {"leave_type_id": leave_type_id, "current": 20, "proposed": 22}
+            ],
+        },
+    ]
+    assert result["totals"] == [
+        {"leave_type_id": leave_type_id, "current": 45, "proposed": 51}
+    ]
+
+
+@pytest.mark.anyio
+async def test_leave_request_under_a_misconfigured_policy_is_rejected(policy_team):
+    policy_id, leave_type_id, (veteran, _) = policy_team
+    async with AsyncSessionLocal() as session:
+        policy = await session.get(LeavePolicy, policy_id)
+        assert policy is not None
+        # A document written before `days_allocated` became required.
+        policy.details = {"allocations": [{"leave_type_id": leave_type_id}]}
+        leave_type = await session.get(LeaveType, leave_type_id)
+        assert leave_type is not None
+        await session.commit()
+
+    transport = httpx.ASGITransport(app=app.router)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://localhost/api/v1"
+    ) as client:
+        response = await client.post(
+            "/leaves/apply",
+            json={
+                "employee_id": veteran,
+                "leave_type": leave_type.name,
+                "start_date": "2026-03-02",
+                "end_date": "2026-03-03",
+            },
+        )
+
+    assert response.status_code == 422, response.text
+    assert f"Leave policy {policy_id} is misconfigured" in response.json()["message"]
@@ -0,0 +1,108 @@
+"""
+CRUD endpoints of the lookup tables, driven in-process against PostgreSQL.
+
+Rows are created under a unique tag and deleted through the API.
+"""
+
+import uuid
+from datetime import date
+
+import httpx
+import pytest
+from sqlalchemy import delete
+
+from app.core.database import AsyncSessionLocal
+from app.main import app
+from app.models import Department, Employee
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(scope="module")
+async def client(database):
+    transport = httpx.ASGITransport(app=app.router)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://localhost/api/v1"
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def tag():
+    return uuid.uuid4().hex[:8]
+
+
+async def test_department_lifecycle(client, tag):
+    created = await client.post("/departments", json={"name": f"Crud {tag}"})
+    assert created.status_code == 201, created.text
+    department = created.json()["data"]
+    assert department["name"] == f"Crud {tag}"
+
+    duplicate = await client.post("/departments", json={"name": f"Crud {tag}"})
+    assert duplicate.status_code == 409
+    assert duplicate.json()["message"] == "Department already exists"
+
+    updated = await client.put(
+        f"/departments/{department['id']}", json={"name": f"Crud {tag} 2"}
+    )
+    assert updated.status_code == 200, updated.text
+    assert updated.json()["data"] == {"id": department["id"], "name": f"Crud {tag} 2"}
+
+    # Writes drop the cached snapshot the reads are served from.
+    listed = await client.get("/departments")
+    names = {row["id"]: row["name"] for row in listed.json()["data"]}
+    assert names[department["id"]] == f"Crud {tag} 2"
+    fetched = await client.get(f"/departments/{department['id']}")
+    assert fetched.json()["data"]["name"] == f"Crud {tag} 2"
+
+    deleted = await client.delete(f"/departments/{department['id']}")
+    assert deleted.status_code == 200
+    missing = await client.get(f"/departments/{department['id']}")
+    assert missing.status_code == 404
+    assert missing.json()["message"] == "Department not found"
+
+
+async def test_department_with_employees_cannot_be_deleted(client, tag):
+    created = await client.post("/departments", json={"name": f"Crud {tag}"})
+    department_id = created.json()["data"]["id"]
+    async with AsyncSessionLocal() as session:
+        session.add(
+            Employee(
+                employee_id=f"CRUD-{tag}",
+                first_name="Ada",
+                last_name="Lovelace",
+                email=f"crud-{tag}@example.com",
+                joining_date=date(2024, 1, 15),
+                department_id=department_id,
+            )
+        )
+        await session.commit()
+    try:
+        refused = await client.delete(f"/departments/{department_id}")
+        assert refused.status_code == 409
+        assert refused.json()["message"] == "Department has employees assigned"
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                delete(Employee).where(Employee.employee_id == f"CRUD-{tag}")
+            )
+            await session.execute(
+                delete(Department).where(Department.id == department_id)
+            )
+            await session.commit()
+
+
+async def test_leave_type_lifecycle(client, tag):
+    created = await client.post("/leave-types", json={"name": f"Crud {tag}"})
+    assert created.status_code == 201, created.text
+    leave_type_id = created.json()["data"]["id"]
+
+    updated = await client.put(
+        f"/leave-types/{leave_type_id}",
+        json={"name": f"Crud {tag} 2"},
+    )
+    assert updated.json()["data"] == {"id": leave_type_id, "name": f"Crud {tag} 2"}
+
+    deleted = await client.delete(f"/leave-types/{leave_type_id}")
+    assert deleted.status_code == 200
+    assert deleted.json()["data"] == {"id": leave_type_id}
@@ -0,0 +1,306 @@
+"""
+Per-request query budgets for the hot read endpoints.
+
+Drives the API routers in-process and counts the queries each request issues
+with `measure_queries()`. Every request must stay within
+`QUERY_BUDGET_PER_REQUEST`, and paginated endpoints must issue the same number
+of queries for a small and a large page, which is what an N+1 regression
+breaks.
+
+Needs the PostgreSQL database `DATABASE_URL` points at, migrated to the latest
+revision; the tests are skipped only when the server is unreachable. A small
+team is seeded under a unique tag and removed afterwards.
+"""
+
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import httpx
+import pytest
+from sqlalchemy import delete, select
+
+from app.core.database import AsyncSessionLocal, async_engine, replica_router
+from app.core.metrics import instrument_engine, measure_queries
+from app.core.settings import settings
+from app.main import app
+from app.models import (
+    Attendance,
+    Department,
+    Designation,
+    Employee,
+    Leave,
+    LeaveBalance,
+    LeaveType,
+)
+from app.models.attendance import AttendanceStatus
+from app.models.leave import LeaveStatus
+from app.services.attendance_partitions import ensure_partitions
+from app.services.dashboard import local_today
+
+TEAM_SIZE = 30
+SMALL_PAGE, LARGE_PAGE = 2, 25
+
+pytestmark = pytest.mark.anyio
+
+
+@dataclass
+class SeededTeam:
+    department_id: int
+    manager_id: int
+    employee_ids: List[int]
+    today: date
+
+
+# (path, params, headers) for one request against the seeded team.
+Request = Tuple[str, Dict[str, Any], Dict[str, str]]
+
+
+async def seed_team(tag: str, today: date) -> SeededTeam:
+    tz = ZoneInfo(settings.timezone)
+    async with AsyncSessionLocal() as session:
+        await ensure_partitions(session, [today])
+        department = Department(name=f"Query budget {tag}")
+        designation = Designation(title=f"Query budget {tag}")
+        leave_type = LeaveType(name=f"Annual {tag}")
+        session.add_all([department, designation, leave_type])
+        await session.flush()
+
+        def employee(suffix: str, manager_id: Optional[int] = None) -> Employee:
+            return Employee(
+                employee_id=f"QB-{tag}-{suffix}",
+                first_name="Quinn",
+                last_name=f"Budget {suffix}",
+                email=f"qb-{tag}-{suffix}@example.com",
+                joining_date=date(2020, 1, 1),
+                department_id=department.id,
+                designation_id=designation.id,
+                manager_id=manager_id,
+                shift_timing="9:00 AM - 6:00 PM",
+            )
+
+        manager = employee("m")
+        session.add(manager)
+        await session.flush()
+        reports = [employee(str(i), manager.id) for i in range(TEAM_SIZE)]
+        session.add_all(reports)
+        await session.flush()
+
+        for i, report in enumerate(reports):
+            session.add_all(
+                [
+                    Leave(
+                        employee_id=report.id,
+                        leave_type=leave_type.name,
+                        start_date=today + timedelta(days=7),
+                        end_date=today + timedelta(days=8),
+                        status=LeaveStatus.APPROVED,
+                    ),
+                    Leave(
+                        employee_id=report.id,
+                        leave_type=leave_type.name,
+                        start_date=today + timedelta(days=14),
+                        end_date=today + timedelta(days=15),
+                        status=LeaveStatus.PENDING,
+                    ),
+                    LeaveBalance(
+                        employee_id=report.id,
+                        leave_type_id=leave_type.id,
+                        year=today.year,
+                        allocated=20,
+                        used=2,
+                    ),
+                ]
+            )
+            if i % 2 == 0:
+                session.add(
+                    Attendance(
+                        employee_id=report.id,
+                        date=today,
+                        check_in=datetime.combine(today, time(9, i), tzinfo=tz),
+                        status=AttendanceStatus.PRESENT,
+                    )
+                )
+        await session.commit()
+        return SeededTeam(
+            department.id, manager.id, [report.id for report in reports], today
+        )
+
+
+async def remove_team(tag: str) -> None:
+    async with AsyncSessionLocal() as session:
+        employees = Employee.employee_id.like(f"QB-{tag}-%")
+        team_ids = select(Employee.id).where(employees)
+        await session.execute(
+            delete(Attendance).where(Attendance.employee_id.in_(team_ids))
+        )
+        await session.execute(
+            delete(LeaveBalance).where(LeaveBalance.employee_id.in_(team_ids))
+        )
+        await session.execute(delete(Leave).where(Leave.employee_id.in_(team_ids)))
+        await session.execute(
+            delete(Employee).where(employees, Employee.manager_id.isnot(None))
+        )
+        await session.execute(delete(Employee).where(employees))
+        await session.execute(
+            delete(LeaveType).where(LeaveType.name == f"Annual {tag}")
+        )
+        await session.execute(
+            delete(Designation).where(Designation.title == f"Query budget {tag}")
+        )
+        await session.execute(
+            delete(Department).where(Department.name == f"Query budget {tag}")
+        )
+        await session.commit()
+
+
+@pytest.fixture(scope="module")
+async def team(database):
+    tag = uuid.uuid4().hex[:8]
+    try:
+        yield await seed_team(tag, local_today())
+    finally:
+        await remove_team(tag)
+
+
+@pytest.fixture(scope="module")
+async def client(team):
+    instrument_engine(async_engine)
+    for engine in replica_router.engines:
+        instrument_engine(engine)
+    # The bare router, without the middleware stack, so every query a request
+    # issues is attributed to the test's measure_queries() block.
+    transport = httpx.ASGITransport(app=app.router)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://localhost"
+    ) as client:
+        yield client
+
+
+async def count_queries(client: httpx.AsyncClient, request: Request) -> int:
+    path, params, headers = request
+    with measure_queries() as metrics:
+        response = await client.get(path, params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return metrics.db_queries
+
+
+ENDPOINTS: Dict[str, Callable[[SeededTeam], Request]] = {
+    "employees_page": lambda t: (
+        "/api/v1/employees",
+        {"department_id": t.department_id, "resolve_names": True},
+        {},
+    ),
+    "employees_directory": lambda t: (
+        "/api/v1/employees",
+        {"department_id": t.department_id, "profile": "directory"},
+        {},
+    ),
+    "employee_profile": lambda t: (
+        f"/api/v1/employees/{t.employee_ids[0]}",
+        {"profile": "profile"},
+        {},
+    ),
+    "employee_leave_profile": lambda t: (
+        f"/api/v1/employees/{t.employee_ids[0]}",
+        {"profile": "leave"},
+        {},
+    ),
+    "employee_summaries": lambda t: (
+        "/api/v1/employees/summaries",
+        {"ids": ",".join(str(i) for i in t.employee_ids)},
+        {},
+    ),
+    "employee_search": lambda t: (
+        "/api/v1/employees/search",
+        {"q": "Quinn Budget"},
+        {},
+    ),
+    "org_subtree": lambda t: (f"/api/v1/employees/{t.manager_id}/subtree", {}, {}),
+    "management_chain": lambda t: (
+        f"/api/v1/employees/{t.employee_ids[0]}/chain",
+        {},
+        {},
+    ),
+    "headcount": lambda t: (f"/api/v1/employees/{t.manager_id}/headcount", {}, {}),
+    "departments": lambda t: ("/api/v1/departments", {}, {}),
+    "employee_leaves": lambda t: (
+        f"/api/v1/leaves/employee/{t.employee_ids[0]}",
+        {},
+        {},
+    ),
+    "pending_leaves": lambda t: ("/api/v1/leaves/pending", {}, {}),
+    "leave_balances": lambda t: (
+        "/api/v1/leaves/balance",
+        {"department_id": t.department_id},
+        {},
+    ),
+    "team_availability": lambda t: (
+        "/api/v1/leaves/team-availability",
+        {
+            "start_date": t.today.isoformat(),
+            "end_date": (t.today + timedelta(days=30)).isoformat(),
+            "manager_id": t.manager_id,
+            "include_pending": True,
+        },
+        {},
+    ),
+    "leave_calendar": lambda t: (
+        "/api/v1/leaves/calendar",
+        {"year": t.today.year, "month": t.today.month, "manager_id": t.manager_id},
+        {},
+    ),
+    "manager_dashboard": lambda t: (
+        "/api/v1/dashboard/manager",
+        {},
+        {"X-Employee-Id": str(t.manager_id), "X-Role": "manager"},
+    ),
+}
+
+# Paginated endpoints whose query count must not depend on the page size.
+PAGINATED: Dict[str, Callable[[SeededTeam], Request]] = {
+    "employees_page": ENDPOINTS["employees_page"],
+    "employees_directory": ENDPOINTS["employees_directory"],
+    "employees_leave_profile": lambda t: (
+        "/api/v1/employees",
+        {"department_id": t.department_id, "profile": "leave"},
+        {},
+    ),
+    "employees_payroll_profile": lambda t: (
+        "/api/v1/employees",
+        {"department_id": t.department_id, "profile": "payroll"},
+        {},
+    ),
+    "pending_leaves": ENDPOINTS["pending_leaves"],
+    "leave_balances": ENDPOINTS["leave_balances"],
+}
+
+
+@pytest.mark.parametrize("name", sorted(ENDPOINTS))
+async def test_endpoint_within_query_budget(
+    name: str, client: httpx.AsyncClient, team: SeededTeam
+):
+    queries = await count_queries(client, ENDPOINTS[name](team))
+    assert (
+        queries <= settings.query_budget_per_request
+    ), f"{name} issued {queries} queries, budget is {settings.query_budget_per_request}"
+
+
+@pytest.mark.parametrize("name", sorted(PAGINATED))
+async def test_query_count_independent_of_page_size(
+    name: str, client: httpx.AsyncClient, team: SeededTeam
+):
+    path, params, headers = PAGINATED[name](team)
+    # Warm the lookup caches so both pages see the same cache state.
+    await count_queries(client, (path, {**params, "limit": LARGE_PAGE}, headers))
+    small = await count_queries(
+        client, (path, {**params, "limit": SMALL_PAGE}, headers)
+    )
+    large = await count_queries(
+        client, (path, {**params, "limit": LARGE_PAGE}, headers)
+    )
+    assert (
+        small == large
+    ), f"{name}: {small} queries for {SMALL_PAGE} rows but {large} for {LARGE_PAGE}"
@@ -0,0 +1,116 @@
+"""
+Response envelopes, ETags and the streamed envelope.
+"""
+
+import json
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from pydantic import BaseModel
+from starlette.requests import Request
+
+from app.core.response import (
+    STREAM_CHUNK_SIZE,
+    cached_success,
+    error,
+    stream_success,
+    success,
+)
+
+
+class Item(BaseModel):
+    id: int
+    joined: date
+
+
+def make_request(if_none_match=None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+async def body_of(response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+def test_success_serializes_without_jsonable_encoder():
+    response = success(
+        data={
+            "whole": Decimal("12"),
+            "fraction": Decimal("1.5"),
+            "day": date(2026, 3, 2),
+            "item": Item(id=1, joined=date(2020, 1, 1)),
+            "mapping": {"a": 1},
+        },
+        message="Done",
+        status_code=201,
+    )
+
+    assert response.status_code == 201
+    assert json.loads(bytes(response.body)) == {
+        "status": "success",
+        "message": "Done",
+        "data": {
+            "whole": 12,
+            "fraction": 1.5,
+            "day": "2026-03-02",
+            "item": {"id": 1, "joined": "2020-01-01"},
+            "mapping": {"a": 1},
+        },
+    }
+
+
+def test_error_envelope():
+    response = error("Employee not found", status_code=404)
+
+    assert response.status_code == 404
+    assert json.loads(bytes(response.body)) == {
+        "status": "error",
+        "message": "Employee not found",
+        "data": None,
+    }
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    ['"abc"', 'W/"abc"', '"old", "abc"', '"old", W/"abc"'],
+)
+def test_cached_success_is_not_modified_for_a_current_etag(if_none_match):
+    response = cached_success(make_request(if_none_match), [1, 2], '"abc"')
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == '"abc"'
+
+
+@pytest.mark.parametrize("if_none_match", [None, '"old"', '"abcd"'])
+def test_cached_success_sends_the_body_with_its_etag(if_none_match):
+    response = cached_success(make_request(if_none_match), [1, 2], '"abc"')
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"abc"'
+    assert json.loads(bytes(response.body))["data"] == [1, 2]
+
+
+async def aiterate(items):
+    for item in items:
+        yield item
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("count", [0, 1, STREAM_CHUNK_SIZE, STREAM_CHUNK_SIZE * 2 + 1])
+@pytest.mark.parametrize("asynchronous", [False, True])
+async def test_stream_success_matches_success(count, asynchronous):
+    items = [
+        {"id": index, "salary": Decimal("10.50"), "joined": date(2020, 1, 1)}
+        for index in range(count)
+    ]
+
+    streamed = stream_success(aiterate(items) if asynchronous else iter(items))
+
+    assert streamed.media_type == "application/json"
+    assert json.loads(await body_of(streamed)) == json.loads(
+        bytes(success(data=items).body)
+    )